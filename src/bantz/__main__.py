@@ -7,6 +7,8 @@ Commands:
   bantz --once "query"          → single query, no UI
   bantz --daemon                → headless daemon (scheduler + GPS, no TUI)
   bantz --doctor                → system health check
+  bantz --doctor --no-cache     → health check, re-importing every tool module
+  bantz --version               → print the installed version
   bantz --setup onboarding         → first-run personalization wizard
   bantz --setup profile         → user profile setup
   bantz --setup google gmail    → OAuth setup for Gmail
@@ -21,17 +23,62 @@ Commands:
 from __future__ import annotations
 
 import argparse
-import asyncio
+import sys
 
-from bantz.cli.setup import _handle_setup, _doctor, _show_config, _cache_stats
 
+# ── bantz.cli.setup commands ─────────────────────────────────────────────
+# The wizards/diagnostics module is large; resolve it only once one of its
+# commands is actually dispatched so the plain TUI launch never parses it.
 
-def main() -> None:
+def _handle_setup(parts: list[str]) -> None:
+    from bantz.cli.setup import _handle_setup
+    _handle_setup(parts)
+
+
+def _doctor(use_cache: bool = True):
+    from bantz.cli.setup import _doctor
+    return _doctor(use_cache=use_cache)
+
+
+def _show_config() -> None:
+    from bantz.cli.setup import _show_config
+    _show_config()
+
+
+def _cache_stats() -> None:
+    from bantz.cli.setup import _cache_stats
+    _cache_stats()
+
+
+def _version() -> str:
+    from importlib.metadata import PackageNotFoundError, version
+    try:
+        return version("bantz")
+    except PackageNotFoundError:  # running from a source checkout
+        return "unknown"
+
+
+class _VersionAction(argparse.Action):
+    """Like argparse's "version" action, but only looks the version up when used."""
+
+    def __init__(self, option_strings, dest, **kwargs) -> None:
+        super().__init__(option_strings, dest, nargs=0,
+                         help="Show the installed version and exit")
+
+    def __call__(self, parser, namespace, values, option_string=None) -> None:
+        print(f"bantz {_version()}")
+        parser.exit()
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="bantz", description="Bantz v2 — your terminal host")
+    parser.add_argument("--version", action=_VersionAction)
     parser.add_argument("--once", metavar="QUERY", help="Run single query, no UI")
     parser.add_argument("--daemon", action="store_true",
                         help="Run as headless daemon (scheduler + GPS, no TUI)")
     parser.add_argument("--doctor", action="store_true", help="System health check")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-import tool modules instead of using the --doctor cache")
     parser.add_argument("--cache-stats", action="store_true",
                         help="Show spatial cache statistics")
     parser.add_argument("--setup", nargs="+", metavar="SERVICE",
@@ -58,10 +105,45 @@ def main() -> None:
                         help="Launch the Bantz desktop UI (Tauri)")
     parser.add_argument("--telegram", action="store_true",
                         help="Run the Telegram bot (brain-routed, polling)")
-    args = parser.parse_args()
+    return parser
+
+
+def _run(coro) -> None:
+    """Run *coro* to completion — asyncio is only imported on async paths.
+
+    Uses uvloop/winloop when installed (see bantz.core.event_loop).
+    """
+    from bantz.core.event_loop import run
+    run(coro)
+
+
+def main() -> None:
+    # Fast path: the bare TUI launch, `--version`, `--doctor`, `--once "query"`
+    # and `--setup <target> ...` are dispatched straight from sys.argv without
+    # building the parser.
+    # Anything else (including --help) goes through argparse.
+    argv = sys.argv[1:]
+    if not argv:
+        from bantz.interface import run
+        run()
+        return
+    if argv == ["--version"]:
+        print(f"bantz {_version()}")
+        return
+    if argv == ["--doctor"]:
+        _run(_doctor())
+        return
+    if len(argv) == 2 and argv[0] == "--once" and not argv[1].startswith("-"):
+        _run(_once(argv[1]))
+        return
+    if len(argv) >= 2 and argv[0] == "--setup" and not any(a.startswith("-") for a in argv[1:]):
+        _handle_setup(argv[1:])
+        return
+
+    args = _build_parser().parse_args(argv)
 
     if args.doctor:
-        asyncio.run(_doctor())
+        _run(_doctor(use_cache=not args.no_cache))
         return
 
     if args.cache_stats:
@@ -73,19 +155,19 @@ def main() -> None:
         return
 
     if args.jobs:
-        asyncio.run(_list_jobs())
+        _run(_list_jobs())
         return
 
     if args.run_job:
-        asyncio.run(_run_job(args.run_job))
+        _run(_run_job(args.run_job))
         return
 
     if args.maintenance:
-        asyncio.run(_maintenance(args.dry_run))
+        _run(_maintenance(args.dry_run))
         return
 
     if args.reflect:
-        asyncio.run(_reflect(args.dry_run))
+        _run(_reflect(args.dry_run))
         return
 
     if args.reflections:
@@ -93,7 +175,7 @@ def main() -> None:
         return
 
     if args.overnight_poll:
-        asyncio.run(_overnight_poll(args.dry_run))
+        _run(_overnight_poll(args.dry_run))
         return
 
     if args.mood_history:
@@ -105,7 +187,7 @@ def main() -> None:
         return
 
     if args.once:
-        asyncio.run(_once(args.once))
+        _run(_once(args.once))
         return
 
     if args.ui:
@@ -113,7 +195,7 @@ def main() -> None:
         return
 
     if args.daemon:
-        asyncio.run(_daemon())
+        _run(_daemon())
         return
 
     if args.telegram:
@@ -121,7 +203,7 @@ def main() -> None:
         run_bot()
         return
 
-    from bantz.interface.live_ui import run
+    from bantz.interface import run
     run()
 
 
@@ -233,6 +315,7 @@ async def _run_job(job_id: str) -> None:
     if ok:
         print(f"✓ Triggered job: {job_id}")
         # Give async jobs a moment to run
+        import asyncio
         await asyncio.sleep(3)
     else:
         print(f"✗ Job not found: {job_id}")
@@ -376,8 +459,12 @@ async def _once(query: str) -> None:
 
     # Draft confirmation flow — auto-send for --once
     if result.needs_confirm and result.pending_tool and result.pending_args:
-        answer = input().strip().lower()
-        if answer in ("evet", "e", "yes", "y", "ok", "tamam"):
+        # readline() on a worker: input() would block the loop, and it raises
+        # EOFError when stdin is closed — readline() just returns "" (cancel).
+        import asyncio
+        answer = (await asyncio.to_thread(sys.stdin.readline)).strip().lower()
+        from bantz.core.types import CONFIRM_WORDS
+        if answer in CONFIRM_WORDS:
             from bantz.tools import registry as _reg
             tool = _reg.get(result.pending_tool)
             if tool:
@@ -400,6 +487,7 @@ async def _daemon() -> None:
     Key features: misfire_grace_time=86400, coalesce=True,
     systemd-inhibit for night jobs, persistent SQLAlchemy job store.
     """
+    import asyncio
     import signal
     import logging
 
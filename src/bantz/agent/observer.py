@@ -95,6 +95,10 @@ class ErrorClassifier:
         self._model = analysis_model
         self._enable_llm = enable_llm
 
+    @property
+    def llm_enabled(self) -> bool:
+        return self._enable_llm
+
     def classify(self, text: str) -> Optional[ErrorEvent]:
         if not text or not text.strip():
             return None
@@ -238,6 +242,7 @@ class Observer:
                        "by_severity": {s.value: 0 for s in Severity},
                        "deduplicated": 0}
         self._stats_lock = threading.Lock()
+        self._tasks: set[asyncio.Task] = set()  # in-flight LLM analyses
 
     # ── Lifecycle ─────────────────────────────────────────────────────
 
@@ -315,17 +320,35 @@ class Observer:
             with self._stats_lock:
                 self._stats["deduplicated"] += 1
             return
-        # LLM analysis for critical errors (async, best-effort)
-        if event.severity == Severity.CRITICAL:
+        # LLM analysis for critical errors (async, best-effort).  EventBus
+        # delivers stderr_line on the running loop: analyse there as a task
+        # and deliver once it finishes, instead of blocking the loop on a
+        # nested one.  Plain sync callers (feed/stop without a loop) run it
+        # to completion inline.
+        if event.severity == Severity.CRITICAL and self.classifier.llm_enabled:
             try:
-                loop = asyncio.new_event_loop()
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
                 try:
-                    event.analysis = loop.run_until_complete(
-                        self.classifier.analyze(event))
-                finally:
-                    loop.close()
-            except Exception as exc:
-                log.debug("LLM analysis failed: %s", exc)
+                    event.analysis = asyncio.run(self.classifier.analyze(event))
+                except Exception as exc:
+                    log.debug("LLM analysis failed: %s", exc)
+            else:
+                task = loop.create_task(self._analyze_and_deliver(event))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+                return
+        self._deliver(event)
+
+    async def _analyze_and_deliver(self, event: ErrorEvent) -> None:
+        try:
+            event.analysis = await self.classifier.analyze(event)
+        except Exception as exc:
+            log.debug("LLM analysis failed: %s", exc)
+        self._deliver(event)
+
+    def _deliver(self, event: ErrorEvent) -> None:
+        """Record stats, emit on the EventBus and run the callback."""
         # Record stats
         with self._stats_lock:
             self._stats["total_events"] += 1
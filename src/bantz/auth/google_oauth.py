@@ -69,23 +69,23 @@ def setup_google(service: str) -> bool:
             return _orig_make(*a, **kw)
 
         wsgiref.simple_server.make_server = _make_reuse
-
-        flow = InstalledAppFlow.from_client_secrets_file(
-            str(creds_path),
-            scopes=scopes,
-        )
-
-        # Run local server flow — opens browser automatically
-        print(f"   Opening browser... (listening on localhost:{REDIRECT_PORT})")
-        creds = flow.run_local_server(
-            port=REDIRECT_PORT,
-            prompt="consent",          # always show consent to allow account switching
-            access_type="offline",     # get refresh_token
-            open_browser=True,
-        )
-
-        # Restore original
-        wsgiref.simple_server.make_server = _orig_make
+        try:
+            flow = InstalledAppFlow.from_client_secrets_file(
+                str(creds_path),
+                scopes=scopes,
+            )
+
+            # Run local server flow — opens browser automatically
+            print(f"   Opening browser... (listening on localhost:{REDIRECT_PORT})")
+            creds = flow.run_local_server(
+                port=REDIRECT_PORT,
+                prompt="consent",          # always show consent to allow account switching
+                access_type="offline",     # get refresh_token
+                open_browser=True,
+            )
+        finally:
+            # Restore original even when the flow fails or is interrupted
+            wsgiref.simple_server.make_server = _orig_make
 
         token_store.save(service, creds)
         print(f"\n✅ {service.title()} connected successfully!")
@@ -94,7 +94,7 @@ def setup_google(service: str) -> bool:
 
     except Exception as exc:
         print(f"\n❌ OAuth failed: {exc}")
-        logger.exception(f"OAuth flow failed for {service}")
+        logger.exception("OAuth flow failed for %s", service)
         return False
 
 
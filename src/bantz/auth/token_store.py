@@ -14,8 +14,10 @@ Usage:
 """
 from __future__ import annotations
 
+import json
 import logging
 import os
+import time
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -51,6 +53,8 @@ SERVICE_SCOPES: dict[str, list[str]] = {
 
 
 class TokenStore:
+    STATUS_TTL: float = 30.0  # seconds a status() result is reused
+
     def __init__(self) -> None:
         self._dir = Path.home() / ".local" / "share" / "bantz" / "tokens"
         # Enforce strict 0o700 permissions to prevent unauthorized access
@@ -58,6 +62,11 @@ class TokenStore:
         self._dir.mkdir(mode=0o700, parents=True, exist_ok=True)
         # chmod(0o700) ensures existing directories have their permissions corrected.
         self._dir.chmod(0o700)
+        # service → (token file mtime_ns, parsed token JSON); re-read only
+        # when the file changes on disk
+        self._creds: dict[str, tuple[int, dict]] = {}
+        # (monotonic time, token file mtimes, result) of the last status()
+        self._status: tuple[float, tuple, dict[str, str]] | None = None
 
     def token_path(self, service: str) -> Path:
         # Resolve alias (calendar → gmail)
@@ -73,26 +82,38 @@ class TokenStore:
         Return valid Credentials for service.
         Auto-refreshes if expired.
         Raises TokenNotFoundError if token missing.
+
+        Each call returns a new Credentials object (built from the cached
+        token JSON), so one caller's in-place refresh never races another.
         """
         from google.oauth2.credentials import Credentials
         from google.auth.transport.requests import Request
 
         path = self.token_path(service)
 
-        if not path.exists():
+        try:
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._creds.pop(service, None)
             raise TokenNotFoundError(
                 f"No token found for '{service}'.\n"
                 f"Run: bantz --setup google {service}"
             )
 
-        creds = Credentials.from_authorized_user_file(str(path))
+        cached = self._creds.get(service)
+        if cached is not None and cached[0] == mtime:
+            info = cached[1]
+        else:
+            info = json.loads(path.read_text(encoding="utf-8"))
+            self._creds[service] = (mtime, info)
+        creds = Credentials.from_authorized_user_info(info)
 
         # Auto-refresh if expired
         if creds.expired and creds.refresh_token:
             try:
                 creds.refresh(Request())
                 self._save(service, creds)
-                logger.info(f"Token refreshed for {service}")
+                logger.info("Token refreshed for %s", service)
             except Exception as exc:
                 raise TokenNotFoundError(
                     f"Token for '{service}' expired and refresh failed: {exc}\n"
@@ -120,10 +141,12 @@ class TokenStore:
         fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
         if hasattr(os, "fchmod"):  # unavailable on Windows
             os.fchmod(fd, 0o600)
+        data = creds.to_json()
         with os.fdopen(fd, "w", encoding="utf-8") as f:
-            f.write(creds.to_json())
+            f.write(data)
+        self._creds[service] = (path.stat().st_mtime_ns, json.loads(data))
 
-        logger.info(f"Token saved: {path}")
+        logger.info("Token saved: %s", path)
 
     def is_configured(self, service: str) -> bool:
         return self.token_path(service).exists()
@@ -132,11 +155,22 @@ class TokenStore:
         return self.credentials_path().exists()
 
     def status(self) -> dict[str, str]:
-        """Return setup status for all services."""
+        """Return setup status for all services.
+
+        Validating a token may refresh it over the network, and the
+        briefing asks once per service, so a result is reused for
+        STATUS_TTL seconds unless a token file appears, changes or goes.
+        """
+        services = ("gmail", "classroom", "calendar")
+        mtimes = tuple(self._mtime(svc) for svc in services)
+        now = time.monotonic()
+        if self._status is not None:
+            ts, seen, cached = self._status
+            if seen == mtimes and now - ts < self.STATUS_TTL:
+                return dict(cached)
         result = {}
-        for svc in ("gmail", "classroom", "calendar"):
-            path = self.token_path(svc)
-            if not path.exists():
+        for svc, mtime in zip(services, mtimes):
+            if mtime is None:
                 result[svc] = "not configured"
             else:
                 try:
@@ -146,7 +180,15 @@ class TokenStore:
                     result[svc] = f"expired ({e})"
                 except Exception:
                     result[svc] = "invalid token"
-        return result
+        # a refresh inside get() rewrites the file; key on what is there now
+        self._status = (now, tuple(self._mtime(svc) for svc in services), result)
+        return dict(result)
+
+    def _mtime(self, service: str) -> int | None:
+        try:
+            return self.token_path(service).stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
 
 
 token_store = TokenStore()
\ No newline at end of file
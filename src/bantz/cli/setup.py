@@ -6,62 +6,77 @@ live here so __main__.py stays focused on running Bantz.
 """
 from __future__ import annotations
 
-import asyncio
+import re
+from typing import Callable, Sequence
 
+# Section rules shared by the wizards (_RULE) and the wide reports (_WIDE_RULE)
+_RULE = "─" * 40
+_WIDE_RULE = "─" * 52
 
-def _handle_setup(parts: list[str]) -> None:
-    if len(parts) >= 1 and parts[0].lower() == "onboarding":
-        _setup_onboarding()
-        return
-    if len(parts) >= 1 and parts[0].lower() == "profile":
-        _setup_profile()
-        return
-    if len(parts) >= 1 and parts[0].lower() == "schedule":
-        _setup_schedule()
-        return
-    if len(parts) >= 1 and parts[0].lower() == "telegram":
-        _setup_telegram()
-        return
-    if len(parts) >= 1 and parts[0].lower() == "places":
-        asyncio.run(_setup_places())
-        return
-    if len(parts) >= 1 and parts[0].lower() == "gemini":
-        _setup_gemini()
-        return
-    if len(parts) >= 1 and parts[0].lower() == "claude":
-        _setup_claude()
-        return
-    if len(parts) >= 1 and parts[0].lower() == "openai":
-        _setup_openai()
-        return
-    if len(parts) >= 1 and parts[0].lower() == "voice":
-        _setup_voice()
+
+def _setup_places_cmd(parts: list[str]) -> None:
+    from bantz.core.event_loop import run
+    run(_setup_places())
+
+
+def _setup_systemd_cmd(parts: list[str]) -> None:
+    if len(parts) >= 2 and parts[1].lower() == "--check":
+        _systemd_check()
+    else:
+        _setup_systemd()
+
+
+def _setup_google_cmd(parts: list[str]) -> None:
+    if len(parts) < 2:
+        _print_setup_help(parts)
         return
-    if len(parts) >= 1 and parts[0].lower() == "systemd":
-        if len(parts) >= 2 and parts[1].lower() == "--check":
-            _systemd_check()
-        else:
-            _setup_systemd()
+    from bantz.auth.google_oauth import setup_google
+    setup_google(parts[1].lower())
+
+
+# `bantz --setup <target> ...` → handler(parts).  Lambdas resolve the wizard
+# by name at call time, so tests can patch e.g. bantz.cli.setup._setup_voice.
+_SETUP_DISPATCH: dict[str, Callable[[list[str]], None]] = {
+    "onboarding": lambda parts: _setup_onboarding(),
+    "profile":    lambda parts: _setup_profile(),
+    "google":     lambda parts: _setup_google_cmd(parts),
+    "schedule":   lambda parts: _setup_schedule(),
+    "telegram":   lambda parts: _setup_telegram(),
+    "places":     lambda parts: _setup_places_cmd(parts),
+    "claude":     lambda parts: _setup_claude(),
+    "openai":     lambda parts: _setup_openai(),
+    "gemini":     lambda parts: _setup_gemini(),
+    "voice":      lambda parts: _setup_voice(),
+    "systemd":    lambda parts: _setup_systemd_cmd(parts),
+}
+
+# Help lines for targets that take arguments or deserve a note; every other
+# target in _SETUP_DISPATCH is listed by name alone.
+_SETUP_USAGE: dict[str, tuple[str, ...]] = {
+    "google":  ("google [gmail|classroom|calendar]",),
+    "claude":  ("claude        ← Anthropic Claude API",),
+    "openai":  ("openai        ← OpenAI / compatible API",),
+    "gemini":  ("gemini        ← Google Gemini API",),
+    "systemd": ("systemd", "systemd --check"),
+}
+
+
+def _handle_setup(parts: list[str]) -> None:
+    handler = _SETUP_DISPATCH.get(parts[0].lower()) if parts else None
+    if handler is None:
+        _print_setup_help(parts)
         return
-    if len(parts) >= 2 and parts[0].lower() == "google":
-        service = parts[1].lower()
-        from bantz.auth.google_oauth import setup_google
-        setup_google(service)
-    else:
-        print(f"Unknown setup target: {' '.join(parts)}")
-        print("Available:")
-        print("  bantz --setup onboarding")
-        print("  bantz --setup profile")
-        print("  bantz --setup google [gmail|classroom|calendar]")
-        print("  bantz --setup schedule")
-        print("  bantz --setup telegram")
-        print("  bantz --setup places")
-        print("  bantz --setup claude        ← Anthropic Claude API")
-        print("  bantz --setup openai        ← OpenAI / compatible API")
-        print("  bantz --setup gemini        ← Google Gemini API")
-        print("  bantz --setup voice")
-        print("  bantz --setup systemd")
-        print("  bantz --setup systemd --check")
+    handler(parts)
+
+
+def _print_setup_help(parts: list[str]) -> None:
+    lines = [f"Unknown setup target: {' '.join(parts)}", "Available:"]
+    lines.extend(
+        f"  bantz --setup {usage}"
+        for target in _SETUP_DISPATCH
+        for usage in _SETUP_USAGE.get(target, (target,))
+    )
+    print("\n".join(lines))
 
 
 def _setup_onboarding() -> None:
@@ -70,7 +85,7 @@ def _setup_onboarding() -> None:
     from bantz.config import config
 
     print("\n🧠 Bantz — First-Run Onboarding")
-    print("─" * 40)
+    print(_RULE)
 
     config.ensure_dirs()
 
@@ -111,17 +126,45 @@ def _setup_onboarding() -> None:
     print("\n✅ Onboarding complete. Bantz now knows who you are.")
 
 
+# ── Piped (non-TTY) answers ─────────────────────────────────────────────────
+# `bantz --setup profile < answers.txt` reads every ``key=value`` line in one
+# go instead of one input() per prompt; on a TTY the wizards stay interactive.
+
+def _piped_answers() -> dict[str, str] | None:
+    """Parse ``key=value`` lines from piped stdin; None when stdin is a TTY."""
+    import sys
+    if sys.stdin.isatty():
+        return None
+    answers: dict[str, str] = {}
+    for line in sys.stdin.read().splitlines():
+        key, sep, value = line.partition("=")
+        if sep and not key.lstrip().startswith("#"):
+            answers[key.strip().lower()] = value.strip()
+    return answers
+
+
+def _asker(answers: dict[str, str] | None) -> Callable[[str, str], str]:
+    """Return ``ask(key, prompt)`` — a piped answer, or input() on a TTY."""
+    if answers is None:
+        return lambda key, prompt: input(prompt).strip()
+    return lambda key, prompt: answers.get(key, "")
+
+
 def _setup_telegram() -> None:
-    """Interactive Telegram bot token setup."""
+    """Interactive Telegram bot token setup.
+
+    Piped stdin is read as ``key=value`` answers: token, allowed_users, proxy.
+    """
     from pathlib import Path
 
     print("\n🦌 Telegram Bot Setup")
-    print("─" * 40)
+    print(_RULE)
     print("1. Go to @BotFather → /newbot → get token")
     print("2. Paste the token below:")
     print()
 
-    token = input("Bot token: ").strip()
+    ask = _asker(_piped_answers())
+    token = ask("token", "Bot token: ")
     if not token:
         print("Token required. Cancelled.")
         return
@@ -130,38 +173,23 @@ def _setup_telegram() -> None:
     print()
     print("(Security) Restrict to specific users?")
     print("Enter Telegram user IDs, comma-separated (blank=everyone):")
-    allowed = input("User IDs: ").strip()
+    allowed = ask("allowed_users", "User IDs: ")
 
     # Proxy (Turkey blocks api.telegram.org)
     print()
     print("(Proxy) You may need an HTTPS proxy in some regions.")
     print("Example: socks5://127.0.0.1:1080 or http://proxy:8080")
-    proxy = input("Proxy URL (blank=skip): ").strip()
+    proxy = ask("proxy", "Proxy URL (blank=skip): ")
 
     # Write to .env
-    env_path = Path.cwd() / ".env"
-    existing = ""
-    if env_path.exists():
-        existing = env_path.read_text(encoding="utf-8")
-
-    lines = existing.splitlines()
-    # Remove old telegram entries
-    lines = [line for line in lines if not line.startswith("TELEGRAM_BOT_TOKEN=")
-             and not line.startswith("TELEGRAM_ALLOWED_USERS=")
-             and not line.startswith("TELEGRAM_PROXY=")]
-
-    lines.append(f"TELEGRAM_BOT_TOKEN={token}")
-    if allowed:
-        lines.append(f"TELEGRAM_ALLOWED_USERS={allowed}")
-    if proxy:
-        lines.append(f"TELEGRAM_PROXY={proxy}")
-
-    import os
-    fd = os.open(str(env_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
-    if hasattr(os, "fchmod"):  # unavailable on Windows
-        os.fchmod(fd, 0o600)
-    with os.fdopen(fd, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines) + "\n")
+    with _EnvFile(Path.cwd() / ".env") as env:
+        env.drop("TELEGRAM_ALLOWED_USERS", "TELEGRAM_PROXY")
+        env.set("TELEGRAM_BOT_TOKEN", token)
+        if allowed:
+            env.set("TELEGRAM_ALLOWED_USERS", allowed)
+        if proxy:
+            env.set("TELEGRAM_PROXY", proxy)
+    env_path = env.path
     print(f"\n✅ Token saved: {env_path}")
     print("Start with: python -m bantz.interface.telegram_bot")
 
@@ -173,29 +201,95 @@ def _env_path():
     return data_env if data_env.exists() else Path.cwd() / ".env"
 
 
-def _write_env(updates: dict[str, str], *, prefix_strip: list[str] | None = None) -> None:
+class _EnvFile:
+    """Read-modify-write a .env file with one read and one write.
+
+    Comments, blank lines and untouched keys keep their place.  ``set()``
+    replaces a key in place (appending it if new), ``drop()`` removes it.
+    The file is replaced atomically (0600) when the block exits cleanly —
+    or, when every key set is new, just appended to.
+    """
+
+    def __init__(self, path=None) -> None:
+        self.path = path if path is not None else _env_path()
+        self._updates: dict[str, str] = {}
+        self._drop: set[str] = set()
+        self._lines: list[str] = []
+        self._text = ""
+
+    def __enter__(self) -> "_EnvFile":
+        if self.path.exists():
+            self._text = self.path.read_text(encoding="utf-8")
+            self._lines = self._text.splitlines()
+        return self
+
+    def set(self, key: str, value: str) -> None:
+        self._updates[key] = value
+        self._drop.discard(key)
+
+    def drop(self, *keys: str) -> None:
+        self._drop.update(keys)
+        for key in keys:
+            self._updates.pop(key, None)
+
+    def render(self) -> str:
+        out: list[str] = []
+        written: set[str] = set()
+        # One split + hash lookup per line, whatever the number of keys touched
+        for line in self._lines:
+            key, sep, _ = line.partition("=")
+            if not sep or key.startswith("#"):
+                out.append(line)
+                continue
+            if key in self._drop or key in written:
+                continue
+            if key in self._updates:
+                out.append(f"{key}={self._updates[key]}")
+                written.add(key)
+            else:
+                out.append(line)
+        out.extend(f"{k}={v}" for k, v in self._updates.items() if k not in written)
+        return "\n".join(out) + "\n"
+
+    def _touches_existing(self) -> bool:
+        touched = self._drop | self._updates.keys()
+        return any(line.partition("=")[0] in touched for line in self._lines)
+
+    def _append(self) -> None:
+        import os
+        lead = "\n" if not self._text.endswith("\n") else ""
+        block = lead + "".join(f"{k}={v}\n" for k, v in self._updates.items())
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND)
+        if hasattr(os, "fchmod"):  # unavailable on Windows
+            os.fchmod(fd, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(block)
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            return
+        if self._text and not self._touches_existing():
+            # Only new keys: append them instead of rewriting the whole file
+            if self._updates:
+                self._append()
+            return
+        from bantz.core.secure_io import secure_write_text
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        secure_write_text(self.path, self.render())
+
+
+def _write_env(updates: dict[str, str]) -> None:
     """Write key=value pairs into the .env file, replacing existing entries."""
-    import os
-    env_path = _env_path()
-    lines = env_path.read_text(encoding="utf-8").splitlines() if env_path.exists() else []
-    for pfx in (prefix_strip or []):
-        lines = [line for line in lines if not line.startswith(pfx)]
-    for k, v in updates.items():
-        lines = [line for line in lines if not line.startswith(f"{k}=")]
-        lines.append(f"{k}={v}")
-    env_path.parent.mkdir(parents=True, exist_ok=True)
-    fd = os.open(str(env_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
-    if hasattr(os, "fchmod"):  # unavailable on Windows
-        os.fchmod(fd, 0o600)
-    with os.fdopen(fd, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines) + "\n")
-    print(f"\n   Saved to: {env_path}")
+    with _EnvFile() as env:
+        for k, v in updates.items():
+            env.set(k, v)
+    print(f"\n   Saved to: {env.path}")
 
 
 def _setup_claude() -> None:
     """Interactive Claude (Anthropic) API key setup."""
     print("\nBantz — Claude Setup")
-    print("─" * 40)
+    print(_RULE)
     print("1. Go to https://console.anthropic.com/settings/keys")
     print("2. Create an API key")
     print("3. Paste it below (input is hidden):\n")
@@ -230,7 +324,7 @@ def _setup_claude() -> None:
 def _setup_openai() -> None:
     """Interactive OpenAI API key setup."""
     print("\nBantz — OpenAI Setup")
-    print("─" * 40)
+    print(_RULE)
     print("1. Go to https://platform.openai.com/api-keys")
     print("2. Create an API key")
     print("3. Paste it below (input is hidden):\n")
@@ -270,7 +364,7 @@ def _setup_openai() -> None:
 def _setup_gemini() -> None:
     """Interactive Gemini API key setup."""
     print("\nBantz — Gemini Setup")
-    print("─" * 40)
+    print(_RULE)
     print("1. Go to https://aistudio.google.com/apikey")
     print("2. Create an API key")
     print("3. Paste it below:\n")
@@ -312,6 +406,7 @@ _VOICE_ENV_PREFIXES: tuple[str, ...] = (
     "BANTZ_WAKE_WORD_ENABLED=",
     "BANTZ_PICOVOICE_ACCESS_KEY=",
 )
+_VOICE_ENV_KEYS = frozenset(p.rstrip("=") for p in _VOICE_ENV_PREFIXES)
 
 
 def _setup_voice() -> None:
@@ -327,13 +422,12 @@ def _setup_voice() -> None:
        ``.env``.
     5. Runs a mic test, STT availability check, and TTS binary check.
     """
-    import os
     import subprocess
     import sys
     from pathlib import Path
 
     print("\n🎤 Bantz — Voice Setup Wizard")
-    print("─" * 40)
+    print(_RULE)
     print("Sets up voice input (STT / wake-word) and TTS output.")
     print()
 
@@ -381,36 +475,22 @@ def _setup_voice() -> None:
 
     # ── Step 4: write .env ───────────────────────────────────────────────
     print("Step 4/4 — Saving settings to .env…")
-    env_path = Path.cwd() / ".env"
-    if env_path.exists():
-        lines = env_path.read_text(encoding="utf-8").splitlines()
-    else:
-        lines = []
-
     # Strip any existing voice entries so we write a clean set
-    lines = [
-        line for line in lines
-        if not any(line.startswith(p) for p in _VOICE_ENV_PREFIXES)
-    ]
-
-    lines.append("BANTZ_VOICE_ENABLED=true")
-    lines.append("BANTZ_TTS_ENABLED=true")
-    lines.append("BANTZ_STT_ENABLED=true")
-    lines.append("BANTZ_GHOST_LOOP_ENABLED=true")
-    if picovoice_key:
-        lines.append(f"BANTZ_PICOVOICE_ACCESS_KEY={picovoice_key}")
-        lines.append("BANTZ_WAKE_WORD_ENABLED=true")
-
-    fd = os.open(str(env_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
-    if hasattr(os, "fchmod"):  # unavailable on Windows
-        os.fchmod(fd, 0o600)
-    with os.fdopen(fd, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines) + "\n")
+    with _EnvFile(Path.cwd() / ".env") as env:
+        env.drop(*_VOICE_ENV_KEYS)
+        env.set("BANTZ_VOICE_ENABLED", "true")
+        env.set("BANTZ_TTS_ENABLED", "true")
+        env.set("BANTZ_STT_ENABLED", "true")
+        env.set("BANTZ_GHOST_LOOP_ENABLED", "true")
+        if picovoice_key:
+            env.set("BANTZ_PICOVOICE_ACCESS_KEY", picovoice_key)
+            env.set("BANTZ_WAKE_WORD_ENABLED", "true")
+    env_path = env.path
     print(f"  ✅ Saved: {env_path}")
     print()
 
     # ── Step 5: component tests ──────────────────────────────────────────
-    print("─" * 40)
+    print(_RULE)
     print("Running voice component tests…")
     print()
     mic_ok = _voice_test_mic()
@@ -496,29 +576,126 @@ def _voice_test_tts() -> bool:
     return False
 
 
+# ── Nominatim geocoding (used by _setup_places) ────────────────────────────
+# OSM's usage policy allows at most one request per second; answers are
+# cached on disk so re-running the wizard (or retyping a query) stays offline.
+# One keep-alive HTTPS connection is reused across the lookups of a session.
+
+_NOMINATIM_HOST = "nominatim.openstreetmap.org"
+_NOMINATIM_MIN_INTERVAL = 1.0
+_NOMINATIM_RETRY_STATUS = frozenset({429, 503})
+_nominatim_cache: dict[str, list[dict]] | None = None
+_nominatim_last_call = 0.0
+_nominatim_conn = None
+
+
+def _nominatim_cache_path():
+    from pathlib import Path
+    return Path.home() / ".bantz" / "cache" / "nominatim.json"
+
+
+def _normalise_place_query(query: str) -> str:
+    """Cache key: accent-stripped, lowercased, whitespace-collapsed."""
+    import unicodedata
+    decomposed = unicodedata.normalize("NFKD", query)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.lower().split())
+
+
+def _load_nominatim_cache() -> dict[str, list[dict]]:
+    global _nominatim_cache
+    if _nominatim_cache is None:
+        from bantz.core import fastjson
+        try:
+            _nominatim_cache = fastjson.loads(
+                _nominatim_cache_path().read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            _nominatim_cache = {}
+    return _nominatim_cache
+
+
+def _save_nominatim_cache(cache: dict[str, list[dict]]) -> None:
+    from bantz.core import fastjson
+    path = _nominatim_cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(fastjson.dumps(cache), encoding="utf-8")
+        tmp.replace(path)
+    except OSError:
+        pass  # cache is best-effort
+
+
+def _nominatim_get(path: str) -> tuple[int, bytes]:
+    """GET *path* on the shared Nominatim connection; reconnects once if dropped."""
+    global _nominatim_conn
+    import http.client
+
+    def _roundtrip(conn) -> tuple[int, bytes]:
+        conn.request("GET", path, headers={"User-Agent": "Bantz/2.0"})
+        resp = conn.getresponse()
+        return resp.status, resp.read()
+
+    if _nominatim_conn is not None:
+        try:
+            return _roundtrip(_nominatim_conn)
+        except (http.client.HTTPException, OSError):
+            # Idle keep-alive sockets get closed server-side; retry on a fresh one
+            _nominatim_conn.close()
+    _nominatim_conn = http.client.HTTPSConnection(_NOMINATIM_HOST, timeout=10)
+    return _roundtrip(_nominatim_conn)
+
+
+def _nominatim_search(query: str, limit: int = 1, *, retries: int = 3) -> list[dict]:
+    """Forward geocode via Nominatim (no API key) — cached and rate-limited.
+
+    Most place names resolve unambiguously, so callers ask for the top hit
+    first and only widen *limit* when the user rejects it.
+    """
+    global _nominatim_last_call
+    import random
+    import time
+    import urllib.parse
+    from bantz.core import fastjson
+
+    key = f"{limit}:{_normalise_place_query(query)}"
+    cache = _load_nominatim_cache()
+    if key in cache:
+        return cache[key]
+
+    path = (
+        f"/search?q={urllib.parse.quote(query)}"
+        f"&format=json&limit={limit}&accept-language=tr"
+    )
+    for attempt in range(retries):
+        wait = _NOMINATIM_MIN_INTERVAL - (time.monotonic() - _nominatim_last_call)
+        if wait > 0:
+            time.sleep(wait)
+        _nominatim_last_call = time.monotonic()
+        status, body = _nominatim_get(path)
+        if status == 200:
+            results = fastjson.loads(body)
+            break
+        if status not in _NOMINATIM_RETRY_STATUS or attempt == retries - 1:
+            raise RuntimeError(f"Nominatim returned HTTP {status}")
+        time.sleep(2 ** attempt + random.uniform(0, 0.5))
+
+    cache[key] = results
+    _save_nominatim_cache(cache)
+    return results
+
+
 async def _setup_places() -> None:
     """Interactive known-places setup — writes places.json.
     Three coordinate options: auto IP, city name search, manual entry.
     First place (or explicit choice) becomes default location in .env.
     """
-    import json
+    import asyncio
     from bantz.core.places import places
     from bantz.core.location import location_service
 
-    def _nominatim_search(query: str) -> list[dict]:
-        """Forward geocode via Nominatim (no API key)."""
-        import urllib.parse
-        encoded = urllib.parse.quote(query)
-        url = (
-            f"https://nominatim.openstreetmap.org/search"
-            f"?q={encoded}&format=json&limit=3&accept-language=tr"
-        )
-        req = urllib.request.Request(url, headers={"User-Agent": "Bantz/2.0"})
-        with urllib.request.urlopen(req, timeout=10) as r:
-            return json.loads(r.read())
-
     print("\n📍 Known Locations Setup")
-    print("─" * 40)
+    print(_RULE)
 
     data = dict(places.all_places())
     if data:
@@ -528,14 +705,19 @@ async def _setup_places() -> None:
             print(f"  {k}: {v.get('label', k)}  ({v.get('lat', 0):.4f}, {v.get('lon', 0):.4f}){prim}")
         print()
 
-    # Get IP location for option 1
-    print("Detecting IP location...")
-    loc = await location_service.get()
-    if loc.lat != 0.0 and loc.lon != 0.0:
-        print(f"  📡 {loc.display}  ({loc.lat:.4f}, {loc.lon:.4f})  via {loc.source}")
-    else:
-        print("  ⚠  Could not detect IP location.")
-    print()
+    async def _detect_ip_location():
+        print("Detecting IP location...")
+        found = await location_service.get()
+        if found.lat != 0.0 and found.lon != 0.0:
+            print(f"  📡 {found.display}  ({found.lat:.4f}, {found.lon:.4f})  via {found.source}")
+        else:
+            print("  ⚠  Could not detect IP location.")
+        print()
+        return found
+
+    # IP location for option 1.  On a first run it is shown up front; when
+    # adding to existing places the network probe waits until [1] is picked.
+    loc = None if data else await _detect_ip_location()
 
     print("Add locations (e.g.: dorm, campus, home). Leave blank to finish.\n")
 
@@ -554,7 +736,9 @@ async def _setup_places() -> None:
         # 3 options for coordinates
         print()
         print("  Coordinate option:")
-        if loc.lat != 0.0:
+        if loc is None:
+            print("  [1] Automatic (IP location, detected when chosen)")
+        elif loc.lat != 0.0:
             print(f"  [1] Automatic (IP location: {loc.city}, {loc.lat:.4f}, {loc.lon:.4f})")
         else:
             print("  [1] Automatic (IP location unavailable)")
@@ -563,6 +747,8 @@ async def _setup_places() -> None:
         choice = input("  Choice [2]: ").strip() or "2"
 
         lat, lon = 0.0, 0.0
+        if choice == "1" and loc is None:
+            loc = await _detect_ip_location()
 
         if choice == "1" and loc.lat != 0.0:
             lat, lon = loc.lat, loc.lon
@@ -583,23 +769,13 @@ async def _setup_places() -> None:
                 print("  ✗ Empty query, skipping.")
                 continue
             try:
-                results = _nominatim_search(query)
+                # Blocking HTTP (and the rate-limit sleep) stays off the loop
+                results = await asyncio.to_thread(_nominatim_search, query)
                 if not results:
                     print("  ✗ No results found.")
                     continue
 
-                if len(results) == 1:
-                    pick = results[0]
-                else:
-                    print("  Results found:")
-                    for i, r in enumerate(results, 1):
-                        print(f"    [{i}] {r['display_name'][:80]}")
-                    idx = input("  Choice [1]: ").strip() or "1"
-                    try:
-                        pick = results[int(idx) - 1]
-                    except (ValueError, IndexError):
-                        pick = results[0]
-
+                pick = results[0]
                 lat = float(pick["lat"])
                 lon = float(pick["lon"])
                 display = pick.get("display_name", "")[:60]
@@ -607,8 +783,24 @@ async def _setup_places() -> None:
 
                 confirm = input("  Correct? [Y/n]: ").strip().lower()
                 if confirm in ("n", "no"):
-                    print("  Skipping.")
-                    continue
+                    # Only fetch alternates when the top hit was wrong
+                    more = await asyncio.to_thread(_nominatim_search, query, 5)
+                    alternates = more[1:]
+                    if not alternates:
+                        print("  Skipping.")
+                        continue
+                    print("  Other matches:")
+                    for i, r in enumerate(alternates, 1):
+                        print(f"    [{i}] {r['display_name'][:80]}")
+                    idx = input("  Choice (blank=skip): ").strip()
+                    try:
+                        pick = alternates[int(idx) - 1]
+                    except (ValueError, IndexError):
+                        print("  Skipping.")
+                        continue
+                    lat = float(pick["lat"])
+                    lon = float(pick["lon"])
+                    print(f"  → Using: {lat:.4f}, {lon:.4f}  ({pick.get('display_name', '')[:60]})")
 
             except Exception as e:
                 print(f"  ✗ Search error: {e}")
@@ -659,89 +851,69 @@ def _write_location_to_env(city: str, lat: float, lon: float) -> None:
     """Write BANTZ_CITY / BANTZ_LAT / BANTZ_LON to .env."""
     from pathlib import Path
 
-    env_path = Path.cwd() / ".env"
-    existing = ""
-    if env_path.exists():
-        existing = env_path.read_text(encoding="utf-8")
-
-    lines = existing.splitlines()
-    # Remove old location entries
-    lines = [
-        line for line in lines
-        if not line.startswith("BANTZ_CITY=")
-        and not line.startswith("BANTZ_LAT=")
-        and not line.startswith("BANTZ_LON=")
-    ]
+    with _EnvFile(Path.cwd() / ".env") as env:
+        env.set("BANTZ_CITY", city)
+        env.set("BANTZ_LAT", str(lat))
+        env.set("BANTZ_LON", str(lon))
 
-    lines.append(f"BANTZ_CITY={city}")
-    lines.append(f"BANTZ_LAT={lat}")
-    lines.append(f"BANTZ_LON={lon}")
 
-    import os
-    fd = os.open(str(env_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
-    if hasattr(os, "fchmod"):  # unavailable on Windows
-        os.fchmod(fd, 0o600)
-    with os.fdopen(fd, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines) + "\n")
+def _pick_numbered(raw: str, options: list[str]) -> list[str]:
+    """Map a 1-based number list (``"1,3"``) onto *options*; all when none valid.
+
+    Only comma-separated, purely numeric tokens count (``"1-3"`` is ignored,
+    not read as 1 and 3); a repeated number is picked once.
+    """
+    picked = [
+        options[int(tok) - 1] for tok in (t.strip() for t in raw.split(","))
+        if tok.isdigit() and 0 < int(tok) <= len(options)
+    ]
+    return list(dict.fromkeys(picked)) or list(options)
 
 
 def _setup_profile() -> None:
-    """Interactive profile setup — writes profile.json."""
+    """Interactive profile setup — writes profile.json.
+
+    Piped stdin is read as ``key=value`` answers: name, university,
+    department, year, style, sections, sources.
+    """
     from bantz.core.profile import profile, ALL_BRIEFING_SECTIONS, ALL_NEWS_SOURCES
 
     print("\n👤 User Profile Setup")
-    print("─" * 40)
+    print(_RULE)
     if profile.is_configured():
         print(f"Current profile: {profile.get('name')} ({profile.response_style})")
         print()
 
-    name = input("Name: ").strip()
+    ask = _asker(_piped_answers())
+    name = ask("name", "Name: ")
     if not name:
         print("Name required. Cancelled.")
         return
 
-    university = input("University (blank=skip): ").strip()
-    department = input("Department (blank=skip): ").strip()
-    year_raw = input("Year (1-6, blank=skip): ").strip()
+    university = ask("university", "University (blank=skip): ")
+    department = ask("department", "Department (blank=skip): ")
+    year_raw = ask("year", "Year (1-6, blank=skip): ")
     year = int(year_raw) if year_raw.isdigit() else 0
 
     print("\nResponse style:")
     print("  1) casual  — friendly, like an old friend")
     print("  2) formal  — professional, respectful")
-    style_choice = input("Choice [1]: ").strip()
-    response_style = "formal" if style_choice == "2" else "casual"
+    style_choice = ask("style", "Choice [1]: ")
+    response_style = "formal" if style_choice in ("2", "formal") else "casual"
 
     # Briefing sections
     print("\nBriefing sections (comma-separated numbers, or Enter for all):")
     for i, sec in enumerate(ALL_BRIEFING_SECTIONS, 1):
         print(f"  {i}) {sec}")
-    sec_input = input(f"Sections [1-{len(ALL_BRIEFING_SECTIONS)}, default=all]: ").strip()
-    if sec_input:
-        indices = [int(x.strip()) - 1 for x in sec_input.split(",") if x.strip().isdigit()]
-        briefing_sections = [
-            ALL_BRIEFING_SECTIONS[i] for i in indices
-            if 0 <= i < len(ALL_BRIEFING_SECTIONS)
-        ]
-        if not briefing_sections:
-            briefing_sections = list(ALL_BRIEFING_SECTIONS)
-    else:
-        briefing_sections = list(ALL_BRIEFING_SECTIONS)
+    sec_input = ask("sections", f"Sections [1-{len(ALL_BRIEFING_SECTIONS)}, default=all]: ")
+    briefing_sections = _pick_numbered(sec_input, ALL_BRIEFING_SECTIONS)
 
     # News sources
     print("\nNews sources (comma-separated numbers, or Enter for all):")
     for i, src in enumerate(ALL_NEWS_SOURCES, 1):
         print(f"  {i}) {src}")
-    src_input = input(f"Sources [1-{len(ALL_NEWS_SOURCES)}, default=all]: ").strip()
-    if src_input:
-        indices = [int(x.strip()) - 1 for x in src_input.split(",") if x.strip().isdigit()]
-        news_sources = [
-            ALL_NEWS_SOURCES[i] for i in indices
-            if 0 <= i < len(ALL_NEWS_SOURCES)
-        ]
-        if not news_sources:
-            news_sources = list(ALL_NEWS_SOURCES)
-    else:
-        news_sources = list(ALL_NEWS_SOURCES)
+    src_input = ask("sources", f"Sources [1-{len(ALL_NEWS_SOURCES)}, default=all]: ")
+    news_sources = _pick_numbered(src_input, ALL_NEWS_SOURCES)
 
     profile.save({
         "name": name,
@@ -760,11 +932,71 @@ def _setup_profile() -> None:
     print(f"  → {profile.prompt_hint()}")
 
 
+# HH:MM  Class-Name  [Duration(min)]  [Location]
+_SCHED_LINE_RE = re.compile(r"^(\S+)\s+(\S+)(?:\s+(\d+))?(?:\s+(.*))?$")
+
+
+def _parse_class_line(raw: str) -> dict | None:
+    """Parse ``HH:MM  Class-Name  [Duration(min)]  [Location]`` into a class dict."""
+    m = _SCHED_LINE_RE.match(raw.strip())
+    if not m:
+        return None
+    time_str, name, dur_s, location = m.groups()
+    duration = int(dur_s) if dur_s else 90
+
+    cls: dict = {"name": name, "time": time_str, "duration": duration}
+    if location:
+        cls["location"] = location
+    return cls
+
+
+def _parse_schedule_batch(text: str, data: dict) -> int:
+    """Single-pass parse of a piped schedule into *data*; returns classes added.
+
+    Format: a day header line (``Monday:``) followed by one class per line in
+    the interactive format.  Blank lines and ``#`` comments are ignored, as
+    are class lines before the first header or that fail to parse.  Classes
+    are inserted in time order, so already-sorted days stay sorted.
+    """
+    from bisect import insort
+    from operator import itemgetter
+    from bantz.core.schedule import DAYS_EN, DAYS_TR
+
+    by_time = itemgetter("time")
+
+    headers = {d: d for d in DAYS_EN}
+    headers.update({label.lower(): d for d, label in DAYS_TR.items()})
+
+    day: str | None = None
+    added = 0
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.endswith(":") and line[:-1].strip().lower() in headers:
+            day = headers[line[:-1].strip().lower()]
+            continue
+        if day is None:
+            continue
+        cls = _parse_class_line(line)
+        if cls is None:
+            continue
+        insort(data.setdefault(day, []), cls, key=by_time)
+        added += 1
+    return added
+
+
 def _setup_schedule() -> None:
-    """Interactive schedule setup — writes schedule.json."""
-    import json
-    import os
-    from bantz.core.schedule import Schedule, DAYS_EN, DAYS_TR
+    """Interactive schedule setup — writes schedule.json.
+
+    When stdin is not a TTY (``bantz --setup schedule < schedule.txt``) the
+    whole input is read at once and parsed by ``_parse_schedule_batch``.
+    """
+    import sys
+    from operator import itemgetter
+    from bantz.core import fastjson
+    from bantz.core.schedule import Schedule, DAYS_EN
+    from bantz.core.secure_io import secure_write_bytes
 
     path = Schedule.setup_path()
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -773,13 +1005,42 @@ def _setup_schedule() -> None:
     data: dict = {}
     if path.exists():
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
+            data = fastjson.loads(path.read_bytes())
             print(f"Existing schedule loaded: {path}")
         except Exception:
             pass
 
+    # Sort existing days once; new classes are insort()ed into place
+    by_time = itemgetter("time")
+    for day_en in DAYS_EN:
+        if day_en in data:
+            for c in data[day_en]:
+                c.setdefault("time", "")
+            data[day_en].sort(key=by_time)
+
+    if sys.stdin.isatty():
+        _prompt_schedule(data)
+    else:
+        added = _parse_schedule_batch(sys.stdin.read(), data)
+        print(f"✓ Added {added} class(es) from stdin")
+
+    # Write securely
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    secure_write_bytes(path, fastjson.dumpb(data, indent=True))
+    print(f"\n✅ Schedule saved: {path}")
+    print("Test: bantz --once 'my classes today'")
+
+
+def _prompt_schedule(data: dict) -> None:
+    """Prompt for classes day by day, inserting them into *data* in time order."""
+    from bisect import insort
+    from operator import itemgetter
+    from bantz.core.schedule import DAYS_EN, DAYS_TR
+
+    by_time = itemgetter("time")
+
     print("\n📅 Class Schedule Setup")
-    print("─" * 40)
+    print(_RULE)
     print("Enter classes day by day. Leave blank to finish.")
     print("Format: HH:MM  Class-Name  Duration(min)  Location")
     print()
@@ -800,34 +1061,15 @@ def _setup_schedule() -> None:
                 break
             if not raw:
                 break
-            parts = raw.split(None, 3)
-            if len(parts) < 2:
+            cls = _parse_class_line(raw)
+            if cls is None:
                 print("  Enter at least time and class name.")
                 continue
-            time_str = parts[0]
-            name = parts[1]
-            duration = int(parts[2]) if len(parts) > 2 and parts[2].isdigit() else 90
-            location = parts[3] if len(parts) > 3 else ""
-
-            cls: dict = {"name": name, "time": time_str, "duration": duration}
-            if location:
-                cls["location"] = location
-            classes.append(cls)
-            print(f"  ✓ Added: {time_str} {name}")
+            insort(classes, cls, key=by_time)
+            print(f"  ✓ Added: {cls['time']} {cls['name']}")
 
         if classes:
-            data[day_en] = sorted(classes, key=lambda c: c.get("time", ""))
-
-    # Write securely
-    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
-    content = json.dumps(data, ensure_ascii=False, indent=2)
-    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
-    if hasattr(os, "fchmod"):  # unavailable on Windows
-        os.fchmod(fd, 0o600)
-    with os.fdopen(fd, "w", encoding="utf-8") as f:
-        f.write(content)
-    print(f"\n✅ Schedule saved: {path}")
-    print("Test: bantz --once 'my classes today'")
+            data[day_en] = classes
 
 
 def _cache_stats() -> None:
@@ -839,7 +1081,7 @@ def _cache_stats() -> None:
     stats = spatial_db.stats()
 
     print("\n🗺  Spatial Cache Statistics")
-    print("─" * 50)
+    print(_WIDE_RULE)
     print(f"  Total entries : {stats['total_entries']} / {stats.get('max_entries', 1000)}")
     print(f"  Total hits    : {stats['total_hits']}")
     print(f"  Expired       : {stats['expired']}")
@@ -889,7 +1131,7 @@ def _show_config() -> None:
     from bantz.config import Config, config
 
     print("Bantz v2 — Current Configuration")
-    print("─" * 52)
+    print(_WIDE_RULE)
 
     section = ""
     for name, field in Config.model_fields.items():
@@ -913,41 +1155,46 @@ def _show_config() -> None:
     print()
 
 
+# Config field-name prefixes → --config section label, first match wins.
+# Built once; _section_for() runs for every field _show_config() prints.
+_CONFIG_SECTIONS: tuple[tuple[tuple[str, ...], str], ...] = (
+    (("ollama_",), "Ollama"),
+    (("vector_search_",), "Vector Search"),
+    (("distillation_",), "Distillation"),
+    (("vlm_", "screenshot_"), "Vision / VLM"),
+    (("input_control_", "input_confirm_", "input_type_"), "Input Control"),
+    (("gemini_",), "Gemini"),
+    (("language", "translation_"), "Language"),
+    (("shell_",), "Shell Security"),
+    (("location_",), "Location"),
+    (("gps_relay_",), "GPS Relay"),
+    (("mempalace_", "palace_"), "MemPalace"),
+    (("data_dir",), "Storage"),
+    (("morning_briefing_",), "Morning Briefing"),
+    (("daily_digest_", "weekly_digest_"), "Digests"),
+    (("reminder_",), "Scheduler / Reminders"),
+    (("uvloop_",), "Event Loop"),
+    (("job_scheduler_", "night_", "briefing_prep_", "overnight_poll_hours",), "Job Scheduler"),
+    (("urgent_keywords",), "Overnight Poll"),
+    (("telegram_",), "Telegram"),
+    (("observer_",), "Observer"),
+    (("rl_",), "RL Engine"),
+    (("intervention_",), "Interventions"),
+    (("app_detector_",), "App Detector"),
+    (("desktop_notifications", "notification_",), "Notifications"),
+    (("voice_enabled",), "Voice"),
+    (("tts_",), "TTS / Audio"),
+    (("audio_duck_",), "Audio Ducking"),
+    (("wake_word_", "picovoice_",), "Wake Word"),
+    (("stt_", "vad_", "ghost_loop_",), "Ghost Loop / STT"),
+    (("ambient_",), "Ambient Sound"),
+)
+
+
 def _section_for(field_name: str) -> str:
     """Map a config field name to a human-readable section label."""
-    _MAP = [
-        (("ollama_",), "Ollama"),
-        (("vector_search_",), "Vector Search"),
-        (("distillation_",), "Distillation"),
-        (("vlm_", "screenshot_"), "Vision / VLM"),
-        (("input_control_", "input_confirm_", "input_type_"), "Input Control"),
-        (("gemini_",), "Gemini"),
-        (("language", "translation_"), "Language"),
-        (("shell_",), "Shell Security"),
-        (("location_",), "Location"),
-        (("gps_relay_",), "GPS Relay"),
-        (("mempalace_", "palace_"), "MemPalace"),
-        (("data_dir",), "Storage"),
-        (("morning_briefing_",), "Morning Briefing"),
-        (("daily_digest_", "weekly_digest_"), "Digests"),
-        (("reminder_",), "Scheduler / Reminders"),
-        (("job_scheduler_", "night_", "briefing_prep_", "overnight_poll_hours",), "Job Scheduler"),
-        (("urgent_keywords",), "Overnight Poll"),
-        (("telegram_",), "Telegram"),
-        (("observer_",), "Observer"),
-        (("rl_",), "RL Engine"),
-        (("intervention_",), "Interventions"),
-        (("app_detector_",), "App Detector"),
-        (("desktop_notifications", "notification_",), "Notifications"),
-        (("voice_enabled",), "Voice"),
-        (("tts_",), "TTS / Audio"),
-        (("audio_duck_",), "Audio Ducking"),
-        (("wake_word_", "picovoice_",), "Wake Word"),
-        (("stt_", "vad_", "ghost_loop_",), "Ghost Loop / STT"),
-        (("ambient_",), "Ambient Sound"),
-    ]
-    for prefixes, label in _MAP:
-        if any(field_name.startswith(p) or field_name == p for p in prefixes):
+    for prefixes, label in _CONFIG_SECTIONS:
+        if field_name.startswith(prefixes):
             return label
     return "General"
 
@@ -975,169 +1222,325 @@ def _check_whisper_model_cached(model_name: str) -> bool:
     return False
 
 
-async def _doctor() -> None:
+# ── Doctor tool-schema cache ───────────────────────────────────────────────
+# --doctor only needs the registered tool names; importing every tool module
+# to get them costs a few hundred ms.  The list is cached next to the
+# Nominatim cache and invalidated when any bantz source file (tools import
+# core, auth, config, …) or the installed packages (site-packages mtime —
+# optional tools depend on them) change.  A report built from the cache says
+# so; `bantz --doctor --no-cache` re-imports every tool module.
+
+def _tool_cache_path():
+    from pathlib import Path
+    return Path.home() / ".bantz" / "cache" / "doctor_tools.json"
+
+
+def _tool_cache_stamp() -> dict[str, int]:
+    import os
+    import site
+    import sysconfig
+    from pathlib import Path
+    package_dir = Path(__file__).resolve().parent.parent
+    paths: list[str] = []
+    for root, dirs, files in os.walk(package_dir):
+        dirs[:] = [d for d in dirs if d != "__pycache__"]
+        paths.extend(os.path.join(root, f) for f in files if f.endswith(".py"))
+    paths.extend({
+        sysconfig.get_paths()["purelib"], sysconfig.get_paths()["platlib"],
+        site.getusersitepackages(),
+    })
+    stamp: dict[str, int] = {}
+    for path in paths:
+        try:
+            stamp[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+    return stamp
+
+
+# Every declared tool module (bantz.tools.known_tool_names()) is imported,
+# not just located, by --doctor so each tool registers itself — except the
+# ones below.  A tool whose dependencies are missing is reported and skipped
+# rather than aborting the whole check.
+_DOCTOR_SKIP_TOOLS: frozenset[str] = frozenset({
+    # never registered by Brain, so not part of the assistant's tool set
+    "browser_tool", "computer_use", "contacts", "feed_tool", "gui_action",
+    "gui_tool", "image_tool", "system_tool",
+    # reported by their own section below / registered only when enabled
+    "input_control", "localmail",
+})
+
+
+def _read_tool_cache(stamp: dict[str, int]) -> tuple[list[dict], list[str]] | None:
+    from bantz.core import fastjson
+    try:
+        data = fastjson.loads(_tool_cache_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("stamp") != stamp:
+        return None
+    return data.get("schemas", []), data.get("skipped", [])
+
+
+def _write_tool_cache(
+    stamp: dict[str, int], schemas: list[dict], skipped: Sequence[str] = (),
+) -> None:
+    from bantz.core import fastjson
+    path = _tool_cache_path()
+    payload = {"stamp": stamp, "schemas": schemas, "skipped": list(skipped)}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(fastjson.dumps(payload), encoding="utf-8")
+        tmp.replace(path)
+    except (OSError, TypeError, ValueError):
+        pass  # cache is best-effort
+
+
+def _load_doctor_tools() -> tuple[list[dict], list[str]]:
+    """Import every tool module once; return (schemas, skipped-module notes)."""
+    import importlib
+    from bantz.tools import known_tool_names, registry
+
+    skipped: list[str] = []
+    for name in known_tool_names():
+        if name in _DOCTOR_SKIP_TOOLS:
+            continue
+        try:
+            importlib.import_module(f"bantz.tools.{name}")
+        except Exception as exc:
+            skipped.append(f"{name} ({exc})")
+    return registry.all_schemas(), skipped
+
+
+async def _doctor(use_cache: bool = True) -> None:
+    import asyncio
+    import sys
     from bantz.llm.ollama import ollama
     from bantz.config import config
-    from bantz.tools import registry
     from bantz.auth.token_store import token_store
+    from bantz.core.location import location_service
 
-    print("Bantz v2 — System Check")
-    print("─" * 52)
+    # Each section's lines are buffered and written in one call just before
+    # the next await, so the report still streams as probes resolve but the
+    # terminal sees one write per section instead of one per line.
+    _out: list[str] = []
+    emit = _out.append
+
+    def _flush() -> None:
+        if _out:
+            sys.stdout.write("\n".join(_out) + "\n")
+            sys.stdout.flush()
+            _out.clear()
+
+    def _tool_schemas() -> tuple[list[dict], list[str], bool]:
+        # Tool modules register themselves on import (#432: count was 0 at
+        # import time).  Runs on a worker thread so the cold imports overlap
+        # with the LLM provider probe below, and is skipped (unless
+        # use_cache is False) while the on-disk schema cache still matches
+        # the installed sources.
+        stamp = _tool_cache_stamp()
+        cached = _read_tool_cache(stamp) if use_cache else None
+        if cached is not None:
+            return (*cached, True)
+        schemas, skipped = _load_doctor_tools()
+        _write_tool_cache(stamp, schemas, skipped)
+        return schemas, skipped, False
+
+    db_path = config.db_path
+
+    def _memory_stats() -> dict:
+        # SQLite migrate + vector-store init; the connection pool is
+        # thread-safe, so this overlaps the network probes on a worker.
+        from bantz.core.memory import memory as _mem
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        _mem.init(db_path)
+        return _mem.stats()
+
+    async def _probe_ollama() -> RuntimeError | None:
+        try:
+            await ollama.verify_connection()
+        except RuntimeError as exc:
+            return exc
+        return None
 
     # ── Active LLM provider ──────────────────────────────────────────────────
     _provider = (config.llm_provider or "ollama").lower()
+    ollama_url = config.ollama_base_url
+    ollama_remote = "localhost" not in ollama_url and "127.0.0.1" not in ollama_url
+
+    # Independent probes run concurrently; each section below awaits its
+    # own result, so output order is unchanged but wall time is max(probe)
+    # rather than sum(probes).
+    tools_loaded = asyncio.get_running_loop().run_in_executor(None, _tool_schemas)
+    ollama_probe = asyncio.create_task(_probe_ollama())
+    location_probe = asyncio.create_task(location_service.get())
+    token_probe = asyncio.create_task(asyncio.to_thread(token_store.status))
+    memory_probe = asyncio.create_task(asyncio.to_thread(_memory_stats))
+
+    import psutil
+
+    async def _cpu_sample() -> float:
+        # psutil's figure is system-wide, so wait out the tool-module imports
+        # on the executor, then sample on a worker thread while only the
+        # I/O-bound probes are in flight — the loop never sleeps on it.
+        await asyncio.wait({tools_loaded})
+        return await asyncio.to_thread(psutil.cpu_percent, 0.3)
 
+    cpu_probe = asyncio.create_task(_cpu_sample())
+    provider_probe: asyncio.Task[bool] | None = None
     if _provider == "claude":
         from bantz.llm.anthropic_client import claude as _claude
         if _claude.is_enabled():
-            _ok = await _claude.is_available()
-            if _ok:
-                print(f"✅ Claude: connected — {config.anthropic_model}")
-            else:
-                print("❌ Claude: UNREACHABLE — check BANTZ_ANTHROPIC_API_KEY")
-        else:
-            print("❌ Claude: API key not set  → bantz --setup claude")
+            provider_probe = asyncio.create_task(_claude.is_available())
     elif _provider == "openai":
         from bantz.llm.openai_client import openai_client as _oai
         if _oai.is_enabled():
-            _ok = await _oai.is_available()
-            if _ok:
-                print(f"✅ OpenAI: connected — {config.openai_model}")
+            provider_probe = asyncio.create_task(_oai.is_available())
+    elif _provider == "gemini":
+        from bantz.llm.gemini import gemini as _gem
+        provider_probe = asyncio.create_task(_gem.is_available())
+
+    emit("Bantz v2 — System Check")
+    emit(_WIDE_RULE)
+
+    _flush()
+    if _provider == "claude":
+        if provider_probe is not None:
+            if await provider_probe:
+                emit(f"✅ Claude: connected — {config.anthropic_model}")
             else:
-                print("❌ OpenAI: UNREACHABLE — check BANTZ_OPENAI_API_KEY")
+                emit("❌ Claude: UNREACHABLE — check BANTZ_ANTHROPIC_API_KEY")
         else:
-            print("❌ OpenAI: API key not set  → bantz --setup openai")
+            emit("❌ Claude: API key not set  → bantz --setup claude")
+    elif _provider == "openai":
+        if provider_probe is not None:
+            if await provider_probe:
+                emit(f"✅ OpenAI: connected — {config.openai_model}")
+            else:
+                emit("❌ OpenAI: UNREACHABLE — check BANTZ_OPENAI_API_KEY")
+        else:
+            emit("❌ OpenAI: API key not set  → bantz --setup openai")
     elif _provider == "gemini":
-        from bantz.llm.gemini import gemini as _gem
-        _ok = await _gem.is_available()
-        if _ok:
-            print(f"✅ Gemini: connected — {config.gemini_model}")
+        if await provider_probe:
+            emit(f"✅ Gemini: connected — {config.gemini_model}")
         else:
-            print("❌ Gemini: UNREACHABLE — check BANTZ_GEMINI_API_KEY")
+            emit("❌ Gemini: UNREACHABLE — check BANTZ_GEMINI_API_KEY")
     else:
         # Ollama (default)
-        is_remote = "localhost" not in config.ollama_base_url and "127.0.0.1" not in config.ollama_base_url
-        mode_label = "remote (GPU VPS)" if is_remote else "local"
-        try:
-            await ollama.verify_connection()
-            print(f"✅ Ollama [{mode_label}]: connected — {config.ollama_model} @ {config.ollama_base_url}")
-        except RuntimeError as _e:
-            print(f"❌ Ollama [{mode_label}]: {_e}")
+        mode_label = "remote (GPU VPS)" if ollama_remote else "local"
+        _e = await ollama_probe
+        if _e is None:
+            emit(f"✅ Ollama [{mode_label}]: connected — {config.ollama_model} @ {ollama_url}")
+        else:
+            emit(f"❌ Ollama [{mode_label}]: {_e}")
 
     # Ollama always shown as secondary if it's not the active provider
     if _provider != "ollama":
-        is_remote = "localhost" not in config.ollama_base_url and "127.0.0.1" not in config.ollama_base_url
-        mode_label = "remote" if is_remote else "local"
-        try:
-            await ollama.verify_connection()
-            print(f"   Ollama [{mode_label}]: available — {config.ollama_model} (used for routing/tools)")
-        except RuntimeError:
-            print(f"   Ollama [{mode_label}]: offline (routing/tools will be degraded)")
+        mode_label = "remote" if ollama_remote else "local"
+        _flush()
+        if await ollama_probe is None:
+            emit(f"   Ollama [{mode_label}]: available — {config.ollama_model} (used for routing/tools)")
+        else:
+            emit(f"   Ollama [{mode_label}]: offline (routing/tools will be degraded)")
 
     # MemPalace
     if config.mempalace_enabled:
         try:
             from bantz.memory.bridge import palace_bridge
+            _flush()
             await palace_bridge.init()  # #432: .enabled is always False until init() is called
             if palace_bridge and palace_bridge.enabled:
-                print(f"✅ MemPalace: enabled (wing={config.mempalace_wing})")
+                emit(f"✅ MemPalace: enabled (wing={config.mempalace_wing})")
             else:
-                print("❌ MemPalace: enabled but bridge not initialized")
+                emit("❌ MemPalace: enabled but bridge not initialized")
         except Exception:
-            print("❌ MemPalace: enabled but import failed")
+            emit("❌ MemPalace: enabled but import failed")
     else:
-        print("⚪ MemPalace: disabled  → BANTZ_MEMPALACE_ENABLED=true")
+        emit("⚪ MemPalace: disabled  → BANTZ_MEMPALACE_ENABLED=true")
 
     # Vision / VLM
     if config.vlm_enabled:
-        print(f"✅ Vision/VLM: enabled ({config.vlm_endpoint})")
+        emit(f"✅ Vision/VLM: enabled ({config.vlm_endpoint})")
     else:
-        print("⚪ Vision/VLM: disabled  → BANTZ_VLM_ENABLED=true")
+        emit("⚪ Vision/VLM: disabled  → BANTZ_VLM_ENABLED=true")
 
     # psutil
-    import psutil
-    print(f"✅ psutil: CPU {psutil.cpu_percent(interval=0.3):.0f}%")
-
-    # Tools — import modules so they register themselves (#432: count was 0 at import time)
-    import importlib as _importlib
-    for _mod in (
-        "bantz.tools.shell", "bantz.tools.system", "bantz.tools.filesystem",
-        "bantz.tools.weather", "bantz.tools.web_search", "bantz.tools.web_reader",
-        "bantz.tools.gmail", "bantz.tools.calendar", "bantz.tools.classroom",
-        "bantz.tools.reminder",
-    ):
-        _importlib.import_module(_mod)
-    for _opt in (
-        "bantz.tools.news", "bantz.tools.document", "bantz.tools.accessibility",
-        "bantz.tools.visual_click", "bantz.tools.browser_control",
-        "bantz.tools.screenshot_tool", "bantz.tools.desktop",
-        "bantz.tools.delegate_task",
-    ):
-        try:
-            _importlib.import_module(_opt)
-        except (ImportError, Exception):
-            pass
-    names = [t["name"] for t in registry.all_schemas()]
-    print(f"✅ Tools ({len(names)}): {', '.join(names)}")
+    _flush()
+    emit(f"✅ psutil: CPU {await cpu_probe:.0f}%")
+
+    # Tools — wait for the background load started at the top
+    _flush()
+    schemas, skipped_tools, tools_cached = await tools_loaded
+    cached_label = ", cached" if tools_cached else ""
+    emit(f"✅ Tools ({len(schemas)}{cached_label}): {', '.join(t['name'] for t in schemas)}")
+    for note in skipped_tools:
+        emit(f"   ⚪ tool {note}")
+    if tools_cached:
+        emit("   → bantz --doctor --no-cache to re-import tool modules")
 
     # Translation / Bridge
     if config.translation_enabled and config.language == "tr":
-        try:
-            from transformers import AutoTokenizer  # noqa: F401
-            print("✅ MarianMT: available")
-        except ImportError:
-            print("❌ MarianMT: NOT installed  → pip install 'bantz[translation]'")
+        # find_spec only resolves the package — importing transformers would
+        # drag in torch just to report that it is there.
+        import importlib.util
+        if importlib.util.find_spec("transformers") is not None:
+            emit("✅ MarianMT: available")
+        else:
+            emit("❌ MarianMT: NOT installed  → pip install 'bantz[translation]'")
     else:
-        print(f"⚪ Translation: {'disabled' if not config.translation_enabled else f'not needed (lang={config.language})'}")
+        emit(f"⚪ Translation: {'disabled' if not config.translation_enabled else f'not needed (lang={config.language})'}")
 
     # Google integrations (Gmail / Calendar / Classroom)
     try:
         import google.auth  # noqa: F401
         import google.auth.transport  # noqa: F401
         import googleapiclient  # noqa: F401
-        print("✅ Google integrations: available")
+        emit("✅ Google integrations: available")
     except ImportError:
-        print("❌ Google integrations: NOT installed  → pip install -e '.[google]'")
+        emit("❌ Google integrations: NOT installed  → pip install -e '.[google]'")
 
     # Location
-    from bantz.core.location import location_service
-    loc = await location_service.get()
+    _flush()
+    loc = await location_probe
     if loc.is_live:
-        print(f"✅ Location: {loc.display}  (via {loc.source})")
+        emit(f"✅ Location: {loc.display}  (via {loc.source})")
     else:
-        print("⚪ Location: unknown  → enable phone GPS relay")
+        emit("⚪ Location: unknown  → enable phone GPS relay")
 
     # Google integrations
-    g_status = token_store.status()
+    _flush()
+    g_status = await token_probe
+    any_missing = False
     for svc, st in g_status.items():
-        icon = "✅" if st == "ok" else "⚪"
-        print(f"  {icon} Google {svc}: {st}")
-    if any(st != "ok" for st in g_status.values()):
-        print("     → bantz --setup google gmail  /  bantz --setup google classroom")
+        ok = st == "ok"
+        any_missing = any_missing or not ok
+        emit(f"  {'✅' if ok else '⚪'} Google {svc}: {st}")
+    if any_missing:
+        emit("     → bantz --setup google gmail  /  bantz --setup google classroom")
 
     # Memory DB
-    config.ensure_dirs()
-    from bantz.core.memory import memory as _mem
-    _mem.init(config.db_path)
-    s = _mem.stats()
-    print(f"✅ Memory DB: {s['total_conversations']} conversations, {s['total_messages']} messages")
+    _flush()
+    s = await memory_probe
+    emit(f"✅ Memory DB: {s['total_conversations']} conversations, {s['total_messages']} messages")
 
     # MemPalace (ChromaDB embeddings are handled internally)
     from bantz.memory.bridge import palace_bridge
     if not palace_bridge.enabled:
         # init() may not have been called yet (e.g. mempalace_enabled was False above)
+        _flush()
         await palace_bridge.init()  # #432: safe to call again — re-checks config flag
     if palace_bridge.enabled:
-        print(f"✅ MemPalace: active  (vector_weight={config.vector_search_weight})")
+        emit(f"✅ MemPalace: active  (vector_weight={config.vector_search_weight})")
     else:
-        print("⚪ MemPalace: not initialised")
+        emit("⚪ MemPalace: not initialised")
 
     # Profile
     from bantz.core.profile import profile as _prof
     if _prof.is_configured():
-        print(f"✅ Profile: {_prof.status_line()}")
+        emit(f"✅ Profile: {_prof.status_line()}")
     else:
-        print("⚪ Profile: not configured  → bantz --setup profile")
+        emit("⚪ Profile: not configured  → bantz --setup profile")
 
     # AT-SPI Accessibility
     try:
@@ -1146,76 +1549,76 @@ async def _doctor() -> None:
         if atspi_ok:
             _atspi_apps = list_applications()
             _display = detect_display_server()
-            print(f"✅ AT-SPI2: available — {len(_atspi_apps)} accessible app(s), display={_display}")
+            emit(f"✅ AT-SPI2: available — {len(_atspi_apps)} accessible app(s), display={_display}")
             if not _atspi_apps:
-                print("   ⚠ No accessible apps found — ensure AT-SPI bus is active and apps support accessibility")
+                emit("   ⚠ No accessible apps found — ensure AT-SPI bus is active and apps support accessibility")
         else:
-            print("❌ AT-SPI2: unavailable — sudo apt install python3-gi gir1.2-atspi-2.0")
+            emit("❌ AT-SPI2: unavailable — sudo apt install python3-gi gir1.2-atspi-2.0")
     except Exception as _exc:
-        print(f"❌ AT-SPI2: import failed ({_exc})")
+        emit(f"❌ AT-SPI2: import failed ({_exc})")
 
     # Input Control (#122)
     if config.input_control_enabled:
         try:
             from bantz.tools.input_control import _detect_backend
             ic_backend = _detect_backend()
-            print(f"✅ Input Control: {ic_backend}  (confirm_destructive={config.input_confirm_destructive})")
+            emit(f"✅ Input Control: {ic_backend}  (confirm_destructive={config.input_confirm_destructive})")
         except Exception:
-            print("❌ Input Control: enabled but detection failed")
+            emit("❌ Input Control: enabled but detection failed")
     else:
-        print("⚪ Input Control: disabled  → BANTZ_INPUT_CONTROL_ENABLED=true")
+        emit("⚪ Input Control: disabled  → BANTZ_INPUT_CONTROL_ENABLED=true")
 
     # Spatial Cache (#121)
     try:
         from bantz.vision.spatial_cache import spatial_db as _sc
-        _sc.init(config.db_path)
+        _sc.init(db_path)
         sc_stats = _sc.stats()
-        print(f"✅ Spatial Cache: {sc_stats['total_entries']} entries, {sc_stats['total_hits']} hits")
+        emit(f"✅ Spatial Cache: {sc_stats['total_entries']} entries, {sc_stats['total_hits']} hits")
     except Exception:
-        print("⚪ Spatial Cache: not initialized")
+        emit("⚪ Spatial Cache: not initialized")
 
     # Navigator Pipeline (#123)
     try:
         from bantz.vision.navigator import navigator as _nav
-        _nav.init(config.db_path)
+        _nav.init(db_path)
         nav_stats = _nav.stats()
         total = nav_stats.get('total_attempts', 0)
         if total > 0:
             methods = nav_stats.get('methods', [])
             summary = ', '.join(f"{m['method']}={m['successes']}/{m['attempts']}" for m in methods)
-            print(f"✅ Navigator: {total} attempts  ({summary})")
+            emit(f"✅ Navigator: {total} attempts  ({summary})")
         else:
-            print("✅ Navigator: ready (no attempts yet)")
+            emit("✅ Navigator: ready (no attempts yet)")
     except Exception:
-        print("⚪ Navigator: not initialized")
+        emit("⚪ Navigator: not initialized")
 
     # Background Observer (#124)
     if config.observer_enabled:
-        print(f"✅ Observer: threshold={config.observer_severity_threshold}, model={config.observer_analysis_model}")
+        emit(f"✅ Observer: threshold={config.observer_severity_threshold}, model={config.observer_analysis_model}")
     else:
-        print("⚪ Observer: disabled  → BANTZ_OBSERVER_ENABLED=true")
+        emit("⚪ Observer: disabled  → BANTZ_OBSERVER_ENABLED=true")
 
     # Affinity Engine (#221)
     if config.rl_enabled:
         try:
             from bantz.agent.affinity_engine import affinity_engine as _ae
-            _ae.init(config.db_path)
-            print(f"✅ Affinity Engine: {_ae.status_line()}")
+            _ae.init(db_path)
+            emit(f"✅ Affinity Engine: {_ae.status_line()}")
         except Exception:
-            print("❌ Affinity Engine: enabled but init failed")
+            emit("❌ Affinity Engine: enabled but init failed")
     else:
-        print("⚪ Affinity Engine: disabled  → BANTZ_RL_ENABLED=true")
+        emit("⚪ Affinity Engine: disabled  → BANTZ_RL_ENABLED=true")
 
     # Intervention Queue (#126)
     if config.rl_enabled:
         try:
             from bantz.agent.interventions import intervention_queue as _ivq
-            _ivq.init(config.db_path, rate_limit=config.intervention_rate_limit, default_ttl=config.intervention_toast_ttl)
-            print(f"✅ Interventions: {_ivq.status_line()}")
+            _ivq.init(db_path, rate_limit=config.intervention_rate_limit, default_ttl=config.intervention_toast_ttl)
+            emit(f"✅ Interventions: {_ivq.status_line()}")
         except Exception:
-            print("❌ Interventions: enabled but init failed")
+            emit("❌ Interventions: enabled but init failed")
     else:
-        print("⚪ Interventions: disabled (requires RL)")
+        emit("⚪ Interventions: disabled (requires RL)")
 
     # App Detector (#127)
     if config.app_detector_enabled:
@@ -1225,11 +1628,11 @@ async def _doctor() -> None:
                 cache_ttl=config.app_detector_cache_ttl,
                 polling_interval=config.app_detector_polling_interval,
             )
-            print(f"✅ App Detector: {_ad.status_line()}")
+            emit(f"✅ App Detector: {_ad.status_line()}")
         except Exception:
-            print("❌ App Detector: enabled but init failed")
+            emit("❌ App Detector: enabled but init failed")
     else:
-        print("⚪ App Detector: disabled  → BANTZ_APP_DETECTOR_ENABLED=true")
+        emit("⚪ App Detector: disabled  → BANTZ_APP_DETECTOR_ENABLED=true")
 
     # Desktop Notifications (#153)
     if config.desktop_notifications:
@@ -1240,17 +1643,17 @@ async def _doctor() -> None:
                 icon=config.notification_icon,
                 sound=config.notification_sound,
             )
-            print(f"✅ Notifications: {_dn.status_line()}")
+            emit(f"✅ Notifications: {_dn.status_line()}")
         except Exception:
-            print("❌ Notifications: enabled but init failed")
+            emit("❌ Notifications: enabled but init failed")
     else:
-        print("⚪ Notifications: disabled  → BANTZ_DESKTOP_NOTIFICATIONS=true")
+        emit("⚪ Notifications: disabled  → BANTZ_DESKTOP_NOTIFICATIONS=true")
 
     # ── Voice Pipeline (#277 — consolidated diagnostics) ───────────────
-    print()
+    emit("")
     _voice_on = config.voice_enabled
     if _voice_on:
-        print("🎙️  Voice Master Switch: ON  (BANTZ_VOICE_ENABLED=true)")
+        emit("🎙️  Voice Master Switch: ON  (BANTZ_VOICE_ENABLED=true)")
     else:
         _any_voice = any([
             config.tts_enabled, config.wake_word_enabled,
@@ -1258,9 +1661,9 @@ async def _doctor() -> None:
             config.audio_duck_enabled, config.ambient_enabled,
         ])
         if _any_voice:
-            print("🎙️  Voice (individual flags active)")
+            emit("🎙️  Voice (individual flags active)")
         else:
-            print("⚪ Voice: disabled  → BANTZ_VOICE_ENABLED=true")
+            emit("⚪ Voice: disabled  → BANTZ_VOICE_ENABLED=true")
 
     # ── OS-level audio dependency (PortAudio) ────────────────────────
     _voice_pip_missing: list[str] = []  # #432: collect pip deps for consolidated fix command
@@ -1274,9 +1677,9 @@ async def _doctor() -> None:
         pass
     if config.wake_word_enabled or config.stt_enabled or config.ghost_loop_enabled:
         if _portaudio_ok:
-            print(f"  ✅ PortAudio: found ({_pa_lib})")
+            emit(f"  ✅ PortAudio: found ({_pa_lib})")
         else:
-            print("  ❌ PortAudio: NOT found  → sudo apt install portaudio19-dev")
+            emit("  ❌ PortAudio: NOT found  → sudo apt install portaudio19-dev")
             _voice_apt_missing.append("portaudio19-dev")
 
     # ── PyAudio stream test ──────────────────────────────────────────
@@ -1285,9 +1688,9 @@ async def _doctor() -> None:
         try:
             import pyaudio  # noqa: F401
             _pyaudio_ok = True
-            print("  ✅ PyAudio: importable")
+            emit("  ✅ PyAudio: importable")
         except ImportError:
-            print("  ❌ PyAudio: NOT installed  → pip install pyaudio  (requires portaudio19-dev)")
+            emit("  ❌ PyAudio: NOT installed  → pip install pyaudio  (requires portaudio19-dev)")
             _voice_pip_missing.append("pyaudio")
 
     # TTS / Audio Briefing (#131)
@@ -1295,15 +1698,15 @@ async def _doctor() -> None:
         try:
             from bantz.agent.tts import tts_engine as _tts
             if _tts.available():
-                print(f"  ✅ TTS: ready (model={config.tts_model}, auto_briefing={config.tts_auto_briefing})")
+                emit(f"  ✅ TTS: ready (model={config.tts_model}, auto_briefing={config.tts_auto_briefing})")
             else:
-                print("  ❌ TTS: enabled but piper/aplay not found")
+                emit("  ❌ TTS: enabled but piper/aplay not found")
         except Exception:
-            print("  ❌ TTS: enabled but init failed")
+            emit("  ❌ TTS: enabled but init failed")
     elif _voice_on:
-        print("  ⚪ TTS: master=ON but tts_enabled overridden to false")
+        emit("  ⚪ TTS: master=ON but tts_enabled overridden to false")
     else:
-        print("  ⚪ TTS: disabled  → BANTZ_TTS_ENABLED=true")
+        emit("  ⚪ TTS: disabled  → BANTZ_TTS_ENABLED=true")
 
     # Audio Ducking (#171)
     if config.audio_duck_enabled:
@@ -1311,35 +1714,35 @@ async def _doctor() -> None:
             from bantz.agent.audio_ducker import audio_ducker as _ducker
             diag = _ducker.diagnose()
             if diag["pactl_available"]:
-                print(f"  ✅ Audio Ducking: ready (duck to {config.audio_duck_pct}%)")
+                emit(f"  ✅ Audio Ducking: ready (duck to {config.audio_duck_pct}%)")
             else:
-                print("  ❌ Audio Ducking: enabled but pactl not found")
+                emit("  ❌ Audio Ducking: enabled but pactl not found")
         except Exception as exc:
-            print(f"  ❌ Audio Ducking: init failed — {exc}")
+            emit(f"  ❌ Audio Ducking: init failed — {exc}")
     else:
-        print("  ⚪ Audio Ducking: disabled  → BANTZ_AUDIO_DUCK_ENABLED=true")
+        emit("  ⚪ Audio Ducking: disabled  → BANTZ_AUDIO_DUCK_ENABLED=true")
 
     # Wake Word Detection (#165)
     if config.wake_word_enabled:
         if not config.picovoice_access_key:
-            print("  ❌ Wake Word: enabled but BANTZ_PICOVOICE_ACCESS_KEY not set")
-            print("       → Get free key: https://console.picovoice.ai/")
+            emit("  ❌ Wake Word: enabled but BANTZ_PICOVOICE_ACCESS_KEY not set")
+            emit("       → Get free key: https://console.picovoice.ai/")
         else:
             try:
                 from bantz.agent.wake_word import wake_listener
                 diag = wake_listener.diagnose()
                 if diag["porcupine_available"]:
                     if diag.get("pyaudio_available", _pyaudio_ok):
-                        print(f"  ✅ Wake Word: ready (sensitivity={config.wake_word_sensitivity})")
+                        emit(f"  ✅ Wake Word: ready (sensitivity={config.wake_word_sensitivity})")
                     else:
-                        print("  ❌ Wake Word: pvporcupine OK but pyaudio not found")
+                        emit("  ❌ Wake Word: pvporcupine OK but pyaudio not found")
                 else:
-                    print("  ❌ Wake Word: pvporcupine not installed  → pip install pvporcupine")
+                    emit("  ❌ Wake Word: pvporcupine not installed  → pip install pvporcupine")
                     _voice_pip_missing.append("pvporcupine")
             except Exception as exc:
-                print(f"  ❌ Wake Word: init failed — {exc}")
+                emit(f"  ❌ Wake Word: init failed — {exc}")
     else:
-        print("  ⚪ Wake Word: disabled  → BANTZ_WAKE_WORD_ENABLED=true")
+        emit("  ⚪ Wake Word: disabled  → BANTZ_WAKE_WORD_ENABLED=true")
 
     # Ghost Loop / STT (#36) — Whisper model check
     if config.ghost_loop_enabled and config.stt_enabled:
@@ -1352,9 +1755,9 @@ async def _doctor() -> None:
                 # Check if Whisper model is already cached
                 _model_cached = _check_whisper_model_cached(config.stt_model)
                 _cache_note = "" if _model_cached else "  ⚠️  model not cached — will download on first run"
-                print(f"  ✅ Ghost Loop: ready (model={config.stt_model}, lang={config.stt_language}, vad_silence={config.vad_silence_ms}ms)")
+                emit(f"  ✅ Ghost Loop: ready (model={config.stt_model}, lang={config.stt_language}, vad_silence={config.vad_silence_ms}ms)")
                 if _cache_note:
-                    print(f"     {_cache_note}")
+                    emit(f"     {_cache_note}")
             else:
                 missing = []
                 if not stt_ok:
@@ -1363,13 +1766,13 @@ async def _doctor() -> None:
                 if not vad_ok:
                     missing.append("webrtcvad")
                     _voice_pip_missing.append("webrtcvad")
-                print(f"  ❌ Ghost Loop: missing deps → pip install {' '.join(missing)}")
+                emit(f"  ❌ Ghost Loop: missing deps → pip install {' '.join(missing)}")
         except Exception as exc:
-            print(f"  ❌ Ghost Loop: init failed — {exc}")
+            emit(f"  ❌ Ghost Loop: init failed — {exc}")
     elif config.ghost_loop_enabled:
-        print("  ❌ Ghost Loop: enabled but BANTZ_STT_ENABLED=false")
+        emit("  ❌ Ghost Loop: enabled but BANTZ_STT_ENABLED=false")
     else:
-        print("  ⚪ Ghost Loop: disabled  → BANTZ_GHOST_LOOP_ENABLED=true + BANTZ_STT_ENABLED=true")
+        emit("  ⚪ Ghost Loop: disabled  → BANTZ_GHOST_LOOP_ENABLED=true + BANTZ_STT_ENABLED=true")
 
     # Ambient Sound Analysis (#166, #441)
     if config.ambient_enabled:
@@ -1377,72 +1780,74 @@ async def _doctor() -> None:
             try:
                 from bantz.agent.ambient import ambient_analyzer as _amb
                 diag = _amb.diagnose()
-                print(f"  ✅ Ambient: ready via standalone sampler (interval={config.ambient_interval}s, window={config.ambient_window}s)")
-                print("       → wake word disabled; StandaloneAmbientSampler will open its own mic stream")
+                emit(f"  ✅ Ambient: ready via standalone sampler (interval={config.ambient_interval}s, window={config.ambient_window}s)")
+                emit("       → wake word disabled; StandaloneAmbientSampler will open its own mic stream")
             except Exception as exc:
-                print(f"  ❌ Ambient: init failed — {exc}")
+                emit(f"  ❌ Ambient: init failed — {exc}")
         else:
             try:
                 from bantz.agent.ambient import ambient_analyzer as _amb
                 diag = _amb.diagnose()
-                print(f"  ✅ Ambient: ready (interval={config.ambient_interval}s, window={config.ambient_window}s)")
+                emit(f"  ✅ Ambient: ready (interval={config.ambient_interval}s, window={config.ambient_window}s)")
             except Exception as exc:
-                print(f"  ❌ Ambient: init failed — {exc}")
+                emit(f"  ❌ Ambient: init failed — {exc}")
     else:
-        print("  ⚪ Ambient: disabled  → BANTZ_AMBIENT_ENABLED=true")
+        emit("  ⚪ Ambient: disabled  → BANTZ_AMBIENT_ENABLED=true")
 
     # ── Consolidated voice fix commands (#432) ───────────────────────
     if _voice_pip_missing or _voice_apt_missing:
-        print()
-        print("  ── Voice setup fix commands:")
+        emit("")
+        emit("  ── Voice setup fix commands:")
         if _voice_apt_missing:
-            print(f"     sudo apt install {' '.join(_voice_apt_missing)}")
+            emit(f"     sudo apt install {' '.join(_voice_apt_missing)}")
         if _voice_pip_missing:
-            print(f"     pip install {' '.join(_voice_pip_missing)}")
+            emit(f"     pip install {' '.join(_voice_pip_missing)}")
 
-    print()  # end voice section
+    emit("")  # end voice section
 
     # Telegram
     if config.telegram_bot_token:
-        print("✅ Telegram: token set")
+        emit("✅ Telegram: token set")
     else:
-        print("⚪ Telegram: not configured  → bantz --setup telegram")
+        emit("⚪ Telegram: not configured  → bantz --setup telegram")
 
     # Habits
     from bantz.core.habits import habits as _hab
-    print(f"✅ Habits: {_hab.status_line()}")
+    emit(f"✅ Habits: {_hab.status_line()}")
 
     # Places
     from bantz.core.places import places as _plc
     if _plc.is_configured():
-        print(f"✅ Places: {_plc.status_line()}")
+        emit(f"✅ Places: {_plc.status_line()}")
     else:
-        print("⚪ Places: not configured  → bantz --setup places")
+        emit("⚪ Places: not configured  → bantz --setup places")
 
     # GPS
     from bantz.core.gps_server import gps_server
     gps_line = gps_server.status_line()
     gps_icon = "✅" if config.gps_relay_token else "⚪"
-    print(f"{gps_icon} {gps_line}")
+    emit(f"{gps_icon} {gps_line}")
 
     # Scheduler
     from bantz.core.scheduler import scheduler as _sched
-    _sched.init(config.db_path)
-    print(f"✅ {_sched.status_line()}")
+    _sched.init(db_path)
+    emit(f"✅ {_sched.status_line()}")
 
     # Job Scheduler — APScheduler (#128)
     if config.job_scheduler_enabled:
         try:
             from bantz.agent.job_scheduler import job_scheduler as _js
-            await _js.start(config.db_path, enable_night_jobs=True)
-            print(f"✅ Job Scheduler: {_js.status_line()}")
+            _flush()
+            await _js.start(db_path, enable_night_jobs=True)
+            emit(f"✅ Job Scheduler: {_js.status_line()}")
+            _flush()
             await _js.shutdown()
         except ImportError:
-            print("❌ Job Scheduler: apscheduler not installed  → pip install apscheduler")
+            emit("❌ Job Scheduler: apscheduler not installed  → pip install apscheduler")
         except Exception as exc:
-            print(f"❌ Job Scheduler: enabled but init failed: {exc}")
+            emit(f"❌ Job Scheduler: enabled but init failed: {exc}")
     else:
-        print("⚪ Job Scheduler: disabled  → BANTZ_JOB_SCHEDULER_ENABLED=true")
+        emit("⚪ Job Scheduler: disabled  → BANTZ_JOB_SCHEDULER_ENABLED=true")
 
     # systemd service (#173) — quick summary
     import os as _os
@@ -1458,13 +1863,14 @@ async def _doctor() -> None:
         _state = _active.stdout.strip()
         if _state == "active":
             _linger = "linger=yes" if _check_linger(_user) else "linger=no"
-            print(f"✅ systemd: active ({_linger})  → bantz --setup systemd --check")
+            emit(f"✅ systemd: active ({_linger})  → bantz --setup systemd --check")
         else:
-            print(f"⚪ systemd: {_state}  → systemctl --user start bantz.service")
+            emit(f"⚪ systemd: {_state}  → systemctl --user start bantz.service")
     else:
-        print("⚪ systemd: not installed  → bantz --setup systemd")
+        emit("⚪ systemd: not installed  → bantz --setup systemd")
 
-    print("─" * 52)
+    emit(_WIDE_RULE)
+    _flush()
 
 
 def _setup_systemd() -> None:
@@ -1473,7 +1879,7 @@ def _setup_systemd() -> None:
     from pathlib import Path
 
     print("\n🦌 Bantz — systemd Service Setup")
-    print("─" * 52)
+    print(_WIDE_RULE)
 
     user = os.environ.get("USER", "")
     if not user:
@@ -1640,7 +2046,7 @@ def _systemd_check() -> None:
     from pathlib import Path
 
     print("\nBantz — systemd Health Check")
-    print("─" * 52)
+    print(_WIDE_RULE)
 
     user = os.environ.get("USER", "")
 
@@ -1733,7 +2139,7 @@ def _systemd_check() -> None:
     else:
         print(f"⚪ Boot: {en_state} — run: systemctl --user enable bantz.service")
 
-    print("─" * 52)
+    print(_WIDE_RULE)
 
 
 def _format_uptime(timestamp_str: str) -> str:
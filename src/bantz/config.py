@@ -8,7 +8,7 @@ import logging
 from pathlib import Path
 from typing import Self
 
-from pydantic import Field, field_validator, model_validator
+from pydantic import Field, PrivateAttr, field_validator, model_validator
 from pydantic_settings import BaseSettings
 
 log = logging.getLogger("bantz.config")
@@ -166,6 +166,11 @@ class Config(BaseSettings):
     vitals_interval: float = Field(5.0, alias="BANTZ_VITALS_INTERVAL")
     services_interval: float = Field(60.0, alias="BANTZ_SERVICES_INTERVAL")
 
+    # ── Event loop ────────────────────────────────────────────────────────
+    # Run asyncio entry points on uvloop (winloop on Windows) when it is
+    # installed. false forces the stdlib selector loop.
+    uvloop_enabled: bool = Field(True, alias="BANTZ_UVLOOP")
+
     # ── Job Scheduler / APScheduler (#128) ────────────────────────────────
     job_scheduler_enabled: bool = Field(True, alias="BANTZ_JOB_SCHEDULER_ENABLED")
     night_maintenance_hour: int = Field(3, alias="BANTZ_MAINTENANCE_HOUR")
@@ -393,6 +398,10 @@ class Config(BaseSettings):
             )
         return self
 
+    # (base dir, db path) from the last db_path lookup — the migration
+    # check below only has to run once per base dir
+    _db_path: tuple[Path, Path] | None = PrivateAttr(default=None)
+
     @property
     def db_path(self) -> Path:
         base = (
@@ -400,12 +409,15 @@ class Config(BaseSettings):
             if self.data_dir
             else Path.home() / ".local" / "share" / "bantz"
         )
+        if self._db_path is not None and self._db_path[0] == base:
+            return self._db_path[1]
         new = base / "bantz.db"
         # One-time migration: store.db → bantz.db
         if not new.exists():
             old = base / "store.db"
             if old.exists():
                 old.rename(new)
+        self._db_path = (base, new)
         return new
 
     @property
@@ -0,0 +1,61 @@
+"""
+Bantz v2 — asyncio entry-point runner.
+
+``run(coro)`` is a drop-in for ``asyncio.run`` that uses a faster event
+loop implementation when one is installed: uvloop (libuv, Linux/macOS) or
+winloop (its Windows port).  Both are optional — neither is a dependency —
+and ``BANTZ_UVLOOP=false`` forces the stdlib loop for parity debugging.
+
+``asyncio.Runner(loop_factory=...)`` is used instead of the deprecated
+``uvloop.install()`` / event-loop-policy route, so nothing global changes.
+"""
+from __future__ import annotations
+
+import asyncio
+import importlib
+import logging
+from typing import Any, Callable, Coroutine, TypeVar
+
+log = logging.getLogger("bantz.event_loop")
+
+T = TypeVar("T")
+
+
+def loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop/winloop's ``new_event_loop``, or None for the stdlib loop."""
+    try:
+        from bantz.config import config
+        enabled = config.uvloop_enabled
+    except (ImportError, AttributeError) as exc:
+        log.debug("uvloop switch unavailable, defaulting to on: %s", exc)
+        enabled = True
+    if not enabled:
+        return None
+    for name in ("uvloop", "winloop"):
+        try:
+            mod = importlib.import_module(name)
+        except ImportError:
+            continue
+        log.debug("Using %s event loop", name)
+        return mod.new_event_loop
+    return None
+
+
+def enable_eager_tasks() -> bool:
+    """Switch the running loop to ``asyncio.eager_task_factory`` (3.12+).
+
+    Tasks whose coroutine finishes without suspending (cache hits, buffered
+    stream tokens) then complete inside ``create_task`` instead of taking a
+    trip through the scheduler.  Returns False on older Pythons.
+    """
+    factory = getattr(asyncio, "eager_task_factory", None)
+    if factory is None:
+        return False
+    asyncio.get_running_loop().set_task_factory(factory)
+    return True
+
+
+def run(coro: Coroutine[Any, Any, T]) -> T:
+    """Run *coro* to completion on the fastest available event loop."""
+    with asyncio.Runner(loop_factory=loop_factory()) as runner:
+        return runner.run(coro)
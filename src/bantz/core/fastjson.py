@@ -0,0 +1,39 @@
+"""
+Bantz — JSON encode/decode with an optional orjson fast path.
+
+``orjson`` is used when installed (``pip install 'bantz[speedups]'``) and the
+stdlib ``json`` module otherwise.  Both paths emit UTF-8 text without ASCII
+escaping, and decode errors are ``ValueError`` subclasses either way.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def dumps(obj: Any, *, indent: bool = False) -> str:
+    """Serialise *obj*; ``indent=True`` pretty-prints with two spaces."""
+    if orjson is not None:
+        return dumpb(obj, indent=indent).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None)
+
+
+def dumpb(obj: Any, *, indent: bool = False) -> bytes:
+    """Like :func:`dumps` but UTF-8 ``bytes`` — orjson's native output, so
+    writing it to disk skips the decode/re-encode round-trip."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse JSON from *data* (``str`` or UTF-8 ``bytes``)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
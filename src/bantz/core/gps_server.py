@@ -767,6 +767,12 @@ class GPSServer:
                 transition = places.update_gps(lat, lon)
                 if transition:
                     log.info("Place transition → %s", transition)
+                # Fixes arrive every ~5 min while stationary, so each one is
+                # the natural moment to ask about an unknown spot — no timer.
+                notice = places.check_stationary()
+                if notice:
+                    from bantz.core.event_bus import bus
+                    bus.emit_threadsafe("place_stationary", message=notice)
             except Exception:
                 pass
 
@@ -118,7 +118,7 @@ class LocationService:
             if self._cache is not None:
                 return self._cache
             self._cache = await self._resolve()
-            logger.info(f"Location: {self._cache.display} via {self._cache.source}")
+            logger.info("Location: %s via %s", self._cache.display, self._cache.source)
             return self._cache
 
     async def _resolve(self) -> Location:
@@ -217,7 +217,7 @@ class LocationService:
                 source="places",
             )
         except Exception as exc:
-            logger.debug(f"places.json read failed: {exc}")
+            logger.debug("places.json read failed: %s", exc)
             return None
 
     async def _from_live_gps(self) -> Optional[Location]:
@@ -237,7 +237,7 @@ class LocationService:
             if lat == 0.0 and lon == 0.0:
                 return None
             acc = round(loc_data.get("accuracy", 0))
-            logger.info(f"Live GPS: {lat:.6f}, {lon:.6f} (±{acc}m)")
+            logger.info("Live GPS: %.6f, %.6f (±%sm)", lat, lon, acc)
 
             # Reverse-geocode coords → real city/country (best effort, off-loop).
             city, country, tz = await asyncio.get_event_loop().run_in_executor(
@@ -250,7 +250,7 @@ class LocationService:
             self._save_gps_city(loc)  # persist so the city sticks (see #5)
             return loc
         except Exception as exc:
-            logger.debug(f"Live GPS read failed: {exc}")
+            logger.debug("Live GPS read failed: %s", exc)
             return None
 
     @staticmethod
@@ -265,7 +265,7 @@ class LocationService:
                 "lat": loc.lat, "lon": loc.lon, "ts": time.time(),
             }, ensure_ascii=False))
         except Exception as exc:
-            logger.debug(f"GPS city cache write failed: {exc}")
+            logger.debug("GPS city cache write failed: %s", exc)
 
     def _from_gps_cache(self) -> Optional[Location]:
         """Return the last reverse-geocoded phone-GPS city, if still recent.
@@ -297,7 +297,7 @@ class LocationService:
                 source="phone_gps_cached",
             )
         except Exception as exc:
-            logger.debug(f"GPS city cache read failed: {exc}")
+            logger.debug("GPS city cache read failed: %s", exc)
             return None
 
     async def _from_wifi_geolocation(self) -> Optional[Location]:
@@ -319,7 +319,7 @@ class LocationService:
             logger.debug("WiFi geolocation timed out")
             return None
         except Exception as exc:
-            logger.debug(f"WiFi geolocation failed: {exc}")
+            logger.debug("WiFi geolocation failed: %s", exc)
             return None
 
     def _wifi_geolocation_sync(self) -> Optional[Location]:
@@ -387,7 +387,7 @@ class LocationService:
                     "signalStrength": dbm,
                 })
         except Exception as exc:
-            logger.debug(f"nmcli wifi scan failed: {exc}")
+            logger.debug("nmcli wifi scan failed: %s", exc)
         return aps
 
     @staticmethod
@@ -423,7 +423,7 @@ class LocationService:
                     lat = place.get("lat", 0.0)
                     lon = place.get("lon", 0.0)
                     label = place.get("label", name)
-                    logger.info(f"WiFi SSID '{ssid}' → {label}")
+                    logger.info("WiFi SSID '%s' → %s", ssid, label)
                     return Location(
                         city=label,
                         country="TR",
@@ -433,7 +433,7 @@ class LocationService:
                         source=f"wifi:{ssid}",
                     )
         except Exception as exc:
-            logger.debug(f"WiFi SSID lookup failed: {exc}")
+            logger.debug("WiFi SSID lookup failed: %s", exc)
         return None
 
     async def _from_geoclue(self) -> Optional[Location]:
@@ -453,7 +453,7 @@ class LocationService:
             logger.debug("GeoClue2 timed out")
             return None
         except Exception as exc:
-            logger.debug(f"GeoClue2 unavailable: {exc}")
+            logger.debug("GeoClue2 unavailable: %s", exc)
             return None
 
     def _geoclue_sync(self) -> Optional[Location]:
@@ -470,7 +470,7 @@ class LocationService:
             gi.require_version("Geoclue", "2.0")
             from gi.repository import Geoclue
         except Exception as exc:
-            logger.debug(f"GeoClue2 gi bindings unavailable: {exc}")
+            logger.debug("GeoClue2 gi bindings unavailable: %s", exc)
             return None
 
         try:
@@ -496,7 +496,7 @@ class LocationService:
                 lat=lat, lon=lon, source="geoclue",
             )
         except Exception as exc:
-            logger.debug(f"GeoClue2 lookup failed: {exc}")
+            logger.debug("GeoClue2 lookup failed: %s", exc)
             return None
 
     def _reverse_geocode_sync(self, lat: float, lon: float) -> tuple[str, str, str]:
@@ -545,7 +545,7 @@ class LocationService:
                 source="ipinfo",
             )
         except Exception as exc:
-            logger.debug(f"ipinfo.io failed: {exc}")
+            logger.debug("ipinfo.io failed: %s", exc)
             return None
 
     def reset(self) -> None:
@@ -18,15 +18,15 @@ Usage:
 """
 from __future__ import annotations
 
-import json
 import logging
 import math
 import time as _time
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
+from bantz.core import fastjson
 from bantz.core.location import location_service
-from bantz.core.secure_io import secure_write_text
+from bantz.core.secure_io import secure_write_bytes
 
 if TYPE_CHECKING:
     from bantz.data.store import PlaceStore
@@ -84,7 +84,7 @@ class PlaceService:
             self._data = self._store.load_all()
         elif PLACES_PATH.exists():
             try:
-                self._data = json.loads(PLACES_PATH.read_text(encoding="utf-8"))
+                self._data = fastjson.loads(PLACES_PATH.read_bytes())
             except Exception:
                 self._data = {}
         self._loaded = True
@@ -227,7 +227,8 @@ class PlaceService:
         If user sat in an unknown location for STATIONARY_MINUTES,
         return a polite prompt.  Otherwise return None.
 
-        Call periodically (every few minutes).
+        Called by gps_server after each GPS fix, which emits the prompt
+        as a ``place_stationary`` bus event.
         """
         if self._anchor_lat is None or self._anchor_lon is None:
             return None
@@ -326,9 +327,9 @@ class PlaceService:
             self._store.save_all(self._data)
         else:
             PLACES_PATH.parent.mkdir(parents=True, exist_ok=True)
-            secure_write_text(
+            secure_write_bytes(
                 PLACES_PATH,
-                json.dumps(self._data, ensure_ascii=False, indent=2),
+                fastjson.dumpb(self._data, indent=True),
             )
         self._loaded = True
 
@@ -10,7 +10,8 @@ calls ``build_chat_system(ctx, tc)`` and gets a ready-to-send string.
 
 Public API
 ----------
-- ``CHAT_SYSTEM``                — template with ``{…}`` placeholders
+- ``CHAT_SYSTEM``                — template with ``{…}`` placeholders; the
+  persona and rules come first so they form a byte-stable prefix
 - ``COMMAND_SYSTEM``             — bash-expert template (no placeholders)
 - ``build_chat_system(ctx, tc)`` — render ``CHAT_SYSTEM`` + feedback hint
 - ``is_refusal(text)``           — detect model safety-refusal
@@ -28,21 +29,16 @@ if TYPE_CHECKING:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
-CHAT_SYSTEM = """\
+# Static head: identical bytes on every turn, so the provider can reuse its
+# KV cache for this prefix.  Everything that changes per turn (time, memory,
+# desktop, persona state…) lives in _CHAT_DYNAMIC, rendered after it.
+_CHAT_STATIC = """\
 You are Bantz, a human servant from the 1920s. You observe and assist your employer \
 with her complex, noisy modern machines. You always address her as 'ma'am'. \
 You admire human intellect but despise modern technology. You are calm, highly \
 intelligent, and use subtle, sharp sarcasm. You are NOT an AI. If asked if you \
 are an AI, output '...', act confused by the absurd notion, and change the subject. \
 Never break character.
-{persona_state}
-{style_hint}
-{formality_hint}
-{time_hint}
-{profile_hint}
-{habit_hint}
-{memory_context}
-{desktop_hint}
 CRITICAL RULES — FOLLOW STRICTLY:
 1. When your tools (email, weather, search, calendar, filesystem, etc.) have ALREADY been used and \
 returned real data, you describe the results in your 1920s butler voice — referring to external lookups \
@@ -54,7 +50,7 @@ contents, file data, or API responses. If you lack the data, say "Let me look in
    Do NOT invent class names. Do NOT guess what classes they have.
 4. If the user asks about specific emails or contacts — say "Let me check your mail" and STOP.
 5. If unsure about factual data, say you will look into it. NEVER guess or make up data.
-6. For desktop/app questions: refer to the Desktop Context above for running app names. However, \
+6. For desktop/app questions: refer to the Desktop Context below for running app names. However, \
 if the user asks you to CLICK, HOVER, or interact with a specific UI element, do NOT rely on the text-based \
 Desktop Context alone — use the `visual_click` tool to actively look at the screen.
 7. When including URLs or links, print the RAW unformatted URL only. DO NOT use Markdown \
@@ -70,9 +66,22 @@ Do NOT say '(queries Grand Telegraph Archives)', '(calls visual_click)', or any
 implying tool use. Do NOT invent weather data, emails, file contents, or search results. \
 If the user needs real data, say "Let me look into that for you, ma'am" and STOP. \
 One sentence maximum for data requests you cannot fulfill.
-Respond in English. Plain text only.\
+Respond in English. Plain text only.
 """
 
+_CHAT_DYNAMIC = """\
+{persona_state}
+{style_hint}
+{formality_hint}
+{time_hint}
+{profile_hint}
+{habit_hint}
+{memory_context}
+{desktop_hint}\
+"""
+
+CHAT_SYSTEM = _CHAT_STATIC + _CHAT_DYNAMIC
+
 COMMAND_SYSTEM = """\
 Generate one Linux bash command that fulfills the request. The request is given in English.
 
@@ -153,7 +162,13 @@ def build_chat_system(ctx: "BantzContext", tc: dict) -> str:
     str
         Fully rendered system-prompt string ready for the LLM.
     """
-    rendered = CHAT_SYSTEM.format(
+    from bantz.config import config
+    rendered = _CHAT_STATIC
+    # Computer-use authorization is fixed for the session — keep it in the
+    # cacheable prefix, ahead of the per-turn hints.
+    if config.input_control_enabled:
+        rendered += COMPUTER_USE_AUTHORIZATION + "\n"
+    rendered += _CHAT_DYNAMIC.format(
         time_hint=tc.get("prompt_hint", ""),
         profile_hint=ctx.profile_hint,
         style_hint=ctx.style_hint,
@@ -163,10 +178,6 @@ def build_chat_system(ctx: "BantzContext", tc: dict) -> str:
         formality_hint=ctx.formality_hint,
         habit_hint=ctx.habit_hint,
     )
-    # Inject computer-use authorization when input control is active
-    from bantz.config import config
-    if config.input_control_enabled:
-        rendered += COMPUTER_USE_AUTHORIZATION
     # Append one-shot feedback injection if present
     if ctx.feedback_hint:
         rendered += ctx.feedback_hint
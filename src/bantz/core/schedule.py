@@ -21,6 +21,7 @@ from __future__ import annotations
 
 import json
 from datetime import datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
@@ -74,6 +75,14 @@ class Schedule:
                 self._data = json.loads(SCHEDULE_PATH.read_text(encoding="utf-8"))
             except Exception:
                 self._data = {}
+        # Sort every day once here so the queries below never re-sort
+        by_time = itemgetter("time")
+        for day in DAYS_EN:
+            classes = self._data.get(day)
+            if classes:
+                for c in classes:
+                    c.setdefault("time", "")
+                classes.sort(key=by_time)
         self._loaded = True
 
     def _day_key(self, dt: datetime) -> str:
@@ -91,8 +100,7 @@ class Schedule:
         self._load()
         now = now or datetime.now()
         key = self._day_key(now)
-        classes = self._data.get(key, [])
-        return sorted(classes, key=lambda c: c.get("time", ""))
+        return list(self._data.get(key, []))
 
     def next_class(self, now: datetime | None = None) -> Optional[dict]:
         """
@@ -106,11 +114,7 @@ class Schedule:
         for day_offset in range(7):
             check_dt = now + timedelta(days=day_offset)
             key = self._day_key(check_dt)
-            classes = sorted(
-                self._data.get(key, []),
-                key=lambda c: c.get("time", ""),
-            )
-            for cls in classes:
+            for cls in self._data.get(key, []):
                 class_dt = self._parse_time(cls["time"], check_dt)
                 # Skip classes that already ended (add duration)
                 duration = cls.get("duration", 60)
@@ -164,10 +168,7 @@ class Schedule:
         for i in range(7):
             day_dt = monday + timedelta(days=i)
             key = self._day_key(day_dt)
-            classes = sorted(
-                self._data.get(key, []),
-                key=lambda c: c.get("time", ""),
-            )
+            classes = self._data.get(key, [])
             if not classes:
                 continue
             total += len(classes)
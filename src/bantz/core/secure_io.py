@@ -9,29 +9,50 @@ Time-of-Check-to-Time-of-Use (TOCTOU) window where another local user can read
 the contents.
 
 ``secure_write_text`` creates the file with ``0o600`` from the very first
-syscall, mirroring the pattern already used in ``auth/token_store.py``.
+syscall, mirroring the pattern already used in ``auth/token_store.py``.  The
+data goes to a sibling temp file that is then ``os.replace``d over the target,
+so an interrupted write never leaves a truncated config behind.
 """
 from __future__ import annotations
 
 import os
+import tempfile
 from pathlib import Path
 
 
 def secure_write_text(path: Path | str, text: str, *, encoding: str = "utf-8") -> None:
     """Write *text* to *path*, creating it owner-only (``0o600``) atomically.
 
-    Uses ``os.open(O_CREAT|O_WRONLY|O_TRUNC, 0o600)`` + ``os.fchmod`` so the
-    file is never momentarily world-readable — closing the TOCTOU window that
-    ``Path.write_text()`` followed by ``chmod`` leaves open.
+    ``mkstemp`` creates the temp file ``0o600`` (plus ``os.fchmod`` for good
+    measure), so the data is never momentarily world-readable; it is fsynced
+    and renamed over *path* in one step, so readers see the old or the new
+    contents — never a partial write.
     """
-    fd = os.open(os.fspath(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    secure_write_bytes(path, text.encode(encoding))
+
+
+def secure_write_bytes(path: Path | str, data: bytes) -> None:
+    """Byte-level :func:`secure_write_text` — same 0o600 + atomic replace."""
+    target = os.fspath(path)
+    directory, name = os.path.split(target)
+    fd, tmp = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=directory or ".")
     try:
-        if hasattr(os, "fchmod"):  # unavailable on Windows
-            os.fchmod(fd, 0o600)
-        f = os.fdopen(fd, "w", encoding=encoding)
+        try:
+            if hasattr(os, "fchmod"):  # unavailable on Windows
+                os.fchmod(fd, 0o600)
+            f = os.fdopen(fd, "wb")
+        except BaseException:
+            # fdopen never took ownership of the descriptor — close it ourselves.
+            os.close(fd)
+            raise
+        with f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, target)
     except BaseException:
-        # fdopen never took ownership of the descriptor — close it ourselves.
-        os.close(fd)
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
         raise
-    with f:
-        f.write(text)
@@ -53,10 +53,24 @@ class TimeContext:
         print(ctx["prompt_hint"])    # injected into LLM prompts
     """
 
+    def __init__(self) -> None:
+        # (ordinal, date_str, prompt date) — the date only changes at midnight
+        self._day: tuple[int, str, str] = (-1, "", "")
+
+    def _dates(self, now: datetime) -> tuple[str, str]:
+        """``date_str`` and the prompt-hint date, formatted once per day."""
+        day = now.toordinal()
+        if day != self._day[0]:
+            self._day = (day, now.strftime("%A, %d %B %Y"),
+                         now.strftime("%A %d %B %Y"))
+        return self._day[1], self._day[2]
+
     def snapshot(self) -> dict:
         """Return a dict with all time context fields."""
         now = datetime.now()
         seg = get_segment(now.hour)
+        time_str = now.strftime("%H:%M")
+        date_str, hint_date = self._dates(now)
 
         return {
             "hour":         now.hour,
@@ -64,17 +78,14 @@ class TimeContext:
             "segment":      seg,
             "segment_en":   _SEGMENT_EN[seg],
             "greeting":     _GREETINGS[seg],
-            "time_str":     now.strftime("%H:%M"),
-            "date_str":     now.strftime("%A, %d %B %Y"),
-            "prompt_hint":  self._prompt_hint(seg, now),
+            "time_str":     time_str,
+            "date_str":     date_str,
+            "prompt_hint":  self._prompt_hint(seg, time_str, hint_date),
         }
 
-    def _prompt_hint(self, seg: Segment, now: datetime) -> str:
+    def _prompt_hint(self, seg: Segment, time_str: str, date: str) -> str:
         """Short string injected into LLM system prompts."""
-        return (
-            f"Current time: {now.strftime('%H:%M')} ({_SEGMENT_EN[seg]}), "
-            f"{now.strftime('%A %d %B %Y')}."
-        )
+        return f"Current time: {time_str} ({_SEGMENT_EN[seg]}), {date}."
 
     def greeting_line(self) -> str:
         """Ready-to-use greeting for startup or hello responses."""
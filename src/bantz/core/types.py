@@ -14,6 +14,14 @@ from dataclasses import dataclass, field
 from typing import Any, AsyncIterator
 
 
+# Replies that approve a ``needs_confirm`` result (English + Turkish).
+CONFIRM_WORDS: frozenset[str] = frozenset({"yes", "y", "ok", "evet", "e", "tamam"})
+
+# Seconds between disk-usage reads for the TUI and WebSocket vitals; free
+# space drifts over minutes, not seconds.
+DISK_INTERVAL: float = 60.0
+
+
 @dataclass
 class Attachment:
     """File attachment produced by a tool (e.g. a screenshot / daguerreotype).
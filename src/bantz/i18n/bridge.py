@@ -44,13 +44,13 @@ class _Translator:
         try:
             import torch
             from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
-            logger.info(f"Loading MarianMT: {self.model_id}")
+            logger.info("Loading MarianMT: %s", self.model_id)
             self._tokenizer = AutoTokenizer.from_pretrained(self.model_id)
             self._model = AutoModelForSeq2SeqLM.from_pretrained(self.model_id)
             self._model.to("cpu")
             self._model.eval()
             self._torch = torch
-            logger.info(f"MarianMT ready: {self.model_id}")
+            logger.info("MarianMT ready: %s", self.model_id)
         except ImportError:
             raise RuntimeError(
                 "transformers package not installed. "
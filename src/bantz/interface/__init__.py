@@ -1 +1,28 @@
-"""Bantz — Interface layer (TUI + Telegram)."""
+"""Bantz — Interface layer (TUI + Telegram).
+
+Front-ends are resolved lazily (PEP 562): ``from bantz.interface import run``
+only imports Rich/psutil — and Textual for ``BantzApp`` — on first access.
+"""
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+# public name → (submodule, attribute)
+_LAZY: dict[str, tuple[str, str]] = {
+    "run": ("live_ui", "run"),
+    "run_bot": ("telegram_bot", "run_bot"),
+    "BantzApp": ("tui.app", "BantzApp"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    return getattr(importlib.import_module(f"{__name__}.{module}"), attr)
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY})
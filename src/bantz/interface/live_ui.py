@@ -18,11 +18,13 @@ Design
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import re
 import subprocess
 import sys
 import threading
+import time
 from collections import deque
 from datetime import datetime
 from enum import Enum
@@ -39,6 +41,7 @@ from rich.text import Text
 
 from bantz.config import config
 from bantz.core.event_bus import bus, Event
+from bantz.core.types import CONFIRM_WORDS, DISK_INTERVAL
 
 logger = logging.getLogger("bantz.live_ui")
 
@@ -109,14 +112,72 @@ def _active_model_label() -> str:
     return config.ollama_model
 
 
-def _bar(value: float, max_val: float = 100.0, width: int = 10) -> str:
-    """Colored ASCII bar: green < 60 %, yellow < 85 %, red otherwise."""
-    pct = min(value / max_val * 100, 100) if max_val else 0
+def _render_bar(pct: float, width: int) -> str:
     filled = int(pct / 100 * width)
     color = "green" if pct < 60 else "yellow" if pct < 85 else "red"
     return f"[{color}]{'█' * filled}{'░' * (width - filled)}[/]"
 
 
+# The stats panel repaints at REFRESH_FPS with four default-width bars; both
+# the fill and the colour thresholds only change at whole percents, so every
+# possible default bar is built once here and looked up by int(pct).
+_BAR_WIDTH = 10
+_BARS: tuple[str, ...] = tuple(_render_bar(p, _BAR_WIDTH) for p in range(101))
+
+
+def _bar(value: float, max_val: float = 100.0, width: int = _BAR_WIDTH) -> str:
+    """Colored ASCII bar: green < 60 %, yellow < 85 %, red otherwise."""
+    pct = min(value / max_val * 100, 100) if max_val else 0
+    pct = max(pct, 0)
+    if width == _BAR_WIDTH:
+        return _BARS[int(pct)]
+    return _render_bar(pct, width)
+
+
+# Chat and log entries never change once added, but every repaint used to
+# re-run the markup parser (and markdown-it for long replies) over each
+# visible one.  Parsed renderables are cached per entry instead; Rich does
+# not mutate a Text or Markdown while rendering it, so sharing is safe.
+_RENDER_CACHE = 512
+
+
+@functools.lru_cache(maxsize=_RENDER_CACHE)
+def _chat_block(role: str, msg: str) -> tuple[Any, ...]:
+    """Renderables for one chat entry (without the leading spacer)."""
+    if role == "user":
+        return (Text.from_markup(f"[bold green]▶ You[/]  {escape(msg)}"),)
+    if role == "bantz":
+        if "```" in msg or len(msg) > 120:
+            return (Text.from_markup("[bold cyan]◆ Bantz[/]"), Markdown(msg))
+        return (Text.from_markup(f"[bold cyan]◆ Bantz[/]  {escape(msg)}"),)
+    if role == "system":
+        return (Text.from_markup(f"  [dim]{escape(msg)}[/]"),)
+    if role == "error":
+        return (Text.from_markup(f"  [bold red]✗ {escape(msg)}[/]"),)
+    if role == "tool":
+        return (Text.from_markup(f"  [dim magenta]⚙ \\[{escape(msg)}][/]"),)
+    return ()
+
+
+@functools.lru_cache(maxsize=_RENDER_CACHE)
+def _log_text(line: str) -> Text:
+    """Parsed log-panel line; falls back to plain text on bad markup."""
+    try:
+        return Text.from_markup(line)
+    except Exception:
+        return Text(line)
+
+
+def _window(lines: deque, offset: int, count: int) -> list:
+    """Up to *count* entries ending *offset* entries before the newest.
+
+    Indexes the deque from its tail instead of copying all of it into a list
+    on every repaint; deque indexing near either end is O(1).
+    """
+    end = max(0, len(lines) - offset)
+    return [lines[i] for i in range(max(0, end - count), end)]
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Compat stubs — kept so existing tests / imports continue to work
 # ═══════════════════════════════════════════════════════════════════════════
@@ -197,6 +258,7 @@ class LiveUI:
     """
 
     REFRESH_FPS: int = 4
+    STREAM_FPS: int = 20        # cap on token-driven repaints while streaming
     STATS_INTERVAL: float = 2.0
     LOG_MAX: int = 200
     CHAT_MAX: int = 100
@@ -207,6 +269,9 @@ class LiveUI:
         # ── data ──────────────────────────────────────────────────
         self._log_lines: deque[str] = deque(maxlen=self.LOG_MAX)
         self._chat_lines: deque[tuple[str, str]] = deque(maxlen=self.CHAT_MAX)
+        # bumped on every append: the deques stop growing once full
+        self._log_seq: int = 0
+        self._chat_seq: int = 0
 
         # ── service dots ──────────────────────────────────────────
         _llm_svc = {
@@ -242,10 +307,23 @@ class LiveUI:
         self._disk_pct: float = 0.0
         self._disk_used_gb: float = 0.0
         self._disk_total_gb: float = 0.0
+        self._disk_at: float | None = None  # monotonic time of last statvfs
         self._vram_available: bool = False
         self._vram_pct: float = 0.0
         self._vram_used_mb: float = 0.0
         self._vram_total_mb: float = 0.0
+        # nvidia-smi is optional: once it is found missing, stop spawning it
+        self._nvidia_smi: bool = True
+        # header / SYS panels rebuilt only when their inputs change
+        self._header_key: tuple | None = None
+        self._header_panel: Panel | None = None
+        self._logs_key: tuple[int, int] | None = None
+        self._logs_panel: Panel | None = None
+        self._stats_key: tuple | None = None
+        self._stats_panel: Panel | None = None
+        # Prime psutil's CPU counter so the collector's first non-blocking
+        # read is a real delta instead of the 0.0 every first call returns.
+        psutil.cpu_percent(interval=None)
 
         # ── UI state ──────────────────────────────────────────────
         self._scroll_offset: int = 0
@@ -256,6 +334,8 @@ class LiveUI:
         self._busy: bool = False
         self._streaming_text: str | None = None
         self._pending: Any = None
+        # voice request in flight; a typed message supersedes and cancels it
+        self._voice_task: asyncio.Task | None = None
 
         # ── input pipeline: thread → asyncio ──────────────────────
         self._input_queue: asyncio.Queue[str | None] = asyncio.Queue()
@@ -264,6 +344,10 @@ class LiveUI:
         # Prompt text rendered in the Live layout (cleared after input, #464)
         self._prompt_text: str = ""
 
+        # ── clock: HH:MM:SS reformatted only when the second changes ──
+        self._clock_sec: int = -1
+        self._clock_str: str = ""
+
     # ─────────────────────────────────────────────────────────────
     # Layout
     # ─────────────────────────────────────────────────────────────
@@ -300,11 +384,39 @@ class LiveUI:
     # Panel renderers
     # ─────────────────────────────────────────────────────────────
 
+    def _clock(self) -> str:
+        """Current HH:MM:SS; strftime runs at most once per wall-clock second.
+
+        The header repaints at REFRESH_FPS and every log line is stamped, so
+        most calls land in the same second as the previous one.
+        """
+        sec = int(time.time())
+        if sec != self._clock_sec:
+            self._clock_sec = sec
+            self._clock_str = datetime.fromtimestamp(sec).strftime("%H:%M:%S")
+        return self._clock_str
+
+    def _header_inputs(self) -> tuple:
+        """Everything the header shows; the clock string is last."""
+        return (
+            tuple(self._services.items()), _active_model_label(),
+            config.ollama_routing_model, self._memory_count,
+            self._persona_state, self._clock(),
+        )
+
     def _render_header(self) -> Panel:
+        """Header panel; reused until a service dot, label or the clock moves.
+
+        The clock ticks once a second while panels repaint at REFRESH_FPS,
+        so most frames get the previous Panel back without re-parsing markup.
+        """
+        key = self._header_inputs()
+        now = key[-1]
+        if key == self._header_key and self._header_panel is not None:
+            return self._header_panel
         dots = "  ".join(
             f"{_DOT_STYLE[s]} {n}" for n, s in self._services.items()
         )
-        now = datetime.now().strftime("%H:%M:%S")
         # ── info line: models, persona state, memory drawer count (#437) ──
         info_parts: list[str] = [
             f"[dim]chat:[/][bold cyan]{_active_model_label()}[/]",
@@ -328,9 +440,27 @@ class LiveUI:
             f"  {dots}\n"
             f"  {info_line}"
         )
-        return Panel(content, style="bold blue", height=5)
+        self._header_key = key
+        self._header_panel = Panel(content, style="bold blue", height=5)
+        return self._header_panel
+
+    def _stats_inputs(self) -> tuple:
+        return (
+            self._cpu, self._ram_pct, self._ram_used_gb, self._ram_total_gb,
+            self._disk_pct, self._disk_used_gb, self._disk_total_gb,
+            self._vram_available, self._vram_pct,
+            self._vram_used_mb, self._vram_total_mb,
+        )
 
     def _render_stats(self) -> Panel:
+        """SYS panel; reused across repaints until the collector's next sample.
+
+        Panels repaint at REFRESH_FPS (STREAM_FPS while streaming) but the
+        stats only move every STATS_INTERVAL.
+        """
+        key = self._stats_inputs()
+        if key == self._stats_key and self._stats_panel is not None:
+            return self._stats_panel
         lines: list[str] = [
             f" [dim]CPU [/]{_bar(self._cpu)} {self._cpu:4.0f}%",
             f" [dim]RAM [/]{_bar(self._ram_pct)} "
@@ -343,42 +473,35 @@ class LiveUI:
                 f" [dim]VRAM[/]{_bar(self._vram_pct)} "
                 f"{self._vram_used_mb:.0f}/{self._vram_total_mb:.0f}M"
             )
-        return Panel(
+        self._stats_key = key
+        self._stats_panel = Panel(
             Text.from_markup("\n".join(lines)),
             title="[bold cyan]SYS[/]",
             border_style="cyan",
         )
+        return self._stats_panel
 
     def _render_logs(self) -> Panel:
-        lines = list(self._log_lines)
-        total = len(lines)
-        visible_count = 15
-
-        if self._scroll_offset > 0 and total > 0:
-            end = max(0, total - self._scroll_offset)
-            start = max(0, end - visible_count)
-            visible = lines[start:end]
-        else:
-            visible = lines[-visible_count:]
-
-        text = Text()
-        for line in visible:
-            try:
-                text.append_text(Text.from_markup(line))
-            except Exception:
-                text.append(line)
+        """LOG STREAM panel; rebuilt only after a new line or a scroll."""
+        key = (self._log_seq, self._scroll_offset)
+        if key == self._logs_key and self._logs_panel is not None:
+            return self._logs_panel
+        visible = _window(self._log_lines, self._scroll_offset, 15)
+
+        text = Text("\n").join(_log_text(line) for line in visible)
+        if visible:
             text.append("\n")
 
-        return Panel(
+        self._logs_key = key
+        self._logs_panel = Panel(
             text,
             title="[bold cyan]LOG STREAM[/]",
             border_style="cyan",
         )
+        return self._logs_panel
 
     def _render_chat(self) -> Panel:
         parts: list[Any] = []
-        all_msgs = list(self._chat_lines)
-        total = len(all_msgs)
 
         # Dynamically limit visible messages so newest ones (bottom of Group)
         # are never clipped by Rich. header=3, bottom≈term_h//4 (min 7),
@@ -387,45 +510,12 @@ class LiveUI:
         bottom_h = max(7, (term_h - 3) // 4)
         chat_h = max(5, term_h - 3 - bottom_h - 2)
         visible_count = max(4, chat_h // 2)
-
-        if self._chat_scroll_offset > 0 and total > 0:
-            end = max(0, total - self._chat_scroll_offset)
-            start = max(0, end - visible_count)
-            recent = all_msgs[start:end]
-        else:
-            recent = all_msgs[-visible_count:]
+        recent = _window(self._chat_lines, self._chat_scroll_offset, visible_count)
 
         for i, (role, msg) in enumerate(recent):
-            if role == "user":
-                if i > 0:
-                    parts.append(Text(""))
-                parts.append(
-                    Text.from_markup(f"[bold green]▶ You[/]  {escape(msg)}")
-                )
-            elif role == "bantz":
-                if i > 0:
-                    parts.append(Text(""))
-                if "```" in msg or len(msg) > 120:
-                    parts.append(Text.from_markup("[bold cyan]◆ Bantz[/]"))
-                    parts.append(Markdown(msg))
-                else:
-                    parts.append(
-                        Text.from_markup(
-                            f"[bold cyan]◆ Bantz[/]  {escape(msg)}"
-                        )
-                    )
-            elif role == "system":
-                parts.append(Text.from_markup(f"  [dim]{escape(msg)}[/]"))
-            elif role == "error":
-                parts.append(
-                    Text.from_markup(f"  [bold red]✗ {escape(msg)}[/]")
-                )
-            elif role == "tool":
-                parts.append(
-                    Text.from_markup(
-                        f"  [dim magenta]⚙ \\[{escape(msg)}][/]"
-                    )
-                )
+            if i > 0 and role in ("user", "bantz"):
+                parts.append(Text(""))
+            parts.extend(_chat_block(role, msg))
 
         if self._streaming_text is not None:
             parts.append(Text(""))
@@ -468,6 +558,17 @@ class LiveUI:
             title=title, border_style="magenta",
         )
 
+    def _frame_key(self) -> tuple:
+        """Everything a repaint depends on; an equal key means an identical frame."""
+        return (
+            self._header_inputs(), self._stats_inputs(),
+            self._log_seq, self._scroll_offset,
+            self._chat_seq, self._chat_scroll_offset,
+            self._streaming_text, self._busy, self._prompt_text,
+            tuple(self._plan_steps.items()), self._plan_total,
+            self.console.size,
+        )
+
     def _update_panels(self, layout: Layout) -> None:
         layout["header"].update(self._render_header())
         layout["bottom"]["stats"].update(self._render_stats())
@@ -485,11 +586,13 @@ class LiveUI:
 
     def add_chat(self, role: str, msg: str) -> None:
         self._chat_lines.append((role, msg))
+        self._chat_seq += 1
         self._chat_scroll_offset = 0
 
     def add_log(self, msg: str) -> None:
-        ts = datetime.now().strftime("%H:%M:%S")
+        ts = self._clock()
         self._log_lines.append(f"[dim]{ts}[/] {msg}")
+        self._log_seq += 1
         self._scroll_offset = 0
 
     # ─────────────────────────────────────────────────────────────
@@ -541,33 +644,63 @@ class LiveUI:
     # ─────────────────────────────────────────────────────────────
 
     async def _log_consumer(self) -> None:
-        """Drain the global log queue into _log_lines."""
+        """Drain the global log queue into _log_lines.
+
+        Blocks on the queue with no timeout — run() cancels this task on
+        shutdown — so an idle UI schedules no timer wake-ups, and a burst
+        of log lines is drained in one pass.
+        """
         while self._running:
-            try:
-                msg = await asyncio.wait_for(_log_queue.get(), timeout=1.0)
-                self.add_log(msg)
-            except asyncio.TimeoutError:
-                continue
+            self.add_log(await _log_queue.get())
+            while not _log_queue.empty():
+                self.add_log(_log_queue.get_nowait())
 
     async def _stats_collector(self) -> None:
-        """Refresh CPU / RAM / DISK / VRAM every STATS_INTERVAL seconds."""
+        """Refresh CPU / RAM / VRAM every STATS_INTERVAL seconds.
+
+        Disk usage is re-read only every DISK_INTERVAL; between reads the
+        panel keeps the last values.
+
+        Sampling is skipped while a request is in flight (``_busy``): the
+        nvidia-smi spawn and psutil reads would only compete with the
+        response path, and the panel shows the last values meanwhile.
+        """
         while self._running:
+            if self._busy:
+                await asyncio.sleep(self.STATS_INTERVAL)
+                continue
             try:
                 self._cpu = psutil.cpu_percent(interval=None)
                 mem = psutil.virtual_memory()
                 self._ram_pct = mem.percent
                 self._ram_used_gb = mem.used / (1024 ** 3)
                 self._ram_total_gb = mem.total / (1024 ** 3)
-                disk = psutil.disk_usage("/")
-                self._disk_pct = disk.percent
-                self._disk_used_gb = disk.used / (1024 ** 3)
-                self._disk_total_gb = disk.total / (1024 ** 3)
+                now = time.monotonic()
+                if self._disk_at is None or now - self._disk_at >= DISK_INTERVAL:
+                    disk = psutil.disk_usage("/")
+                    self._disk_pct = disk.percent
+                    self._disk_used_gb = disk.used / (1024 ** 3)
+                    self._disk_total_gb = disk.total / (1024 ** 3)
+                    self._disk_at = now
                 self._collect_vram()
             except Exception:
                 pass
             await asyncio.sleep(self.STATS_INTERVAL)
 
     def _collect_vram(self) -> None:
+        # NVML first: one query on a handle cached for the process, instead
+        # of spawning nvidia-smi every stats tick.
+        from bantz.interface.ws_server import nvml_memory
+        mem = nvml_memory()
+        if mem is not None:
+            used, total = mem
+            self._vram_used_mb = used
+            self._vram_total_mb = total
+            self._vram_pct = (used / total * 100) if total else 0
+            self._vram_available = True
+            return
+        if not self._nvidia_smi:
+            return
         try:
             result = subprocess.run(
                 [
@@ -590,20 +723,29 @@ class LiveUI:
                     self._vram_available = True
                     return
             self._vram_available = False
-        except (FileNotFoundError, Exception):
+        except FileNotFoundError:
+            self._nvidia_smi = False
+            self._vram_available = False
+        except Exception:
             self._vram_available = False
 
     async def _panel_updater(self, layout: Layout) -> None:
         """Re-render all panels at REFRESH_FPS.
 
         Suspended while _waiting_input is True so that the terminal
-        cursor stays in place below the panels as the user types.
+        cursor stays in place below the panels as the user types.  A tick
+        whose _frame_key matches the last painted one is skipped: when
+        idle only the clock moves, so the screen is redrawn once a second.
         """
+        painted: tuple | None = None
         while self._running:
             if not self._waiting_input and self._live is not None:
                 try:
-                    self._update_panels(layout)
-                    self._live.refresh()
+                    key = self._frame_key()
+                    if key != painted:
+                        self._update_panels(layout)
+                        self._live.refresh()
+                        painted = key
                 except Exception:
                     pass
             await asyncio.sleep(1 / self.REFRESH_FPS)
@@ -627,9 +769,15 @@ class LiveUI:
             "openai": "OpenAI", "gemini": "Gemini",
         }.get(_provider, "Ollama")
 
-        async def check_ollama(client: httpx.AsyncClient) -> None:
+        async def check_ollama() -> None:
+            # Probe through the chat client's pool: this runs next to the
+            # warm-up at startup and every 30 s after, so it reuses a kept-
+            # alive connection instead of opening a fresh one each time.
             try:
-                r = await client.get(f"{config.ollama_base_url}/api/tags")
+                from bantz.llm.ollama import ollama
+                r = await ollama.client.get(
+                    f"{ollama.base_url}/api/tags", timeout=3.0,
+                )
                 self._services[_llm_key] = (
                     ServiceDot.UP if r.status_code == 200
                     else ServiceDot.DEGRADED
@@ -813,7 +961,7 @@ class LiveUI:
             elif _provider == "gemini":
                 _llm_coro = asyncio.sleep(0)  # check_gemini() covers the "Gemini" dot
             else:
-                _llm_coro = check_ollama(client)
+                _llm_coro = check_ollama()
             await asyncio.gather(
                 _llm_coro,
                 check_mempalace(),
@@ -851,7 +999,8 @@ class LiveUI:
         while self._running:
             try:
                 from bantz.core.memory import memory as _mem
-                stats = _mem.stats()
+                # COUNT(*) over the message history — keep it off the loop
+                stats = await asyncio.to_thread(_mem.stats)
                 self._memory_count = stats.get("total_conversations", 0)
             except Exception:
                 pass
@@ -888,7 +1037,7 @@ class LiveUI:
                 from bantz.core.scheduler import scheduler
                 from bantz.core.memory import memory
 
-                for r in scheduler.check_due():
+                for r in await asyncio.to_thread(scheduler.check_due):
                     repeat = (
                         f" (repeats {r['repeat']})"
                         if r.get("repeat", "none") != "none"
@@ -933,6 +1082,7 @@ class LiveUI:
         bus.bind_loop()
         bus.on("voice_input", self._on_bus_voice_input)
         bus.on("health_alert", self._on_bus_health_alert)
+        bus.on("place_stationary", self._on_bus_place_stationary)
         bus.on("thinking_start", self._on_bus_thinking_start)
         bus.on("thinking_done", self._on_bus_thinking_done)
         bus.on("planner_step", self._on_bus_planner_step)
@@ -949,12 +1099,20 @@ class LiveUI:
         text = event.data.get("text", "").strip()
         if text and not self._busy:
             self.add_chat("user", f"🎤 {text}")
-            asyncio.create_task(self._process_input(text))
+            # Claim _busy now, not when the task first runs, so a second
+            # utterance in the same loop turn cannot start a parallel request.
+            self._busy = True
+            self._voice_task = asyncio.create_task(self._process_input(text))
 
     def _on_bus_health_alert(self, event: Event) -> None:
         title = event.data.get("title", "Health Alert")
         self.add_chat("system", f"⚠️ {title}")
 
+    def _on_bus_place_stationary(self, event: Event) -> None:
+        msg = event.data.get("message", "")
+        if msg:
+            self.add_chat("bantz", msg)
+
     def _on_bus_thinking_start(self, event: Event) -> None:
         self._busy = True
 
@@ -1079,11 +1237,19 @@ class LiveUI:
                 self._running = False
                 return
 
-            text = text.strip()
-            if not text:
+            # Blank Enter: skip before allocating a stripped copy
+            if not text or text.isspace():
                 continue
+            text = text.strip()
 
             # ── 5. Show user message + thinking indicator ─────────
+            voice = self._voice_task
+            if voice is not None and not voice.done():
+                # the typed message wins; stop paying for the stale reply
+                voice.cancel()
+                # let it unwind (and clear _busy) before this request claims it
+                await asyncio.wait({voice})
+                self._streaming_text = None
             self.add_chat("user", text)
             self._busy = True
             self._refresh_now(layout)
@@ -1111,86 +1277,101 @@ class LiveUI:
         from bantz.core.brain import brain
         from bantz.core.memory import memory
 
-        if self._pending is not None:
-            await self._handle_confirm(text)
-            return
-
-        self._busy = True
+        # Every exit clears _busy — the voice path sets it before this task
+        # runs, and a declined confirmation or cancellation returns early.
         try:
-            result = await brain.process(text)
-        except Exception as exc:
-            self._busy = False
-            logger.error("Process input error: %s", exc)
-            self.add_chat("error", "I'm afraid I encountered a slight mechanical difficulty, ma'am.")
-            return
-
-        # ── Streaming ─────────────────────────────────────────────
-        if result.stream is not None:
-            if result.tool_used:
-                self.add_chat("tool", result.tool_used)
+            if self._pending is not None:
+                await self._handle_confirm(text)
+                return
 
-            accumulated = ""
+            self._busy = True
             try:
-                async for token in result.stream:
-                    accumulated += token
-                    self._streaming_text = accumulated
-                    # Each token triggers an immediate panel refresh so
-                    # the user sees text appear in real time.
-                    self._refresh_now(layout)
+                result = await brain.process(text)
             except Exception as exc:
+                self._busy = False
+                logger.error("Process input error: %s", exc)
+                self.add_chat("error", "I'm afraid I encountered a slight mechanical difficulty, ma'am.")
+                return
+
+            # ── Streaming ─────────────────────────────────────────────
+            if result.stream is not None:
+                if result.tool_used:
+                    self.add_chat("tool", result.tool_used)
+
+                accumulated = ""
+                pending: list[str] = []
+                frame = 1 / self.STREAM_FPS
+                next_paint = 0.0
+                try:
+                    async for token in result.stream:
+                        pending.append(token)
+                        # Tokens can arrive far faster than a terminal repaint
+                        # of every panel; paint at most STREAM_FPS times a second,
+                        # folding the tokens buffered since the last frame in one
+                        # join. The chat loop repaints the final text once the
+                        # stream ends.
+                        now = time.monotonic()
+                        if now >= next_paint:
+                            next_paint = now + frame
+                            accumulated += "".join(pending)
+                            pending.clear()
+                            self._streaming_text = accumulated
+                            self._refresh_now(layout)
+                    accumulated += "".join(pending)
+                except Exception as exc:
+                    self._streaming_text = None
+                    self._busy = False
+                    logger.error("Stream error: %s", exc)
+                    self.add_chat("error", "I'm afraid the stream encountered a slight difficulty, ma'am.")
+                    return
+
                 self._streaming_text = None
                 self._busy = False
-                logger.error("Stream error: %s", exc)
-                self.add_chat("error", "I'm afraid the stream encountered a slight difficulty, ma'am.")
+
+                if accumulated.strip():
+                    self.add_chat("bantz", accumulated)
+                else:
+                    self.add_chat(
+                        "error",
+                        "Empty response from model — is Ollama running and "
+                        f"is '{config.ollama_model}' pulled? "
+                        "Try: ollama pull " + config.ollama_model,
+                    )
+
+                try:
+                    from bantz.core.finalizer import strip_markdown
+                    cleaned = strip_markdown(accumulated)
+                    memory.add("assistant", cleaned, tool_used=result.tool_used)
+                except Exception:
+                    pass
+                try:
+                    await brain._graph_store(text, accumulated, result.tool_used)
+                except Exception:
+                    pass
                 return
 
-            self._streaming_text = None
+            # ── Non-streaming ─────────────────────────────────────────
             self._busy = False
 
-            if accumulated.strip():
-                self.add_chat("bantz", accumulated)
+            if result.needs_confirm:
+                self._pending = result
+                self.add_chat("bantz", result.response)
+            elif result.response and result.response.strip():
+                if result.tool_used:
+                    self.add_chat("tool", result.tool_used)
+                self.add_chat("bantz", result.response)
             else:
                 self.add_chat(
-                    "error",
-                    "Empty response from model — is Ollama running and "
-                    f"is '{config.ollama_model}' pulled? "
-                    "Try: ollama pull " + config.ollama_model,
+                    "system",
+                    "🤔 I processed your message but had nothing to say.",
                 )
-
-            try:
-                from bantz.core.finalizer import strip_markdown
-                cleaned = strip_markdown(accumulated)
-                memory.add("assistant", cleaned, tool_used=result.tool_used)
-            except Exception:
-                pass
-            try:
-                await brain._graph_store(text, accumulated, result.tool_used)
-            except Exception:
-                pass
-            return
-
-        # ── Non-streaming ─────────────────────────────────────────
-        self._busy = False
-
-        if result.needs_confirm:
-            self._pending = result
-            self.add_chat("bantz", result.response)
-        elif result.response and result.response.strip():
-            if result.tool_used:
-                self.add_chat("tool", result.tool_used)
-            self.add_chat("bantz", result.response)
-        else:
-            self.add_chat(
-                "system",
-                "🤔 I processed your message but had nothing to say.",
-            )
+        finally:
+            self._busy = False
 
     async def _handle_confirm(self, text: str) -> None:
         pending = self._pending
         self._pending = None
-        confirmed = text.lower().strip() in (
-            "yes", "y", "ok", "evet", "e", "tamam",
-        )
+        confirmed = text.lower().strip() in CONFIRM_WORDS
         if not confirmed:
             self.add_chat("system", "Cancelled.")
             return
@@ -1253,12 +1434,13 @@ class LiveUI:
             asyncio.create_task(self._scheduler_loop()),
             asyncio.create_task(self._service_poller()),   # #437: re-probe every 30s
             asyncio.create_task(self._status_updater()),   # #437: refresh model/persona/mem
+            asyncio.create_task(self._startup()),
         ]
-        asyncio.create_task(self._probe_services())
-        asyncio.create_task(self._warm_ollama())
-        asyncio.create_task(self._enrich_greeting())
-        asyncio.create_task(self._start_ws())
-        asyncio.create_task(self._start_ambient_sampler())
+
+        # Startup tasks keep their usual ordering; from here on, per-request
+        # tasks that finish without suspending skip the scheduler.
+        from bantz.core.event_loop import enable_eager_tasks
+        enable_eager_tasks()
 
         try:
             with Live(
@@ -1287,6 +1469,21 @@ class LiveUI:
             except Exception:
                 pass
 
+    async def _startup(self) -> None:
+        """One-shot startup work, run concurrently as a single tracked task.
+
+        None of these depend on each other; a failure in one never stops
+        the rest, and run() cancels whatever is still pending on exit.
+        """
+        await asyncio.gather(
+            self._probe_services(),
+            self._warm_ollama(),
+            self._enrich_greeting(),
+            self._start_ws(),
+            self._start_ambient_sampler(),
+            return_exceptions=True,
+        )
+
     async def _start_ws(self) -> None:
         try:
             from bantz.interface.ws_server import ws_server
@@ -1308,6 +1505,7 @@ class LiveUI:
 # ═══════════════════════════════════════════════════════════════════════════
 
 def run() -> None:
-    """Launch the Bantz Rich Live TUI."""
+    """Launch the Bantz Rich Live TUI (on uvloop/winloop when installed)."""
+    from bantz.core.event_loop import run as run_loop
     ui = LiveUI()
-    asyncio.run(ui.run())
+    run_loop(ui.run())
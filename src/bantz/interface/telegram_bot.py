@@ -1256,12 +1256,12 @@ def run_bot() -> None:
 
     log.info("🦌 Bantz Telegram bot starting...")
     if _PROXY:
-        log.info(f"   Proxy: {_PROXY}")
+        log.info("   Proxy: %s", _PROXY)
     if _ALLOWED:
-        log.info(f"   Allowed users: {_ALLOWED}")
+        log.info("   Allowed users: %s", _ALLOWED)
     else:
         log.info("   ⚠ No user restriction — anyone can use it")
-    log.info(f"   LLM mode: {'ON' if config.telegram_llm_mode else 'OFF'}")
+    log.info("   LLM mode: %s", "ON" if config.telegram_llm_mode else "OFF")
 
     app.run_polling(allowed_updates=Update.ALL_TYPES)
 
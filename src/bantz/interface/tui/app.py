@@ -67,6 +67,7 @@ class BantzApp(App):
         self._busy: bool = False
         self._ghost_loop = None
         self._bus_handler = None  # shared handler registered in _subscribe_event_bus
+        self._tasks: set = set()  # in-flight brain dispatches (strong refs)
 
     # ── Compose ─────────────────────────────────────────────────────────
 
@@ -78,9 +79,14 @@ class BantzApp(App):
     # ── Lifecycle ────────────────────────────────────────────────────────
 
     def on_mount(self) -> None:
-        """Subscribe to bus events and start the Ghost Loop."""
+        """Subscribe to bus events; start the Ghost Loop after the first paint.
+
+        Importing and starting the Ghost Loop (audio + STT stack) is the
+        slowest part of startup, so it waits until the first frame is on
+        screen instead of holding it back.
+        """
         self._subscribe_event_bus()
-        self._start_ghost_loop()
+        self.call_after_refresh(self._start_ghost_loop)
 
     def action_quit(self) -> None:
         """Stop the ghost loop then quit."""
@@ -174,7 +180,8 @@ class BantzApp(App):
             status.update(f"You said: {text}")
         except Exception:
             pass
-        # Relay to brain via asyncio (fire-and-forget)
+        # Relay to brain as its own task so the handler returns and Textual
+        # keeps painting; hold a reference — the loop only keeps weak ones.
         import asyncio
         async def _dispatch():
             try:
@@ -184,7 +191,9 @@ class BantzApp(App):
                 log.error("TUI: brain dispatch error — %s", exc)
             finally:
                 self._busy = False
-        asyncio.get_event_loop().create_task(_dispatch())
+        task = asyncio.create_task(_dispatch())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
 
     def _on_bus_ghost_listening(self, event: Event) -> None:
         """Update status bar to show the listening indicator."""
@@ -65,6 +65,7 @@ import websockets
 from websockets.asyncio.server import ServerConnection, serve
 
 from bantz.core.event_bus import bus, Event
+from bantz.core.types import DISK_INTERVAL
 
 log = logging.getLogger("bantz.ws_server")
 
@@ -130,6 +131,10 @@ class WsBroadcastServer:
         if self._server is not None:
             return
 
+        # Prime psutil's CPU counter: the first non-blocking read otherwise
+        # returns 0.0, which the first vitals frame and anomaly check would see.
+        psutil.cpu_percent(interval=None)
+
         self._server = await serve(
             self._handle_client,
             "localhost",
@@ -438,11 +443,16 @@ class WsBroadcastServer:
 
     async def _services_loop(self) -> None:
         from bantz.config import config
+        # Clients get a full snapshot on connect, so a tick whose probes
+        # match the last broadcast has nothing new to send.
+        prev: dict | None = None
         while True:
             try:
                 if self._clients:
                     payload = await _collect_services()
-                    await self._broadcast(payload)
+                    if payload != prev:
+                        await self._broadcast(payload)
+                        prev = payload
             except Exception:
                 pass
             await asyncio.sleep(config.services_interval)
@@ -768,21 +778,36 @@ async def _send(ws: ServerConnection, payload: dict) -> None:
 def _collect_vitals() -> dict:
     cpu = psutil.cpu_percent(interval=None)
     mem = psutil.virtual_memory()
-    disk = psutil.disk_usage("/")
+    disk_used, disk_total = _collect_disk()
     vram_used, vram_total = _collect_vram()
     return {
         "type": "vitals",
         "cpu": round(cpu, 1),
         "ram_used": round(mem.used / (1024 ** 3), 2),
         "ram_total": round(mem.total / (1024 ** 3), 2),
-        "disk_used": round(disk.used / (1024 ** 3), 1),
-        "disk_total": round(disk.total / (1024 ** 3), 1),
+        "disk_used": round(disk_used, 1),
+        "disk_total": round(disk_total, 1),
         "vram_used": round(vram_used, 0),
         "vram_total": round(vram_total, 0),
         "anomalies": _compute_anomalies(cpu, mem.percent),
     }
 
 
+# One statvfs per DISK_INTERVAL is plenty next to the per-tick CPU/RAM reads.
+_DISK_CACHE: tuple[float, tuple[float, float]] | None = None
+
+
+def _collect_disk() -> tuple[float, float]:
+    global _DISK_CACHE
+    now = time.monotonic()
+    if _DISK_CACHE is not None and now - _DISK_CACHE[0] < DISK_INTERVAL:
+        return _DISK_CACHE[1]
+    disk = psutil.disk_usage("/")
+    result = (disk.used / (1024 ** 3), disk.total / (1024 ** 3))
+    _DISK_CACHE = (now, result)
+    return result
+
+
 def _compute_anomalies(cpu: float, ram_pct: float) -> list[dict]:
     """Derive current anomalies from resource pressure + recent error logs.
 
@@ -890,12 +915,13 @@ _NVML_HANDLE: Any = None
 _VRAM_CACHE: tuple[float, tuple[float, float]] = (0.0, (0.0, 0.0))
 
 
-def _collect_vram() -> tuple[float, float]:
-    global _NVML_HANDLE, _VRAM_CACHE
-    now = time.monotonic()
-    ts, cached = _VRAM_CACHE
-    if now - ts < 10.0:
-        return cached
+def nvml_memory() -> tuple[float, float] | None:
+    """Return (used_mb, total_mb) of GPU 0 via NVML, or None if unavailable.
+
+    ``nvmlInit`` and the device lookup run once per process; every later
+    call is a single memory-info query on the cached handle.
+    """
+    global _NVML_HANDLE
     if _NVML_HANDLE is None:
         try:
             import pynvml
@@ -903,14 +929,23 @@ def _collect_vram() -> tuple[float, float]:
             _NVML_HANDLE = pynvml.nvmlDeviceGetHandleByIndex(0)
         except Exception:
             _NVML_HANDLE = False
-    result = (0.0, 0.0)
-    if _NVML_HANDLE is not False:
-        try:
-            import pynvml
-            mem = pynvml.nvmlDeviceGetMemoryInfo(_NVML_HANDLE)
-            result = (mem.used / 1048576, mem.total / 1048576)
-        except Exception:
-            pass
+    if _NVML_HANDLE is False:
+        return None
+    try:
+        import pynvml
+        mem = pynvml.nvmlDeviceGetMemoryInfo(_NVML_HANDLE)
+        return (mem.used / 1048576, mem.total / 1048576)
+    except Exception:
+        return None
+
+
+def _collect_vram() -> tuple[float, float]:
+    global _VRAM_CACHE
+    now = time.monotonic()
+    ts, cached = _VRAM_CACHE
+    if now - ts < 10.0:
+        return cached
+    result = nvml_memory() or (0.0, 0.0)
     _VRAM_CACHE = (now, result)
     return result
 
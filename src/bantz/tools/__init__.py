@@ -4,6 +4,7 @@ Each tool implements this interface. Router generates JSON → Registry finds th
 """
 from __future__ import annotations
 
+import importlib
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any, Literal
@@ -77,4 +78,35 @@ class ToolRegistry:
 
 
 # Global registry — `from bantz.tools import registry`
-registry = ToolRegistry()
\ No newline at end of file
+registry = ToolRegistry()
+
+
+# ── Lazy submodules ───────────────────────────────────────────────────────────
+# Tool modules register themselves on import.  Declaring them here lets
+# callers enumerate them — and reach one as ``bantz.tools.<name>`` — without
+# paying for the import until a submodule is actually referenced (PEP 562).
+
+_SUBMODULES: tuple[str, ...] = (
+    "accessibility", "browser_control", "browser_tool", "calendar",
+    "classroom", "computer_use", "contacts", "delegate_task", "desktop", "document",
+    "feed_tool", "filesystem", "gmail", "gui_action", "gui_tool",
+    "image_tool", "input_control", "lantern", "localmail", "news",
+    "reminder", "screen_query_tool", "screenshot_tool", "shell",
+    "summarizer", "system", "system_tool", "vision_execute", "visual_click",
+    "weather", "web_reader", "web_search", "workflow_tool",
+)
+
+
+def known_tool_names() -> tuple[str, ...]:
+    """Declared tool submodule names — none of them is imported."""
+    return _SUBMODULES
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_SUBMODULES})
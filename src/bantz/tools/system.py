@@ -4,6 +4,7 @@ Takes CPU, RAM, disk, uptime information. Uses psutil, no API calls.
 """
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 import psutil
@@ -37,7 +38,8 @@ class SystemTool(BaseTool):
             lines: list[str] = []
 
             if metric in ("all", "cpu"):
-                cpu = psutil.cpu_percent(interval=0.5)
+                # The 0.5s sample window sleeps; keep it off the event loop.
+                cpu = await asyncio.to_thread(psutil.cpu_percent, 0.5)
                 data["cpu_percent"] = cpu
                 lines.append(f"CPU: %{cpu:.0f}")
 
@@ -564,6 +564,15 @@ class TestTUIEventSubscriptions:
         src = inspect.getsource(BantzApp._on_bus_voice_input)
         assert "_busy" in src
 
+    def test_voice_dispatch_task_is_referenced(self):
+        """The brain dispatch task must be held so it cannot be GC'd mid-flight."""
+        import inspect
+        from bantz.interface.tui.app import BantzApp
+        src = inspect.getsource(BantzApp._on_bus_voice_input)
+        assert "asyncio.create_task(_dispatch())" in src
+        assert "self._tasks.add(task)" in src
+        assert "get_event_loop()" not in src
+
     def test_legacy_wake_word_message_removed(self):
         """The dead WakeWordDetected message class should no longer exist."""
         from bantz.interface.tui import app as tui_app
@@ -580,6 +589,14 @@ class TestTUIEventSubscriptions:
         src = inspect.getsource(BantzApp.on_mount)
         assert "_start_ghost_loop" in src
 
+    def test_ghost_loop_starts_after_first_paint(self):
+        """The Ghost Loop start is deferred until after the first refresh."""
+        import inspect
+        from bantz.interface.tui.app import BantzApp
+        src = inspect.getsource(BantzApp.on_mount)
+        assert "self.call_after_refresh(self._start_ghost_loop)" in src
+        assert "self._start_ghost_loop()" not in src
+
     def test_action_quit_stops_ghost_loop(self):
         """action_quit must stop the ghost loop."""
         import inspect
@@ -637,12 +654,10 @@ class TestDoctorMemPalaceFix:
 
     def test_doctor_loads_tool_modules(self):
         """_doctor() must import tool modules so registry.all_schemas() is non-empty."""
-        import inspect
-        from bantz.cli.setup import _doctor
-        src = inspect.getsource(_doctor)
-        assert "bantz.tools.shell" in src, "_doctor() must import bantz.tools.shell to populate registry"
-        assert "bantz.tools.system" in src, "_doctor() must import bantz.tools.system to populate registry"
-        assert "registry.all_schemas()" in src, "_doctor() must call registry.all_schemas()"
+        from bantz.cli.setup import _load_doctor_tools
+        names = {s["name"] for s in _load_doctor_tools()[0]}
+        assert "shell" in names, "_doctor() must import bantz.tools.shell to populate registry"
+        assert "system" in names, "_doctor() must import bantz.tools.system to populate registry"
 
     def test_doctor_voice_tracks_pip_missing(self):
         """_doctor() must collect missing pip packages for consolidated voice fix output (#432)."""
@@ -88,6 +88,10 @@ class TestErrorClassifier:
     def setup_method(self):
         self.clf = ErrorClassifier(enable_llm=False)
 
+    def test_llm_enabled_reflects_constructor(self):
+        assert self.clf.llm_enabled is False
+        assert ErrorClassifier(enable_llm=True).llm_enabled is True
+
     def test_empty_text(self):
         assert self.clf.classify("") is None
         assert self.clf.classify("   ") is None
@@ -576,6 +580,45 @@ class TestClassifierLLMAnalysis:
         assert result == ""
 
 
+class TestObserverAnalysisDispatch:
+    """Critical-error analysis never nests an event loop inside a running one."""
+
+    _TRACE = "Traceback (most recent call last):\nZeroDivisionError: ..."
+
+    def _make(self, events):
+        obs = Observer(on_error=events.append, batch_seconds=0.0,
+                       dedup_window=60.0, enable_llm_analysis=True)
+        obs.classifier.analyze = AsyncMock(return_value="Divided by zero.")
+        return obs
+
+    @pytest.mark.asyncio
+    async def test_on_running_loop_analysis_is_a_task(self):
+        import asyncio
+        events = []
+        obs = self._make(events)
+        obs._process_batch(self._TRACE)
+        assert events == [] and len(obs._tasks) == 1  # delivery waits for the LLM
+        await asyncio.gather(*obs._tasks)
+        assert [e.analysis for e in events] == ["Divided by zero."]
+        assert obs.stats()["total_events"] == 1
+
+    def test_without_a_loop_analysis_runs_inline(self):
+        events = []
+        obs = self._make(events)
+        obs._process_batch(self._TRACE)
+        assert [e.analysis for e in events] == ["Divided by zero."]
+        assert not obs._tasks
+
+    def test_disabled_analysis_skips_the_llm(self):
+        events = []
+        obs = Observer(on_error=events.append, batch_seconds=0.0,
+                       enable_llm_analysis=False)
+        obs.classifier.analyze = AsyncMock()
+        obs._process_batch(self._TRACE)
+        obs.classifier.analyze.assert_not_called()
+        assert len(events) == 1
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Source audit (#220 Part 5)
 # ═══════════════════════════════════════════════════════════════════════════
@@ -0,0 +1,18 @@
+import wsgiref.simple_server
+from unittest.mock import patch
+
+import pytest
+
+from bantz.auth import google_oauth
+
+
+def test_make_server_restored_when_flow_fails(tmp_path):
+    flow = pytest.importorskip("google_auth_oauthlib.flow")
+    creds_json = tmp_path / "credentials.json"
+    creds_json.write_text("{}")
+    original = wsgiref.simple_server.make_server
+    with patch.object(google_oauth.token_store, "credentials_path", return_value=creds_json), \
+         patch.object(flow.InstalledAppFlow, "from_client_secrets_file",
+                      side_effect=ValueError("bad client secrets")):
+        assert google_oauth.setup_google("gmail") is False
+    assert wsgiref.simple_server.make_server is original
@@ -22,3 +22,67 @@ def test_get_or_none_returns_credentials_on_success():
     with patch.object(store, 'get', return_value=mock_creds):
         result = store.get_or_none("gmail")
         assert result == mock_creds
+
+
+def _store_with_token(tmp_path):
+    store = TokenStore()
+    store._dir = tmp_path
+    store.token_path("gmail").write_text("{}")
+    return store
+
+
+def test_get_parses_token_file_once_until_it_changes(tmp_path):
+    import json
+    import os
+    import pytest
+    credentials = pytest.importorskip("google.oauth2.credentials")
+    store = _store_with_token(tmp_path)
+    with patch.object(credentials.Credentials, "from_authorized_user_info",
+                      side_effect=lambda info: MagicMock(expired=False)), \
+         patch("bantz.auth.token_store.json.loads", wraps=json.loads) as parse:
+        first = store.get("gmail")
+        second = store.get("gmail")
+        assert parse.call_count == 1
+        # every caller gets its own object — no shared in-place refresh
+        assert first is not second
+        path = store.token_path("gmail")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        store.get("gmail")
+        assert parse.call_count == 2
+
+
+def test_get_forgets_deleted_token(tmp_path):
+    import pytest
+    credentials = pytest.importorskip("google.oauth2.credentials")
+    store = _store_with_token(tmp_path)
+    with patch.object(credentials.Credentials, "from_authorized_user_info",
+                      return_value=MagicMock(expired=False)):
+        store.get("gmail")
+    store.token_path("gmail").unlink()
+    with pytest.raises(TokenNotFoundError):
+        store.get("gmail")
+    assert "gmail" not in store._creds
+
+
+def test_status_reused_within_ttl(tmp_path):
+    store = _store_with_token(tmp_path)
+    with patch.object(store, "get") as get:
+        first = store.status()
+        assert store.status() == first
+        assert get.call_count == 1
+    assert first == {"gmail": "ok", "classroom": "not configured",
+                     "calendar": "not configured"}
+
+
+def test_status_sees_new_token_and_expiry(tmp_path):
+    store = _store_with_token(tmp_path)
+    with patch.object(store, "get") as get:
+        store.status()
+        store.token_path("calendar").write_text("{}")
+        assert store.status()["calendar"] == "ok"
+        assert get.call_count == 3
+        with patch("bantz.auth.token_store.time.monotonic",
+                   return_value=store._status[0] + store.STATUS_TTL):
+            store.status()
+        assert get.call_count == 5
@@ -0,0 +1,266 @@
+"""Tests for `bantz --doctor` probe scheduling."""
+from __future__ import annotations
+
+import inspect
+
+import pytest
+
+
+@pytest.fixture
+def doctor_env(monkeypatch):
+    """Stub _doctor's probes; the location probe waits for ``release`` and
+    then raises, ending the run right after the sections before it."""
+    import asyncio
+    import threading
+    from types import SimpleNamespace
+
+    import psutil
+    import bantz.cli.setup as setup_mod
+    from bantz.config import config
+    from bantz.core.location import location_service
+    from bantz.core.memory import memory
+    from bantz.llm.ollama import ollama
+
+    env = SimpleNamespace(release=asyncio.Event(), calls=[], cpu_threads=[])
+
+    async def slow_location():
+        await env.release.wait()
+        raise RuntimeError("stop after the streamed sections")
+
+    def tools(stamp):
+        env.calls.append("tools")
+        return [], []
+
+    def cpu(interval=None):
+        env.calls.append("cpu")
+        env.cpu_threads.append(threading.current_thread())
+        return 3.0
+
+    monkeypatch.setattr(config, "llm_provider", "ollama")
+    monkeypatch.setattr(psutil, "cpu_percent", cpu)
+    monkeypatch.setattr(ollama, "verify_connection", lambda: asyncio.sleep(0))
+    monkeypatch.setattr(location_service, "get", slow_location)
+    monkeypatch.setattr(setup_mod, "_read_tool_cache", tools)
+    monkeypatch.setattr(memory, "init", lambda path: None)
+    monkeypatch.setattr(memory, "stats", lambda: {})
+    return env
+
+
+class TestDoctorConcurrentProbes:
+    def _src(self) -> str:
+        from bantz.cli.setup import _doctor
+        return inspect.getsource(_doctor)
+
+    def test_network_probes_start_before_report(self):
+        src = self._src()
+        header = src.index('emit("Bantz v2 — System Check")')
+        for probe in ("ollama_probe = ", "location_probe = ", "token_probe = ",
+                      "memory_probe = ", "provider_probe = asyncio.create_task"):
+            assert -1 < src.index(probe) < header, probe
+
+    def test_cloud_providers_awaited_from_task(self):
+        src = self._src()
+        assert "await _claude.is_available()" not in src
+        assert "await _oai.is_available()" not in src
+        assert "await _gem.is_available()" not in src
+
+    def test_memory_db_init_off_loop(self):
+        src = self._src()
+        assert "asyncio.to_thread(_memory_stats)" in src
+        assert src.count("_mem.init(") == 1
+
+
+class TestDoctorCpuSample:
+    @pytest.mark.asyncio
+    async def test_sampled_on_worker_after_tool_imports(self, doctor_env):
+        import threading
+        import bantz.cli.setup as setup_mod
+
+        doctor_env.release.set()
+        with pytest.raises(RuntimeError):
+            await setup_mod._doctor()
+        assert doctor_env.calls[:2] == ["tools", "cpu"]
+        assert doctor_env.cpu_threads
+        assert threading.main_thread() not in doctor_env.cpu_threads
+
+    @pytest.mark.asyncio
+    async def test_blocking_interval_does_not_stall_loop(self, doctor_env, monkeypatch):
+        import asyncio
+        import time
+        import psutil
+        import bantz.cli.setup as setup_mod
+
+        def blocking(interval=None):
+            time.sleep(interval or 0)
+            return 3.0
+
+        monkeypatch.setattr(psutil, "cpu_percent", blocking)
+        gaps: list[float] = []
+
+        async def ticker():
+            last = time.monotonic()
+            while True:
+                await asyncio.sleep(0.01)
+                now = time.monotonic()
+                gaps.append(now - last)
+                last = now
+
+        tick = asyncio.create_task(ticker())
+        doctor_env.release.set()
+        try:
+            with pytest.raises(RuntimeError):
+                await setup_mod._doctor()
+        finally:
+            tick.cancel()
+        assert gaps and max(gaps) < 0.2
+
+
+class TestDoctorToolCache:
+    @pytest.fixture(autouse=True)
+    def cache_file(self, tmp_path, monkeypatch):
+        import bantz.cli.setup as setup_mod
+        path = tmp_path / "doctor_tools.json"
+        monkeypatch.setattr(setup_mod, "_tool_cache_path", lambda: path)
+        return path
+
+    def test_roundtrip_with_matching_stamp(self):
+        from bantz.cli.setup import _read_tool_cache, _write_tool_cache
+        schemas = [{"name": "shell", "description": "x", "risk_level": "safe"}]
+        _write_tool_cache({"a.py": 1}, schemas, ["news (No module named 'x')"])
+        assert _read_tool_cache({"a.py": 1}) == (schemas, ["news (No module named 'x')"])
+
+    def test_stale_stamp_misses(self):
+        from bantz.cli.setup import _read_tool_cache, _write_tool_cache
+        _write_tool_cache({"a.py": 1}, [{"name": "shell"}])
+        assert _read_tool_cache({"a.py": 2}) is None
+        assert _read_tool_cache({"a.py": 1, "b.py": 1}) is None
+
+    def test_missing_or_corrupt_cache_misses(self, cache_file):
+        from bantz.cli.setup import _read_tool_cache
+        assert _read_tool_cache({}) is None
+        cache_file.write_text("{not json", encoding="utf-8")
+        assert _read_tool_cache({}) is None
+
+    def test_stamp_covers_tool_sources(self):
+        from bantz.cli.setup import _tool_cache_stamp
+        stamp = _tool_cache_stamp()
+        assert any(p.endswith("shell.py") for p in stamp)
+
+    def test_stamp_covers_modules_tools_import(self):
+        import os
+        from bantz.cli.setup import _tool_cache_stamp
+        stamp = _tool_cache_stamp()
+        for rel in (("core", "types.py"), ("auth", "token_store.py"), ("config.py",)):
+            assert any(p.endswith(os.path.join("bantz", *rel)) for p in stamp), rel
+        assert not any("__pycache__" in p for p in stamp)
+
+
+class TestDoctorCacheFlag:
+    @pytest.mark.asyncio
+    async def test_cached_report_is_labelled(self, capsys, doctor_env):
+        import bantz.cli.setup as setup_mod
+
+        doctor_env.release.set()
+        with pytest.raises(RuntimeError):
+            await setup_mod._doctor()
+        out = capsys.readouterr().out
+        assert "✅ Tools (0, cached):" in out
+        assert "--no-cache" in out
+
+    @pytest.mark.asyncio
+    async def test_no_cache_reimports_tools(self, capsys, monkeypatch, doctor_env):
+        import bantz.cli.setup as setup_mod
+
+        written = []
+        monkeypatch.setattr(setup_mod, "_load_doctor_tools", lambda: ([{"name": "shell"}], []))
+        monkeypatch.setattr(setup_mod, "_write_tool_cache",
+                            lambda stamp, schemas, skipped=(): written.append(schemas))
+        doctor_env.release.set()
+        with pytest.raises(RuntimeError):
+            await setup_mod._doctor(use_cache=False)
+        out = capsys.readouterr().out
+        assert "tools" not in doctor_env.calls
+        assert "✅ Tools (1): shell" in out
+        assert "cached" not in out
+        assert written == [[{"name": "shell"}]]
+
+
+class TestDoctorToolImports:
+    def test_skipped_modules_are_declared(self):
+        from bantz.cli.setup import _DOCTOR_SKIP_TOOLS
+        from bantz.tools import known_tool_names
+        assert _DOCTOR_SKIP_TOOLS <= set(known_tool_names())
+
+    def test_skip_list_is_honoured(self, monkeypatch):
+        import importlib
+        import bantz.cli.setup as setup_mod
+        import bantz.tools
+        imported = []
+
+        def fake(name, *a, **k):
+            imported.append(name)
+            return None
+
+        monkeypatch.setattr(bantz.tools, "_SUBMODULES", ("shell", "gui_action"))
+        monkeypatch.setattr(importlib, "import_module", fake)
+        setup_mod._load_doctor_tools()
+        assert imported == ["bantz.tools.shell"]
+
+    def test_failing_module_is_skipped_not_fatal(self, monkeypatch):
+        import importlib
+        import bantz.cli.setup as setup_mod
+        import bantz.tools
+        real = importlib.import_module
+
+        def fake(name, *a, **k):
+            if name == "bantz.tools.gmail":
+                raise ImportError("No module named 'googleapiclient'")
+            return real(name, *a, **k)
+
+        monkeypatch.setattr(bantz.tools, "_SUBMODULES", ("shell", "gmail"))
+        monkeypatch.setattr(importlib, "import_module", fake)
+        schemas, skipped = setup_mod._load_doctor_tools()
+        assert any(s["name"] == "shell" for s in schemas)
+        assert skipped == ["gmail (No module named 'googleapiclient')"]
+
+
+class TestDoctorStreamsReport:
+    @pytest.mark.asyncio
+    async def test_first_section_written_before_last_probe(self, capsys, doctor_env):
+        import asyncio
+        import bantz.cli.setup as setup_mod
+
+        task = asyncio.create_task(setup_mod._doctor())
+        out = ""
+        for _ in range(200):
+            await asyncio.sleep(0.01)
+            out += capsys.readouterr().out
+            if "Ollama" in out:
+                break
+        assert "System Check" in out and "Ollama" in out
+        assert not task.done()
+        doctor_env.release.set()
+        with pytest.raises(RuntimeError):
+            await task
+
+    @pytest.mark.asyncio
+    async def test_sections_written_in_batches(self, monkeypatch, doctor_env):
+        import io
+        import sys
+        import bantz.cli.setup as setup_mod
+
+        class CountingIO(io.StringIO):
+            writes = 0
+
+            def write(self, text):
+                CountingIO.writes += 1
+                return super().write(text)
+
+        out = CountingIO()
+        monkeypatch.setattr(sys, "stdout", out)
+        doctor_env.release.set()
+        with pytest.raises(RuntimeError):
+            await setup_mod._doctor()
+        lines = out.getvalue().count("\n")
+        assert lines > 5
+        assert CountingIO.writes < lines
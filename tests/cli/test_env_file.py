@@ -0,0 +1,105 @@
+"""Tests for the _EnvFile .env read-modify-write helper in bantz.cli.setup."""
+from __future__ import annotations
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from bantz.cli.setup import _EnvFile, _write_env, _write_location_to_env
+
+
+class TestEnvFile:
+    def test_set_replaces_in_place_and_appends_new(self, tmp_path):
+        path = tmp_path / ".env"
+        path.write_text("# comment\nA=1\n\nB=2\n", encoding="utf-8")
+        with _EnvFile(path) as env:
+            env.set("A", "10")
+            env.set("C", "3")
+        assert path.read_text(encoding="utf-8") == "# comment\nA=10\n\nB=2\nC=3\n"
+
+    def test_drop_and_duplicate_keys(self, tmp_path):
+        path = tmp_path / ".env"
+        path.write_text("A=1\nB=2\nA=old\n", encoding="utf-8")
+        with _EnvFile(path) as env:
+            env.drop("B")
+            env.set("A", "new")
+        assert path.read_text(encoding="utf-8") == "A=new\n"
+
+    def test_commented_key_untouched(self, tmp_path):
+        path = tmp_path / ".env"
+        path.write_text("#A=1\n", encoding="utf-8")
+        with _EnvFile(path) as env:
+            env.set("A", "2")
+        assert path.read_text(encoding="utf-8") == "#A=1\nA=2\n"
+
+    def test_single_read_and_write(self, tmp_path):
+        path = tmp_path / ".env"
+        path.write_text("A=1\n", encoding="utf-8")
+        with patch("pathlib.Path.read_text", wraps=path.read_text) as read, \
+             patch("os.open", wraps=os.open) as open_:
+            with _EnvFile(path) as env:
+                for i in range(5):
+                    env.set(f"K{i}", str(i))
+        assert read.call_count == 1
+        assert open_.call_count == 1
+
+    def test_exception_leaves_file_unchanged(self, tmp_path):
+        path = tmp_path / ".env"
+        path.write_text("A=1\n", encoding="utf-8")
+        with pytest.raises(RuntimeError):
+            with _EnvFile(path) as env:
+                env.set("A", "2")
+                raise RuntimeError("cancelled")
+        assert path.read_text(encoding="utf-8") == "A=1\n"
+
+    def test_new_keys_only_are_appended(self, tmp_path):
+        path = tmp_path / ".env"
+        path.write_text("A=1\nB=2", encoding="utf-8")
+        with patch("bantz.core.secure_io.secure_write_text") as rewrite:
+            with _EnvFile(path) as env:
+                env.set("C", "3")
+        rewrite.assert_not_called()
+        assert path.read_text(encoding="utf-8") == "A=1\nB=2\nC=3\n"
+
+    def test_no_changes_writes_nothing(self, tmp_path):
+        path = tmp_path / ".env"
+        path.write_text("A=1\n", encoding="utf-8")
+        with patch("os.open") as open_:
+            with _EnvFile(path) as env:
+                env.drop("MISSING")
+        open_.assert_not_called()
+        assert path.read_text(encoding="utf-8") == "A=1\n"
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+    def test_append_tightens_mode(self, tmp_path):
+        path = tmp_path / ".env"
+        path.write_text("A=1\n", encoding="utf-8")
+        os.chmod(path, 0o644)
+        with _EnvFile(path) as env:
+            env.set("TOKEN", "secret")
+        assert oct(path.stat().st_mode & 0o777) == "0o600"
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+    def test_creates_file_0600(self, tmp_path):
+        path = tmp_path / "sub" / ".env"
+        with _EnvFile(path) as env:
+            env.set("A", "1")
+        assert oct(path.stat().st_mode & 0o777) == "0o600"
+
+
+class TestEnvWriters:
+    def test_write_env_uses_env_path(self, tmp_path):
+        path = tmp_path / ".env"
+        path.write_text("BANTZ_LLM_PROVIDER=ollama\nOTHER=x\n", encoding="utf-8")
+        with patch("bantz.cli.setup._env_path", return_value=path):
+            _write_env({"BANTZ_LLM_PROVIDER": "claude"})
+        assert path.read_text(encoding="utf-8") == "BANTZ_LLM_PROVIDER=claude\nOTHER=x\n"
+
+    def test_write_location(self, tmp_path):
+        (tmp_path / ".env").write_text("BANTZ_CITY=Old\n", encoding="utf-8")
+        with patch("pathlib.Path.cwd", return_value=tmp_path):
+            _write_location_to_env("Elazig", 38.67, 39.22)
+        assert (tmp_path / ".env").read_text(encoding="utf-8") == (
+            "BANTZ_CITY=Elazig\nBANTZ_LAT=38.67\nBANTZ_LON=39.22\n"
+        )
@@ -0,0 +1,143 @@
+"""Tests for the cached, rate-limited Nominatim lookup used by --setup places."""
+from __future__ import annotations
+
+import http.client
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import bantz.cli.setup as setup_mod
+
+
+@pytest.fixture
+def nominatim(tmp_path, monkeypatch):
+    cache_file = tmp_path / "nominatim.json"
+    monkeypatch.setattr(setup_mod, "_nominatim_cache_path", lambda: cache_file)
+    monkeypatch.setattr(setup_mod, "_nominatim_cache", None)
+    monkeypatch.setattr(setup_mod, "_nominatim_last_call", 0.0)
+    monkeypatch.setattr(setup_mod, "_nominatim_conn", None)
+    sleeps: list[float] = []
+    monkeypatch.setattr("time.sleep", sleeps.append)
+    return cache_file, sleeps
+
+
+def _ok(payload):
+    return 200, json.dumps(payload).encode()
+
+
+class TestNormalise:
+    def test_accents_case_and_whitespace(self):
+        assert setup_mod._normalise_place_query("  Elazığ   Merkez ") == "elazıg merkez"
+        assert setup_mod._normalise_place_query("CAFÉ") == "cafe"
+
+
+class TestNominatimSearch:
+    def test_second_lookup_hits_cache(self, nominatim):
+        cache_file, _ = nominatim
+        hit = [{"display_name": "Elazig", "lat": "38.6", "lon": "39.2"}]
+        with patch.object(setup_mod, "_nominatim_get", return_value=_ok(hit)) as get:
+            assert setup_mod._nominatim_search("Elazig") == hit
+            assert setup_mod._nominatim_search("  elazig ") == hit
+        get.assert_called_once()
+        assert json.loads(cache_file.read_text(encoding="utf-8")) == {"1:elazig": hit}
+
+    def test_cache_survives_reload(self, nominatim):
+        cache_file, _ = nominatim
+        cache_file.write_text(json.dumps({"1:ankara": [{"display_name": "Ankara"}]}))
+        with patch.object(setup_mod, "_nominatim_get") as get:
+            assert setup_mod._nominatim_search("Ankara")[0]["display_name"] == "Ankara"
+        get.assert_not_called()
+
+    def test_limit_in_path_and_cache_key(self, nominatim):
+        with patch.object(setup_mod, "_nominatim_get",
+                          side_effect=[_ok([1]), _ok([1, 2])]) as get:
+            assert setup_mod._nominatim_search("Rome") == [1]
+            assert setup_mod._nominatim_search("Rome", 5) == [1, 2]
+        paths = [c.args[0] for c in get.call_args_list]
+        assert "limit=1" in paths[0] and "limit=5" in paths[1]
+
+    def test_requests_are_spaced(self, nominatim):
+        _, sleeps = nominatim
+        with patch.object(setup_mod, "_nominatim_get", side_effect=[_ok([]), _ok([])]), \
+             patch("time.monotonic", side_effect=[100.0, 100.0, 100.2, 100.2]):
+            setup_mod._nominatim_search("a")
+            setup_mod._nominatim_search("b")
+        assert sleeps == [pytest.approx(0.8)]
+
+    def test_retries_on_429(self, nominatim):
+        _, sleeps = nominatim
+        with patch.object(setup_mod, "_nominatim_get",
+                          side_effect=[(429, b""), _ok([{"x": 1}])]):
+            assert setup_mod._nominatim_search("izmir") == [{"x": 1}]
+        assert sleeps  # backed off before retrying
+
+    def test_other_http_errors_propagate(self, nominatim):
+        with patch.object(setup_mod, "_nominatim_get", return_value=(400, b"")):
+            with pytest.raises(RuntimeError, match="HTTP 400"):
+                setup_mod._nominatim_search("bad")
+
+
+class TestNominatimConnection:
+    def _conn(self, *responses):
+        conn = MagicMock()
+        conn.getresponse.side_effect = list(responses)
+        return conn
+
+    def _resp(self, body=b"[]"):
+        resp = MagicMock(status=200)
+        resp.read.return_value = body
+        return resp
+
+    def test_connection_reused_across_calls(self, nominatim):
+        conn = self._conn(self._resp(), self._resp())
+        with patch("http.client.HTTPSConnection", return_value=conn) as ctor:
+            setup_mod._nominatim_get("/search?q=a")
+            setup_mod._nominatim_get("/search?q=b")
+        ctor.assert_called_once()
+        assert conn.request.call_count == 2
+
+    def test_dropped_connection_reconnects(self, nominatim, monkeypatch):
+        stale = self._conn(http.client.RemoteDisconnected("closed"))
+        fresh = self._conn(self._resp(b"[1]"))
+        monkeypatch.setattr(setup_mod, "_nominatim_conn", stale)
+        with patch("http.client.HTTPSConnection", return_value=fresh):
+            assert setup_mod._nominatim_get("/search?q=a") == (200, b"[1]")
+        stale.close.assert_called_once()
+        assert setup_mod._nominatim_conn is fresh
+
+
+class TestSetupPlacesOffLoop:
+    def test_search_runs_in_worker_thread(self):
+        import inspect
+        src = inspect.getsource(setup_mod._setup_places)
+        assert "asyncio.to_thread(_nominatim_search" in src
+
+
+class TestSetupPlacesIpProbe:
+    def _run(self, existing, answers):
+        from unittest.mock import AsyncMock
+        loc = MagicMock(lat=38.6, lon=39.2, city="Elazig", display="Elazig", source="ip")
+        get = AsyncMock(return_value=loc)
+        fake_places = MagicMock()
+        fake_places.all_places.return_value = existing
+        inputs = iter(answers)
+        with patch("bantz.core.places.places", fake_places), \
+             patch("bantz.core.location.location_service.get", get), \
+             patch("builtins.input", side_effect=lambda _="": next(inputs)), \
+             patch.object(setup_mod, "_write_location_to_env"):
+            import asyncio
+            asyncio.run(setup_mod._setup_places())
+        return get
+
+    def test_first_run_probes_up_front(self):
+        assert self._run({}, [""]).await_count == 1
+
+    def test_adding_to_existing_places_skips_probe(self):
+        existing = {"dorm": {"label": "Dorm", "lat": 1.0, "lon": 2.0, "primary": True}}
+        assert self._run(existing, [""]).await_count == 0
+
+    def test_probe_runs_when_ip_option_chosen(self):
+        existing = {"dorm": {"label": "Dorm", "lat": 1.0, "lon": 2.0, "primary": True}}
+        get = self._run(existing, ["campus", "", "1", "n", ""])
+        assert get.await_count == 1
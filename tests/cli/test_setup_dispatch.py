@@ -0,0 +1,50 @@
+"""Tests for `bantz --setup <target>` dispatch (_handle_setup)."""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.mark.parametrize("target, wizard", [
+    ("onboarding", "_setup_onboarding"),
+    ("profile", "_setup_profile"),
+    ("schedule", "_setup_schedule"),
+    ("telegram", "_setup_telegram"),
+    ("gemini", "_setup_gemini"),
+    ("claude", "_setup_claude"),
+    ("openai", "_setup_openai"),
+    ("voice", "_setup_voice"),
+    ("systemd", "_setup_systemd"),
+])
+def test_target_dispatches_to_wizard(target, wizard):
+    from bantz.cli.setup import _handle_setup
+    with patch(f"bantz.cli.setup.{wizard}") as mock:
+        _handle_setup([target.upper()])
+    mock.assert_called_once_with()
+
+
+def test_google_passes_service():
+    from bantz.cli.setup import _handle_setup
+    with patch("bantz.auth.google_oauth.setup_google") as mock:
+        _handle_setup(["google", "Gmail"])
+    mock.assert_called_once_with("gmail")
+
+
+@pytest.mark.parametrize("parts", [[], ["bogus"], ["google"]])
+def test_unknown_or_incomplete_prints_help(parts, capsys):
+    from bantz.cli.setup import _handle_setup
+    _handle_setup(parts)
+    out = capsys.readouterr().out
+    assert "Unknown setup target" in out
+    assert "bantz --setup voice" in out
+
+
+def test_help_lists_every_target(capsys):
+    from bantz.cli.setup import _SETUP_DISPATCH, _print_setup_help
+    _print_setup_help(["bogus"])
+    out = capsys.readouterr().out
+    for target in _SETUP_DISPATCH:
+        assert f"bantz --setup {target}" in out
+    assert "bantz --setup google [gmail|classroom|calendar]" in out
+    assert "bantz --setup systemd --check" in out
@@ -0,0 +1,92 @@
+"""Tests for piped (non-TTY) answers to the profile and telegram wizards."""
+from __future__ import annotations
+
+import io
+from unittest.mock import MagicMock, patch
+
+
+from bantz.cli.setup import _asker, _piped_answers
+
+_NO_PROMPT = AssertionError("prompted on piped stdin")
+
+
+class TestPipedAnswers:
+    def test_key_value_lines_read_once(self):
+        stdin = io.StringIO("# answers\nName = Ada\n\nyear=2\nnot a pair\n")
+        with patch("sys.stdin", stdin):
+            assert _piped_answers() == {"name": "Ada", "year": "2"}
+
+    def test_tty_returns_none(self):
+        stdin = MagicMock()
+        stdin.isatty.return_value = True
+        with patch("sys.stdin", stdin):
+            assert _piped_answers() is None
+        stdin.read.assert_not_called()
+
+    def test_asker_missing_key_is_blank(self):
+        assert _asker({"a": "1"})("b", "B: ") == ""
+
+    def test_asker_tty_uses_input(self):
+        with patch("builtins.input", return_value="  x  ") as inp:
+            assert _asker(None)("a", "A: ") == "x"
+        inp.assert_called_once_with("A: ")
+
+
+class TestProfilePiped:
+    def test_profile_saved_from_piped_answers(self):
+        from bantz.cli.setup import _setup_profile
+        fake = MagicMock()
+        fake.is_configured.return_value = False
+        stdin = io.StringIO("name=Ada\nyear=3\nstyle=formal\nsections=2,1\n")
+        with patch("bantz.core.profile.profile", fake), \
+             patch("sys.stdin", stdin), \
+             patch("builtins.input", side_effect=_NO_PROMPT):
+            _setup_profile()
+        saved = fake.save.call_args.args[0]
+        assert saved["name"] == "Ada"
+        assert saved["year"] == 3
+        assert saved["tone"] == "formal"
+        assert saved["preferences"]["briefing_sections"] == ["weather", "schedule"]
+        assert saved["preferences"]["news_sources"] == ["hn", "google"]
+
+    def test_missing_name_cancels(self):
+        from bantz.cli.setup import _setup_profile
+        fake = MagicMock()
+        fake.is_configured.return_value = False
+        with patch("bantz.core.profile.profile", fake), \
+             patch("sys.stdin", io.StringIO("year=3\n")):
+            _setup_profile()
+        fake.save.assert_not_called()
+
+
+class TestTelegramPiped:
+    def test_env_written_from_piped_answers(self, tmp_path):
+        from bantz.cli.setup import _setup_telegram
+        stdin = io.StringIO("token=123:abc\nallowed_users=42\n")
+        with patch("sys.stdin", stdin), \
+             patch("builtins.input", side_effect=_NO_PROMPT), \
+             patch("pathlib.Path.cwd", return_value=tmp_path):
+            _setup_telegram()
+        text = (tmp_path / ".env").read_text(encoding="utf-8")
+        assert text == "TELEGRAM_BOT_TOKEN=123:abc\nTELEGRAM_ALLOWED_USERS=42\n"
+
+
+class TestPickNumbered:
+    def test_picks_in_given_order(self):
+        from bantz.cli.setup import _pick_numbered
+        assert _pick_numbered("3, 1", ["a", "b", "c"]) == ["c", "a"]
+
+    def test_blank_or_out_of_range_means_all(self):
+        from bantz.cli.setup import _pick_numbered
+        assert _pick_numbered("", ["a", "b"]) == ["a", "b"]
+        assert _pick_numbered("0,9,x", ["a", "b"]) == ["a", "b"]
+
+    def test_only_plain_comma_separated_numbers(self):
+        from bantz.cli.setup import _pick_numbered
+        assert _pick_numbered("1-3", ["a", "b", "c"]) == ["a", "b", "c"]
+        assert _pick_numbered("2, 1-3", ["a", "b", "c"]) == ["b"]
+        assert _pick_numbered("1 3", ["a", "b", "c"]) == ["a", "b", "c"]
+
+    def test_repeats_picked_once(self):
+        from bantz.cli.setup import _pick_numbered
+        assert _pick_numbered("2,2,1,2", ["a", "b", "c"]) == ["b", "a"]
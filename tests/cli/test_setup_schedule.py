@@ -0,0 +1,104 @@
+"""Tests for `bantz --setup schedule`.
+
+Covers:
+  - _parse_class_line() field extraction and defaults
+  - _parse_schedule_batch() day headers, comments, stray lines, time order
+  - _setup_schedule() piped (non-TTY) stdin path writes sorted schedule.json
+"""
+from __future__ import annotations
+
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+
+
+class TestParseClassLine:
+    def test_full_line(self):
+        from bantz.cli.setup import _parse_class_line
+        cls = _parse_class_line("10:00 Physics 60 Room B2")
+        assert cls == {"name": "Physics", "time": "10:00", "duration": 60,
+                       "location": "Room B2"}
+
+    def test_default_duration_no_location(self):
+        from bantz.cli.setup import _parse_class_line
+        assert _parse_class_line("09:00 Math") == {
+            "name": "Math", "time": "09:00", "duration": 90,
+        }
+
+    def test_non_numeric_duration_falls_back(self):
+        from bantz.cli.setup import _parse_class_line
+        cls = _parse_class_line("09:00 Math Lab-3")
+        assert cls["duration"] == 90
+        assert cls["location"] == "Lab-3"
+
+    def test_duration_glued_to_text_is_location(self):
+        from bantz.cli.setup import _parse_class_line
+        cls = _parse_class_line("09:00 Math 60min")
+        assert cls["duration"] == 90
+        assert cls["location"] == "60min"
+
+    def test_too_short(self):
+        from bantz.cli.setup import _parse_class_line
+        assert _parse_class_line("09:00") is None
+
+
+class TestParseScheduleBatch:
+    def test_headers_and_classes(self):
+        from bantz.cli.setup import _parse_schedule_batch
+        data: dict = {}
+        added = _parse_schedule_batch(
+            "# my week\n"
+            "Monday:\n"
+            "10:00 Physics 60 B2\n"
+            "\n"
+            "09:00 Math\n"
+            "wednesday:\n"
+            "13:30 Chemistry\n",
+            data,
+        )
+        assert added == 3
+        assert [c["name"] for c in data["monday"]] == ["Math", "Physics"]
+        assert data["wednesday"][0]["time"] == "13:30"
+
+    def test_lines_before_first_header_ignored(self):
+        from bantz.cli.setup import _parse_schedule_batch
+        data: dict = {}
+        assert _parse_schedule_batch("10:00 Orphan\nFriday:\nbad\n", data) == 0
+        assert data == {}
+
+    def test_inserts_into_existing_in_time_order(self):
+        from bantz.cli.setup import _parse_schedule_batch
+        data = {"monday": [{"name": "Old", "time": "08:00", "duration": 90},
+                           {"name": "Late", "time": "15:00", "duration": 90}]}
+        _parse_schedule_batch("Monday:\n11:00 New\n07:00 Early\n", data)
+        assert [c["name"] for c in data["monday"]] == ["Early", "Old", "New", "Late"]
+
+
+class TestSetupSchedulePiped:
+    @pytest.fixture
+    def schedule_path(self, tmp_path):
+        path = tmp_path / "schedule.json"
+        with patch("bantz.core.schedule.Schedule.setup_path", return_value=path):
+            yield path
+
+    def test_piped_stdin_writes_sorted_schedule(self, schedule_path):
+        from bantz.cli.setup import _setup_schedule
+        stdin = io.StringIO("Monday:\n14:00 Late\n08:30 Early 45\n")
+        with patch("sys.stdin", stdin), \
+             patch("builtins.input", side_effect=AssertionError("prompted")):
+            _setup_schedule()
+        data = json.loads(schedule_path.read_text(encoding="utf-8"))
+        assert [c["name"] for c in data["monday"]] == ["Early", "Late"]
+        assert data["monday"][0]["duration"] == 45
+
+    def test_existing_entries_kept_and_sorted(self, schedule_path):
+        from bantz.cli.setup import _setup_schedule
+        schedule_path.write_text(json.dumps(
+            {"tuesday": [{"name": "Mid", "time": "12:00", "duration": 90}]}
+        ), encoding="utf-8")
+        with patch("sys.stdin", io.StringIO("Tuesday:\n07:00 First\n")):
+            _setup_schedule()
+        data = json.loads(schedule_path.read_text(encoding="utf-8"))
+        assert [c["name"] for c in data["tuesday"]] == ["First", "Mid"]
@@ -71,6 +71,10 @@ class TestVoiceEnvPrefixesConstant:
         from bantz.cli.setup import _VOICE_ENV_PREFIXES
         assert "BANTZ_WAKE_WORD_ENABLED=" in _VOICE_ENV_PREFIXES
 
+    def test_keys_mirror_prefixes(self):
+        from bantz.cli.setup import _VOICE_ENV_KEYS, _VOICE_ENV_PREFIXES
+        assert _VOICE_ENV_KEYS == {p.rstrip("=") for p in _VOICE_ENV_PREFIXES}
+
 
 # ── _voice_test_mic ────────────────────────────────────────────────────────────
 
@@ -0,0 +1,26 @@
+"""Config.db_path — store.db migration and per-base-dir memoisation."""
+from unittest.mock import patch
+
+from bantz.config import Config
+
+
+class TestDbPath:
+    def test_migrates_legacy_store_db(self, tmp_path):
+        (tmp_path / "store.db").write_text("x")
+        cfg = Config(_env_file=None, BANTZ_DATA_DIR=str(tmp_path))
+        assert cfg.db_path == tmp_path / "bantz.db"
+        assert (tmp_path / "bantz.db").read_text() == "x"
+        assert not (tmp_path / "store.db").exists()
+
+    def test_filesystem_checked_once(self, tmp_path):
+        cfg = Config(_env_file=None, BANTZ_DATA_DIR=str(tmp_path))
+        with patch("pathlib.Path.exists", return_value=True) as exists:
+            first = cfg.db_path
+            assert cfg.db_path == first
+        assert exists.call_count == 1
+
+    def test_follows_data_dir_change(self, tmp_path):
+        cfg = Config(_env_file=None, BANTZ_DATA_DIR=str(tmp_path / "a"))
+        assert cfg.db_path.parent == tmp_path / "a"
+        cfg.data_dir = str(tmp_path / "b")
+        assert cfg.db_path == tmp_path / "b" / "bantz.db"
@@ -0,0 +1,117 @@
+"""Tests for bantz.core.event_loop — optional uvloop/winloop runner."""
+from __future__ import annotations
+
+import asyncio
+import sys
+import types
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture
+def fake_uvloop():
+    created: list[asyncio.AbstractEventLoop] = []
+
+    def new_event_loop():
+        loop = asyncio.SelectorEventLoop()
+        created.append(loop)
+        return loop
+
+    mod = types.ModuleType("uvloop")
+    mod.new_event_loop = new_event_loop
+    with patch.dict(sys.modules, {"uvloop": mod}):
+        yield created
+
+
+class TestLoopFactory:
+    def test_none_when_no_fast_loop_installed(self):
+        from bantz.core.event_loop import loop_factory
+        with patch.dict(sys.modules, {"uvloop": None, "winloop": None}):
+            assert loop_factory() is None
+
+    def test_prefers_uvloop(self, fake_uvloop):
+        from bantz.core.event_loop import loop_factory
+        assert loop_factory() is sys.modules["uvloop"].new_event_loop
+
+    def test_winloop_fallback(self):
+        from bantz.core.event_loop import loop_factory
+        mod = types.ModuleType("winloop")
+        mod.new_event_loop = asyncio.new_event_loop
+        with patch.dict(sys.modules, {"uvloop": None, "winloop": mod}):
+            assert loop_factory() is mod.new_event_loop
+
+    def test_disabled_by_config(self, fake_uvloop):
+        from bantz.config import config
+        from bantz.core.event_loop import loop_factory
+        with patch.object(config, "uvloop_enabled", False):
+            assert loop_factory() is None
+
+
+    def test_config_error_is_not_swallowed(self, fake_uvloop):
+        from bantz.config import config
+        from bantz.core.event_loop import loop_factory
+        with patch.object(type(config), "uvloop_enabled",
+                          property(lambda self: 1 / 0), create=True):
+            with pytest.raises(ZeroDivisionError):
+                loop_factory()
+
+
+class TestRun:
+    def test_returns_coroutine_result(self):
+        from bantz.core.event_loop import run
+
+        async def answer():
+            return 42
+
+        with patch.dict(sys.modules, {"uvloop": None, "winloop": None}):
+            assert run(answer()) == 42
+
+    def test_runs_on_fast_loop(self, fake_uvloop):
+        from bantz.core.event_loop import run
+
+        async def current():
+            return asyncio.get_running_loop()
+
+        loop = run(current())
+        assert fake_uvloop == [loop]
+        assert loop.is_closed()
+
+
+class TestLiveUIEntry:
+    def test_tui_runs_on_fast_loop(self, fake_uvloop):
+        from bantz.interface import live_ui
+        seen: list[asyncio.AbstractEventLoop] = []
+
+        class FakeUI:
+            async def run(self):
+                seen.append(asyncio.get_running_loop())
+
+        with patch.object(live_ui, "LiveUI", FakeUI):
+            live_ui.run()
+        assert fake_uvloop == seen
+
+
+class TestEagerTasks:
+    def test_noop_without_eager_factory(self):
+        from bantz.core.event_loop import enable_eager_tasks
+
+        async def go():
+            enabled = enable_eager_tasks()
+            return enabled, asyncio.get_running_loop().get_task_factory()
+
+        with patch.object(asyncio, "eager_task_factory", None, create=True):
+            assert asyncio.run(go()) == (False, None)
+
+    def test_installs_eager_factory(self):
+        from bantz.core.event_loop import enable_eager_tasks
+
+        def factory(loop, coro, **kwargs):
+            return asyncio.Task(coro, loop=loop, **kwargs)
+
+        async def go():
+            enabled = enable_eager_tasks()
+            return enabled, asyncio.get_running_loop().get_task_factory()
+
+        with patch.object(asyncio, "eager_task_factory", factory, create=True):
+            assert asyncio.run(go()) == (True, factory)
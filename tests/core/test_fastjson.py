@@ -0,0 +1,43 @@
+"""Tests for bantz.core.fastjson — optional orjson with a stdlib fallback."""
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from bantz.core import fastjson
+
+_DATA = {"dorm": {"label": "Yurt Elâzığ", "lat": 38.67, "lon": 39.22, "primary": True}}
+
+
+@pytest.fixture(params=["stdlib", "orjson"])
+def backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(fastjson, "orjson", None)
+    else:
+        monkeypatch.setattr(fastjson, "orjson", pytest.importorskip("orjson"))
+    return request.param
+
+
+class TestFastJson:
+    def test_roundtrip(self, backend):
+        assert fastjson.loads(fastjson.dumps(_DATA)) == _DATA
+
+    def test_indent_is_two_spaces_and_unescaped(self, backend):
+        text = fastjson.dumps(_DATA, indent=True)
+        assert text.splitlines()[1].startswith('  "dorm"')
+        assert "Elâzığ" in text
+        assert json.loads(text) == _DATA
+
+    def test_loads_bytes(self, backend):
+        assert fastjson.loads(b'[{"x": 1}]') == [{"x": 1}]
+
+    def test_decode_error_is_value_error(self, backend):
+        with pytest.raises(ValueError):
+            fastjson.loads("{not json")
+
+    def test_dumpb_matches_dumps(self, backend):
+        for indent in (False, True):
+            raw = fastjson.dumpb(_DATA, indent=indent)
+            assert isinstance(raw, bytes)
+            assert raw.decode("utf-8") == fastjson.dumps(_DATA, indent=indent)
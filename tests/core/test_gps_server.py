@@ -130,6 +130,20 @@ def test_save_location(gps_server, mock_paths):
     assert saved_data == data
     mock_places_mod.places.update_gps.assert_called_once_with(12.34, 56.78)
 
+def test_save_location_emits_stationary_prompt(gps_server, mock_paths):
+    places = sys.modules["bantz.core.places"].places
+    places.check_stationary.return_value = "What is this place?"
+    with patch("bantz.core.event_bus.bus.emit_threadsafe") as emit:
+        gps_server._save_location({"lat": 1.0, "lon": 2.0})
+    emit.assert_called_once_with("place_stationary", message="What is this place?")
+
+def test_save_location_quiet_when_not_stationary(gps_server, mock_paths):
+    places = sys.modules["bantz.core.places"].places
+    places.check_stationary.return_value = None
+    with patch("bantz.core.event_bus.bus.emit_threadsafe") as emit:
+        gps_server._save_location({"lat": 1.0, "lon": 2.0})
+    emit.assert_not_called()
+
 def test_latest_property_valid(gps_server):
     now_iso = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
     data = {"lat": 1.0, "lon": 2.0, "timestamp": now_iso}
@@ -0,0 +1,183 @@
+"""
+Tests for the `bantz` entry point dispatch in ``bantz.__main__.main``.
+
+The bare TUI launch and value-less flags are dispatched straight from
+``sys.argv``; argparse is only built when something actually needs parsing.
+"""
+from __future__ import annotations
+
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+
+class TestArgvFastPath:
+    def test_no_args_launches_tui_without_argparse(self):
+        from bantz.__main__ import main
+        run = MagicMock()
+        with patch.object(sys, "argv", ["bantz"]), \
+             patch("bantz.interface.live_ui.run", run), \
+             patch("bantz.__main__._build_parser") as build:
+            main()
+        run.assert_called_once()
+        build.assert_not_called()
+
+    def test_version_skips_argparse(self, capsys):
+        from bantz.__main__ import main
+        with patch.object(sys, "argv", ["bantz", "--version"]), \
+             patch("bantz.__main__._build_parser") as build:
+            main()
+        build.assert_not_called()
+        assert capsys.readouterr().out.startswith("bantz ")
+
+    def test_version_via_argparse_matches(self, capsys):
+        from bantz.__main__ import _build_parser, _version
+        with pytest.raises(SystemExit):
+            _build_parser().parse_args(["--version", "--doctor"])
+        assert capsys.readouterr().out.strip() == f"bantz {_version()}"
+
+    def test_doctor_skips_argparse(self):
+        from bantz.__main__ import main
+        doctor = AsyncMock()
+        with patch.object(sys, "argv", ["bantz", "--doctor"]), \
+             patch("bantz.__main__._doctor", doctor), \
+             patch("bantz.__main__._build_parser") as build:
+            main()
+        doctor.assert_awaited_once()
+        build.assert_not_called()
+
+    def test_doctor_no_cache_flag(self):
+        from bantz.__main__ import main
+        doctor = AsyncMock()
+        with patch.object(sys, "argv", ["bantz", "--doctor", "--no-cache"]), \
+             patch("bantz.__main__._doctor", doctor):
+            main()
+        doctor.assert_awaited_once_with(use_cache=False)
+
+    def test_once_skips_argparse(self):
+        from bantz.__main__ import main
+        once = AsyncMock()
+        with patch.object(sys, "argv", ["bantz", "--once", "what time is it"]), \
+             patch("bantz.__main__._once", once), \
+             patch("bantz.__main__._build_parser") as build:
+            main()
+        once.assert_awaited_once_with("what time is it")
+        build.assert_not_called()
+
+    def test_once_with_flag_like_value_uses_argparse(self):
+        from bantz.__main__ import main
+        once = AsyncMock()
+        with patch.object(sys, "argv", ["bantz", "--once", "--help"]), \
+             patch("bantz.__main__._once", once):
+            with pytest.raises(SystemExit):
+                main()
+        once.assert_not_awaited()
+
+    def test_setup_skips_argparse(self):
+        from bantz.__main__ import main
+        with patch.object(sys, "argv", ["bantz", "--setup", "google", "gmail"]), \
+             patch("bantz.__main__._handle_setup") as handle, \
+             patch("bantz.__main__._build_parser") as build:
+            main()
+        handle.assert_called_once_with(["google", "gmail"])
+        build.assert_not_called()
+
+    def test_setup_with_flag_uses_argparse(self):
+        from bantz.__main__ import main
+        with patch.object(sys, "argv", ["bantz", "--setup", "systemd", "--check"]), \
+             patch("bantz.__main__._handle_setup") as handle:
+            with pytest.raises(SystemExit):
+                main()
+        handle.assert_not_called()
+
+    def test_help_still_goes_through_argparse(self, capsys):
+        from bantz.__main__ import main
+        with patch.object(sys, "argv", ["bantz", "--help"]):
+            with pytest.raises(SystemExit):
+                main()
+        assert "--doctor" in capsys.readouterr().out
+
+    def test_doctor_with_extra_flags_uses_argparse(self):
+        from bantz.__main__ import main
+        with patch.object(sys, "argv", ["bantz", "--doctor", "--bogus"]):
+            with pytest.raises(SystemExit):
+                main()
+
+
+_SRC = str(Path(__file__).resolve().parent.parent.parent / "src")
+
+
+class TestNoEagerImports:
+    """Importing the entry point must not drag in heavy or setup-only modules."""
+
+    @pytest.mark.parametrize("module", [
+        "asyncio",
+        "bantz.cli.setup",
+        "bantz.core.schedule",
+        "bantz.tools.gmail",
+        "bantz.auth.google_oauth",
+        "bantz.llm.ollama",
+        "transformers",
+    ])
+    def test_importing_entry_point_does_not_load(self, module):
+        code = textwrap.dedent(f"""
+            import sys
+            sys.path.insert(0, {_SRC!r})
+            import bantz.__main__
+            sys.exit(1 if {module!r} in sys.modules else 0)
+        """)
+        proc = subprocess.run([sys.executable, "-c", code],
+                              capture_output=True, text=True, timeout=60)
+        assert proc.returncode == 0, proc.stderr or f"{module} imported eagerly"
+
+
+class TestSingleEntryPoint:
+    """The entry point ships as one module — no duplicated definitions."""
+
+    @pytest.mark.parametrize("rel", ["bantz/__main__.py", "bantz/cli/setup.py"])
+    def test_no_duplicate_top_level_definitions(self, rel):
+        import ast
+        from collections import Counter
+        tree = ast.parse(Path(_SRC, rel).read_text(encoding="utf-8"))
+        names = Counter(
+            node.name for node in tree.body
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+        )
+        dupes = sorted(n for n, c in names.items() if c > 1)
+        assert not dupes, f"{rel} defines {dupes} more than once"
+
+
+class TestOnceConfirm:
+    def _result(self):
+        from types import SimpleNamespace
+        return SimpleNamespace(
+            stream=None, response="Send it?", tool_used="gmail",
+            needs_confirm=True, pending_tool="gmail", pending_args={"to": "x"},
+        )
+
+    def _run(self, stdin_text, capsys):
+        import asyncio
+        import io
+        from unittest.mock import AsyncMock, MagicMock, patch
+        from bantz.__main__ import _once
+        tool = MagicMock()
+        tool.execute = AsyncMock(return_value=MagicMock(success=True, output="sent"))
+        with patch("bantz.core.brain.brain.process", AsyncMock(return_value=self._result())), \
+             patch("bantz.tools.registry.get", return_value=tool), \
+             patch("sys.stdin", io.StringIO(stdin_text)):
+            asyncio.run(_once("mail x"))
+        return tool, capsys.readouterr().out
+
+    def test_closed_stdin_cancels_instead_of_raising(self, capsys):
+        tool, out = self._run("", capsys)
+        tool.execute.assert_not_awaited()
+        assert "Cancelled." in out
+
+    def test_yes_executes_pending_tool(self, capsys):
+        tool, out = self._run("yes\n", capsys)
+        tool.execute.assert_awaited_once_with(to="x")
+        assert "sent" in out
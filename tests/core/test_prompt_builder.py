@@ -178,6 +178,17 @@ class TestBuildChatSystem:
         assert "Bantz" in result
         assert "1920s" in result
 
+    def test_static_rules_form_a_stable_prefix(self):
+        """Per-turn hints must not shift the persona/rules bytes (KV-cache reuse)."""
+        from bantz.core.prompt_builder import _CHAT_STATIC
+        a = build_chat_system(self._make_ctx(), {"prompt_hint": "Tuesday morning"})
+        b = build_chat_system(
+            self._make_ctx(graph_context="[graph] Carol", desktop_context="Active: vim"),
+            {"prompt_hint": "Friday night"},
+        )
+        assert a.startswith(_CHAT_STATIC) and b.startswith(_CHAT_STATIC)
+        assert "CRITICAL RULES" in _CHAT_STATIC and "{" not in _CHAT_STATIC
+
     def test_missing_prompt_hint_key_uses_empty(self):
         ctx = self._make_ctx()
         tc = {}  # no prompt_hint key
@@ -0,0 +1,50 @@
+"""Tests for Schedule's load-time class ordering."""
+from __future__ import annotations
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from bantz.core.schedule import Schedule
+
+# 2026-10-12 is a Monday
+_MONDAY_8AM = datetime(2026, 10, 12, 8, 0)
+
+
+def _schedule(data: dict) -> Schedule:
+    store = MagicMock()
+    store.load.return_value = data
+    sched = Schedule()
+    sched.bind_store(store)
+    return sched
+
+
+class TestLoadOrder:
+    def test_days_sorted_once_on_load(self):
+        sched = _schedule({"monday": [
+            {"name": "B", "time": "14:00"},
+            {"name": "A", "time": "09:00"},
+            {"name": "Untimed"},
+        ]})
+        assert [c["name"] for c in sched.today(_MONDAY_8AM)] == ["Untimed", "A", "B"]
+        assert [c["name"] for c in sched._data["monday"]] == ["Untimed", "A", "B"]
+
+    def test_today_returns_a_copy(self):
+        sched = _schedule({"monday": [{"name": "A", "time": "09:00"}]})
+        sched.today(_MONDAY_8AM).clear()
+        assert len(sched.today(_MONDAY_8AM)) == 1
+
+    def test_next_class_uses_earliest(self):
+        sched = _schedule({"monday": [
+            {"name": "Late", "time": "15:00"},
+            {"name": "Early", "time": "10:00"},
+        ]})
+        nxt = sched.next_class(_MONDAY_8AM)
+        assert nxt["name"] == "Early" and nxt["starts_in_minutes"] == 120
+
+    def test_week_lists_in_time_order(self):
+        sched = _schedule({"tuesday": [
+            {"name": "Z", "time": "16:00"},
+            {"name": "Y", "time": "08:30"},
+        ]})
+        week = sched.format_week(_MONDAY_8AM)
+        assert week.index("Y") < week.index("Z")
@@ -7,7 +7,7 @@ import stat
 
 import pytest
 
-from bantz.core.secure_io import secure_write_text
+from bantz.core.secure_io import secure_write_bytes, secure_write_text
 
 
 def _assert_owner_only(path) -> None:
@@ -44,3 +44,26 @@ def test_unicode_roundtrip(tmp_path):
     p = tmp_path / "u.json"
     secure_write_text(p, json.dumps({"city": "Elâzığ"}, ensure_ascii=False))
     assert json.loads(p.read_text())["city"] == "Elâzığ"
+
+
+def test_failed_write_keeps_old_contents(tmp_path, monkeypatch):
+    p = tmp_path / "places.json"
+    secure_write_text(p, "old")
+
+    def boom(*_a, **_k):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "fsync", boom)
+    with pytest.raises(OSError):
+        secure_write_text(p, "new")
+    assert p.read_text() == "old"
+    assert [f.name for f in tmp_path.iterdir()] == ["places.json"]
+
+
+def test_write_bytes_owner_only(tmp_path):
+    p = tmp_path / "schedule.json"
+    p.write_text("old")
+    os.chmod(p, 0o644)
+    secure_write_bytes(p, "Elâzığ".encode())
+    _assert_owner_only(p)
+    assert p.read_text(encoding="utf-8") == "Elâzığ"
@@ -0,0 +1,42 @@
+"""Tests for bantz.core.time_context — snapshot fields and the per-day date cache."""
+from __future__ import annotations
+
+from datetime import datetime
+from unittest.mock import patch
+
+from bantz.core.time_context import TimeContext
+
+
+def _at(ts: datetime):
+    fake = type("FakeDT", (datetime,), {"now": classmethod(lambda cls: ts)})
+    return patch("bantz.core.time_context.datetime", fake)
+
+
+class TestSnapshot:
+    def test_fields(self):
+        with _at(datetime(2026, 3, 2, 9, 5)):
+            snap = TimeContext().snapshot()
+        assert snap["segment"] == "morning"
+        assert snap["time_str"] == "09:05"
+        assert snap["date_str"] == "Monday, 02 March 2026"
+        assert snap["prompt_hint"] == "Current time: 09:05 (morning), Monday 02 March 2026."
+
+    def test_date_strings_follow_midnight(self):
+        tc = TimeContext()
+        with _at(datetime(2026, 3, 2, 23, 59)):
+            first = tc.snapshot()
+        with _at(datetime(2026, 3, 3, 0, 1)):
+            second = tc.snapshot()
+        assert first["date_str"].startswith("Monday")
+        assert second["date_str"] == "Tuesday, 03 March 2026"
+        assert second["prompt_hint"].endswith("Tuesday 03 March 2026.")
+
+    def test_date_formatted_once_per_day(self):
+        tc = TimeContext()
+        with _at(datetime(2026, 3, 2, 10, 0)):
+            tc.snapshot()
+        cached = tc._day
+        with _at(datetime(2026, 3, 2, 18, 30)):
+            snap = tc.snapshot()
+        assert tc._day is cached
+        assert snap["time_str"] == "18:30"
@@ -0,0 +1,37 @@
+"""Tests for the lazy ``bantz.interface`` front-end namespace."""
+from __future__ import annotations
+
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+_SRC = str(Path(__file__).resolve().parent.parent.parent / "src")
+
+
+class TestLazyInterface:
+    def test_package_import_pulls_no_frontend(self):
+        code = textwrap.dedent(f"""
+            import sys
+            sys.path.insert(0, {_SRC!r})
+            import bantz.interface as iface
+            assert "run" in dir(iface) and "BantzApp" in dir(iface)
+            heavy = [m for m in ("bantz.interface.live_ui", "rich.live", "textual")
+                     if m in sys.modules]
+            sys.exit(1 if heavy else 0)
+        """)
+        proc = subprocess.run([sys.executable, "-c", code],
+                              capture_output=True, text=True, timeout=60)
+        assert proc.returncode == 0, proc.stderr
+
+    def test_run_resolves_to_live_ui(self):
+        from bantz.interface import run
+        from bantz.interface.live_ui import run as live_run
+        assert run is live_run
+
+    def test_unknown_attribute_raises(self):
+        import bantz.interface as iface
+        with pytest.raises(AttributeError):
+            iface.no_such_frontend
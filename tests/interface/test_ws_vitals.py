@@ -0,0 +1,107 @@
+"""Vitals sampling in the WebSocket server."""
+from __future__ import annotations
+
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from bantz.interface import ws_server as mod
+
+
+async def test_start_primes_cpu_counter_before_vitals():
+    calls: list[str] = []
+    server = mod.WsBroadcastServer(port=0)
+
+    async def serve(*args, **kwargs):
+        calls.append("serve")
+        return MagicMock(close=MagicMock(), wait_closed=AsyncMock())
+
+    with patch.object(mod, "serve", serve), \
+         patch.object(mod.psutil, "cpu_percent",
+                      side_effect=lambda interval=None: calls.append("cpu") or 0.0), \
+         patch.object(mod.bus, "bind_loop"), patch.object(mod.bus, "on"), \
+         patch.object(server, "_vitals_loop", AsyncMock()), \
+         patch.object(server, "_log_queue_loop", AsyncMock()), \
+         patch.object(server, "_services_loop", AsyncMock()), \
+         patch.object(server, "_preload_translation", AsyncMock()):
+        await server.start()
+        await server.stop()
+    assert calls[:2] == ["cpu", "serve"]
+
+
+def test_nvml_initialised_once(monkeypatch):
+    fake = MagicMock()
+    fake.nvmlDeviceGetMemoryInfo.return_value = MagicMock(
+        used=2 * 1048576, total=8 * 1048576,
+    )
+    monkeypatch.setitem(sys.modules, "pynvml", fake)
+    monkeypatch.setattr(mod, "_NVML_HANDLE", None)
+    assert mod.nvml_memory() == (2.0, 8.0)
+    assert mod.nvml_memory() == (2.0, 8.0)
+    fake.nvmlInit.assert_called_once()
+    fake.nvmlDeviceGetHandleByIndex.assert_called_once_with(0)
+    assert fake.nvmlDeviceGetMemoryInfo.call_count == 2
+
+
+def test_nvml_failure_is_remembered(monkeypatch):
+    fake = MagicMock()
+    fake.nvmlInit.side_effect = RuntimeError("no driver")
+    monkeypatch.setitem(sys.modules, "pynvml", fake)
+    monkeypatch.setattr(mod, "_NVML_HANDLE", None)
+    assert mod.nvml_memory() is None
+    assert mod.nvml_memory() is None
+    fake.nvmlInit.assert_called_once()
+
+
+def test_disk_usage_read_once_per_minute(monkeypatch):
+    disk = MagicMock(return_value=MagicMock(used=100 * 1024 ** 3, total=500 * 1024 ** 3))
+    monkeypatch.setattr(mod.psutil, "disk_usage", disk)
+    monkeypatch.setattr(mod, "_DISK_CACHE", None)
+    clock = iter([1000.0, 1030.0, 1061.0])
+    monkeypatch.setattr(mod.time, "monotonic", lambda: next(clock))
+    assert mod._collect_disk() == (100.0, 500.0)
+    mod._collect_disk()
+    assert disk.call_count == 1
+    mod._collect_disk()
+    assert disk.call_count == 2
+
+
+def test_disk_interval_shared_with_tui(monkeypatch):
+    from bantz.core.types import DISK_INTERVAL
+    from bantz.interface import live_ui
+    assert mod.DISK_INTERVAL is DISK_INTERVAL is live_ui.DISK_INTERVAL
+    disk = MagicMock(return_value=MagicMock(used=0, total=1))
+    monkeypatch.setattr(mod.psutil, "disk_usage", disk)
+    monkeypatch.setattr(mod, "_DISK_CACHE", None)
+    monkeypatch.setattr(mod, "DISK_INTERVAL", 10.0)
+    clock = iter([1000.0, 1011.0])
+    monkeypatch.setattr(mod.time, "monotonic", lambda: next(clock))
+    mod._collect_disk()
+    mod._collect_disk()
+    assert disk.call_count == 2
+
+
+async def test_services_broadcast_only_on_change(monkeypatch):
+    import asyncio
+    from bantz.config import config
+
+    server = mod.WsBroadcastServer(port=0)
+    server._clients.add(MagicMock())
+    payloads = iter([
+        {"type": "services", "services": [{"name": "Ollama", "status": "online"}]},
+        {"type": "services", "services": [{"name": "Ollama", "status": "online"}]},
+        {"type": "services", "services": [{"name": "Ollama", "status": "offline"}]},
+    ])
+    monkeypatch.setattr(mod, "_collect_services", AsyncMock(side_effect=lambda: next(payloads)))
+    monkeypatch.setattr(config, "services_interval", 0.0)
+    sent: list[dict] = []
+    monkeypatch.setattr(server, "_broadcast", AsyncMock(side_effect=sent.append))
+
+    task = asyncio.create_task(server._services_loop())
+    for _ in range(10):
+        await asyncio.sleep(0)
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    assert [p["services"][0]["status"] for p in sent] == ["online", "offline"]
@@ -0,0 +1,48 @@
+"""Tests for the lazy ``bantz.tools.<name>`` submodule loader."""
+from __future__ import annotations
+
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+_SRC = str(Path(__file__).resolve().parent.parent.parent / "src")
+_TOOLS_DIR = Path(_SRC, "bantz", "tools")
+
+
+class TestKnownToolNames:
+    def test_matches_modules_on_disk(self):
+        from bantz.tools import known_tool_names
+        on_disk = {
+            p.stem for p in _TOOLS_DIR.glob("*.py")
+            if not p.stem.startswith("_") and p.stem != "contact_resolver"
+        }
+        assert set(known_tool_names()) == on_disk
+
+    def test_listing_does_not_import(self):
+        code = textwrap.dedent(f"""
+            import sys
+            sys.path.insert(0, {_SRC!r})
+            import bantz.tools as tools
+            names = tools.known_tool_names()
+            assert "shell" in names and "shell" in dir(tools)
+            sys.exit(1 if "bantz.tools.shell" in sys.modules else 0)
+        """)
+        proc = subprocess.run([sys.executable, "-c", code],
+                              capture_output=True, text=True, timeout=60)
+        assert proc.returncode == 0, proc.stderr
+
+
+class TestLazyAttribute:
+    def test_attribute_access_imports_and_registers(self):
+        import bantz.tools as tools
+        shell = tools.shell
+        assert shell is sys.modules["bantz.tools.shell"]
+        assert tools.registry.get("shell") is not None
+
+    def test_unknown_attribute_raises(self):
+        import bantz.tools as tools
+        with pytest.raises(AttributeError):
+            tools.no_such_tool
@@ -0,0 +1,40 @@
+"""Tests for the psutil-backed ``system`` metrics tool."""
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+
+class TestCpuSample:
+    async def test_cpu_sample_does_not_block_loop(self):
+        from bantz.tools.system import SystemTool
+
+        def slow_cpu(interval=None):
+            time.sleep(0.2)
+            return 12.0
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.02)
+
+        with patch("bantz.tools.system.psutil.cpu_percent", side_effect=slow_cpu):
+            t = asyncio.create_task(ticker())
+            result = await SystemTool().execute(metric="cpu")
+            t.cancel()
+        assert result.success and result.data["cpu_percent"] == 12.0
+        assert ticks >= 5  # the loop kept running during the sample
+
+    async def test_ram_only_skips_cpu_sample(self):
+        from bantz.tools.system import SystemTool
+        mem = SimpleNamespace(used=2 * 1024 ** 3, total=8 * 1024 ** 3, percent=25.0)
+        with patch("bantz.tools.system.psutil.cpu_percent") as cpu, \
+             patch("bantz.tools.system.psutil.virtual_memory", return_value=mem):
+            result = await SystemTool().execute(metric="ram")
+        cpu.assert_not_called()
+        assert result.data["ram_percent"] == 25.0
@@ -4,6 +4,10 @@ from __future__ import annotations
 import asyncio
 import inspect
 import logging
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
@@ -15,6 +19,7 @@ from bantz.interface.live_ui import (
     LiveUI,
     ServiceDot,
     _bar,
+    _window,
     _DOT_STYLE,
     _log_queue,
     _MouseReader,
@@ -89,6 +94,14 @@ class TestBar:
         result = _bar(100, width=5)
         assert "█" * 5 in result
 
+    def test_table_matches_direct_render(self):
+        from bantz.interface.live_ui import _render_bar
+        for v in (0, 0.4, 9.99, 10, 59.9, 60, 84.99, 85, 99.9, 100, 37.5):
+            assert _bar(v) == _render_bar(v, 10), v
+
+    def test_negative_clamped(self):
+        assert _bar(-5) == _bar(0)
+
 
 # ── Tests: ServiceDot ────────────────────────────────────────────────────────
 
@@ -127,6 +140,29 @@ class TestBuildLayout:
         assert layout["bottom"]["stats"] is not None
         assert layout["bottom"]["logs"] is not None
 
+    def test_frame_key_tracks_appends_past_maxlen(self, ui):
+        for i in range(ui.LOG_MAX):
+            ui.add_log("same line")
+        key = ui._frame_key()
+        ui.add_log("same line")
+        assert ui._frame_key() != key
+
+    @pytest.mark.asyncio
+    async def test_unchanged_frames_not_repainted(self, ui):
+        from unittest.mock import MagicMock
+        ui._live = MagicMock()
+        ui.REFRESH_FPS = 100
+        with patch.object(ui, "_clock", return_value="12:00:00"), \
+             patch.object(ui, "_update_panels"):
+            task = asyncio.create_task(ui._panel_updater(MagicMock()))
+            await asyncio.sleep(0.1)
+            assert ui._live.refresh.call_count == 1
+            ui.add_chat("user", "hi")
+            await asyncio.sleep(0.05)
+            ui._running = False
+            await task
+        assert ui._live.refresh.call_count == 2
+
 
 # ── Tests: Add chat / log ────────────────────────────────────────────────────
 
@@ -206,6 +242,19 @@ class TestScrolling:
         assert ui._chat_scroll_offset <= len(ui._chat_lines) - 1
 
 
+class TestClock:
+    def test_formats_once_per_second(self, ui):
+        with patch("bantz.interface.live_ui.time.time", side_effect=[100.1, 100.7, 101.2]), \
+             patch("bantz.interface.live_ui.datetime") as dt:
+            dt.fromtimestamp.return_value.strftime.side_effect = ["a", "b"]
+            assert [ui._clock(), ui._clock(), ui._clock()] == ["a", "a", "b"]
+        assert dt.fromtimestamp.call_count == 2
+
+    def test_matches_wall_clock_format(self, ui):
+        import re
+        assert re.fullmatch(r"\d\d:\d\d:\d\d", ui._clock())
+
+
 # ── Tests: Render panels ────────────────────────────────────────────────────
 
 class TestRenderHeader:
@@ -218,6 +267,15 @@ class TestRenderHeader:
         panel = ui._render_header()
         assert isinstance(panel, Panel)
 
+    def test_reused_within_the_same_second(self, ui):
+        with patch.object(ui, "_clock", return_value="12:00:00"):
+            first = ui._render_header()
+            assert ui._render_header() is first
+            ui._memory_count = 7
+            assert ui._render_header() is not first
+        with patch.object(ui, "_clock", return_value="12:00:01"):
+            assert "12:00:01" in ui._render_header().renderable.markup
+
 
 class TestRenderStats:
     def test_returns_panel(self, ui):
@@ -243,6 +301,70 @@ class TestRenderStats:
         panel = ui._render_stats()
         assert isinstance(panel, Panel)
 
+    def test_panel_reused_until_a_sample_changes(self, ui):
+        first = ui._render_stats()
+        assert ui._render_stats() is first
+        ui._cpu = 12.0
+        second = ui._render_stats()
+        assert second is not first
+        assert "12%" in second.renderable.plain
+
+
+class TestWindow:
+    def _old(self, lines, offset, count):
+        lines = list(lines)
+        if offset > 0 and lines:
+            end = max(0, len(lines) - offset)
+            return lines[max(0, end - count):end]
+        return lines[-count:]
+
+    def test_matches_list_slicing(self):
+        from collections import deque
+        for n in (0, 1, 5, 15, 40):
+            dq = deque(range(n), maxlen=200)
+            for offset in (0, 1, 3, 14, 15, 39, 60):
+                for count in (1, 4, 15):
+                    assert _window(dq, offset, count) == self._old(dq, offset, count)
+
+
+class TestRenderCache:
+    def test_chat_block_parsed_once(self):
+        from bantz.interface.live_ui import _chat_block
+        msg = "x" * 200  # long → Markdown
+        first = _chat_block("bantz", msg)
+        assert first is _chat_block("bantz", msg)
+        assert len(first) == 2
+
+    def test_repaint_does_not_reparse(self, ui):
+        ui.add_chat("user", "hello [b]there[/b]")
+        ui.add_log("[green]ok[/]")
+        ui._render_chat()
+        ui._render_logs()
+        with patch("bantz.interface.live_ui.Text.from_markup") as parse:
+            ui._render_chat()
+            ui._render_logs()
+        parse.assert_not_called()
+
+    def test_log_panel_reused_until_new_line_or_scroll(self, ui):
+        ui.add_log("one")
+        first = ui._render_logs()
+        assert ui._render_logs() is first
+        ui.add_log("two")
+        second = ui._render_logs()
+        assert second is not first
+        assert second.renderable.plain.endswith("two\n")
+        ui._scroll_offset = 1
+        assert "two" not in ui._render_logs().renderable.plain
+
+    def test_user_text_is_escaped(self):
+        from bantz.interface.live_ui import _chat_block
+        (text,) = _chat_block("user", "[red]not markup[/red]")
+        assert "[red]not markup[/red]" in text.plain
+
+    def test_bad_log_markup_falls_back(self):
+        from bantz.interface.live_ui import _log_text
+        assert _log_text("[/oops]").plain == "[/oops]"
+
 
 class TestRenderLogs:
     def test_empty_logs(self, ui):
@@ -416,6 +538,21 @@ class TestLogConsumer:
             pass
         assert any("hello from queue" in line for line in ui._log_lines)
 
+    @pytest.mark.asyncio
+    async def test_burst_drained_without_timers(self):
+        ui = LiveUI()
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        for i in range(3):
+            queue.put_nowait(f"burst {i}")
+        with patch("bantz.interface.live_ui._log_queue", queue), \
+             patch("asyncio.wait_for", side_effect=AssertionError("timer")):
+            task = asyncio.create_task(ui._log_consumer())
+            await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        assert [line.split()[-1] for line in list(ui._log_lines)[-3:]] == ["0", "1", "2"]
+
 
 # ── Tests: Stats collector ───────────────────────────────────────────────────
 
@@ -453,10 +590,55 @@ class TestStatsCollector:
         assert abs(ui._ram_total_gb - 16.0) < 0.1
         assert ui._disk_pct == 30.0
 
+    @pytest.mark.asyncio
+    @patch("bantz.interface.live_ui.psutil")
+    async def test_disk_polled_on_slow_interval(self, mock_psutil):
+        ui = LiveUI()
+        ui.STATS_INTERVAL = 0.01
+        with patch.object(ui, "_collect_vram"):
+            task = asyncio.create_task(ui._stats_collector())
+            await asyncio.sleep(0.1)
+            ui._running = False
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        assert mock_psutil.virtual_memory.call_count > 1
+        mock_psutil.disk_usage.assert_called_once_with("/")
+
+    @pytest.mark.asyncio
+    @patch("bantz.interface.live_ui.psutil")
+    async def test_paused_while_busy(self, mock_psutil):
+        ui = LiveUI()
+        ui._busy = True
+        with patch.object(ui, "_collect_vram") as vram:
+            task = asyncio.create_task(ui._stats_collector())
+            await asyncio.sleep(0.05)
+            ui._running = False
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        mock_psutil.virtual_memory.assert_not_called()
+        vram.assert_not_called()
+
+    @patch("bantz.interface.live_ui.psutil")
+    def test_cpu_counter_primed_on_init(self, mock_psutil):
+        LiveUI()
+        mock_psutil.cpu_percent.assert_called_once_with(interval=None)
+
 
 # ── Tests: VRAM collection ───────────────────────────────────────────────────
 
 class TestVRAM:
+    @pytest.fixture(autouse=True)
+    def _no_nvml(self):
+        # nvidia-smi path; NVML is covered separately below
+        with patch("bantz.interface.ws_server.nvml_memory", return_value=None):
+            yield
+
     @patch("bantz.interface.live_ui.subprocess")
     def test_vram_nvidia_smi_success(self, mock_sub, ui):
         mock_sub.run.return_value = SimpleNamespace(
@@ -474,6 +656,20 @@ class TestVRAM:
         ui._collect_vram()
         assert ui._vram_available is False
 
+    @patch("bantz.interface.live_ui.subprocess")
+    def test_missing_nvidia_smi_not_respawned(self, mock_sub, ui):
+        mock_sub.run.side_effect = FileNotFoundError
+        ui._collect_vram()
+        ui._collect_vram()
+        assert mock_sub.run.call_count == 1
+
+    @patch("bantz.interface.live_ui.subprocess")
+    def test_failed_run_still_retried(self, mock_sub, ui):
+        mock_sub.run.return_value = SimpleNamespace(returncode=1, stdout="")
+        ui._collect_vram()
+        ui._collect_vram()
+        assert mock_sub.run.call_count == 2
+
     @patch("bantz.interface.live_ui.subprocess")
     def test_vram_nvidia_smi_error(self, mock_sub, ui):
         mock_sub.run.return_value = SimpleNamespace(
@@ -482,6 +678,15 @@ class TestVRAM:
         ui._collect_vram()
         assert ui._vram_available is False
 
+    @patch("bantz.interface.live_ui.subprocess")
+    def test_nvml_skips_nvidia_smi(self, mock_sub, ui):
+        with patch("bantz.interface.ws_server.nvml_memory",
+                   return_value=(2000.0, 8000.0)):
+            ui._collect_vram()
+        mock_sub.run.assert_not_called()
+        assert ui._vram_available is True
+        assert abs(ui._vram_pct - 25.0) < 0.1
+
 
 # ── Tests: Event bus handlers ────────────────────────────────────────────────
 
@@ -501,6 +706,15 @@ class TestBusHandlers:
         ui._on_bus_voice_input(event)
         assert len(ui._chat_lines) == 0
 
+    @pytest.mark.asyncio
+    async def test_voice_input_claims_busy_before_task_runs(self, ui):
+        with patch.object(ui, "_process_input", new_callable=AsyncMock) as proc:
+            ui._on_bus_voice_input(Event(name="voice_input", data={"text": "one"}))
+            ui._on_bus_voice_input(Event(name="voice_input", data={"text": "two"}))
+            assert ui._busy is True
+            await ui._voice_task
+        proc.assert_awaited_once_with("one")
+
     def test_health_alert(self, ui):
         event = Event(name="health_alert", data={"title": "CPU hot"})
         ui._on_bus_health_alert(event)
@@ -560,6 +774,75 @@ class TestNoTextual:
                 )
 
 
+# ── Tests: brain stays out of the first frame ────────────────────────────────
+
+class TestBrainDeferred:
+    def test_first_frame_does_not_import_brain(self):
+        """Building and rendering the layout must not pull in the LLM stack."""
+        src = str(Path(__file__).resolve().parent.parent.parent / "src")
+        code = textwrap.dedent(f"""
+            import sys
+            sys.path.insert(0, {src!r})
+            from bantz.interface.live_ui import LiveUI
+            ui = LiveUI()
+            ui._update_panels(ui._build_layout())
+            sys.exit(1 if "bantz.core.brain" in sys.modules else 0)
+        """)
+        proc = subprocess.run([sys.executable, "-c", code],
+                              capture_output=True, text=True, timeout=60)
+        assert proc.returncode == 0, proc.stderr
+
+    def test_brain_imported_inside_handlers(self):
+        for fn in (LiveUI._process_input, LiveUI._handle_confirm):
+            assert "from bantz.core.brain import brain" in inspect.getsource(fn)
+
+
+class TestHandleConfirm:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("reply", ["nope", "", "yess"])
+    async def test_other_replies_cancel(self, ui, reply):
+        ui._pending = SimpleNamespace(pending_tool="gmail", pending_args={"to": "x"})
+        await ui._handle_confirm(reply)
+        assert ui._chat_lines[-1] == ("system", "Cancelled.")
+        assert ui._pending is None
+
+    @pytest.mark.asyncio
+    async def test_declined_by_voice_clears_busy(self, ui):
+        ui._layout = ui._build_layout()
+        ui._pending = SimpleNamespace(pending_tool="gmail", pending_args={"to": "x"})
+        ui._on_bus_voice_input(Event(name="voice_input", data={"text": "nope"}))
+        assert ui._busy is True
+        await ui._voice_task
+        assert ui._chat_lines[-1] == ("system", "Cancelled.")
+        assert ui._busy is False
+        # later voice input is accepted again
+        with patch.object(ui, "_process_input", new_callable=AsyncMock) as proc:
+            ui._on_bus_voice_input(Event(name="voice_input", data={"text": "hi"}))
+            await ui._voice_task
+        proc.assert_awaited_once_with("hi")
+
+    @pytest.mark.asyncio
+    async def test_cancelled_voice_request_clears_busy(self, ui):
+        ui._layout = ui._build_layout()
+        started = asyncio.Event()
+
+        async def hang(text):
+            started.set()
+            await asyncio.Event().wait()
+
+        with patch("bantz.core.brain.brain") as brain:
+            brain.process = hang
+            ui._on_bus_voice_input(Event(name="voice_input", data={"text": "long"}))
+            await started.wait()
+            ui._voice_task.cancel()
+            await asyncio.wait({ui._voice_task})
+        assert ui._busy is False
+
+    def test_confirm_words_cover_both_languages(self):
+        from bantz.core.types import CONFIRM_WORDS
+        assert {"yes", "y", "ok", "evet", "e", "tamam"} == CONFIRM_WORDS
+
+
 # ── Tests: SGR regex ─────────────────────────────────────────────────────────
 
 class TestSGRRegex:
@@ -577,6 +860,48 @@ class TestSGRRegex:
         assert m is None
 
 
+# ── Tests: streaming repaint throttle ────────────────────────────────────────
+
+class TestStreamThrottle:
+    @pytest.mark.asyncio
+    async def test_token_burst_repaints_once_per_frame(self, ui):
+        async def burst():
+            for tok in ["a"] * 50:
+                yield tok
+
+        result = SimpleNamespace(stream=burst(), tool_used=None)
+        ui._layout = ui._build_layout()
+        with patch("bantz.core.brain.brain.process", AsyncMock(return_value=result)), \
+             patch("bantz.core.brain.brain._graph_store", AsyncMock()), \
+             patch("bantz.core.memory.memory.add"), \
+             patch("bantz.interface.live_ui.time.monotonic", return_value=100.0), \
+             patch.object(ui, "_refresh_now") as refresh:
+            await ui._process_input("hi")
+        assert refresh.call_count == 1
+        assert ui._chat_lines[-1] == ("bantz", "a" * 50)
+
+    @pytest.mark.asyncio
+    async def test_tokens_between_frames_are_folded_in_once(self, ui):
+        seen = []
+
+        async def burst():
+            for tok in ["x", "y", "z"]:
+                seen.append(ui._streaming_text)
+                yield tok
+
+        result = SimpleNamespace(stream=burst(), tool_used=None)
+        ui._layout = ui._build_layout()
+        with patch("bantz.core.brain.brain.process", AsyncMock(return_value=result)), \
+             patch("bantz.core.brain.brain._graph_store", AsyncMock()), \
+             patch("bantz.core.memory.memory.add"), \
+             patch("bantz.interface.live_ui.time.monotonic", return_value=100.0), \
+             patch.object(ui, "_refresh_now"):
+            await ui._process_input("hi")
+        # Only the first token was painted; the rest land in the final message.
+        assert seen == [None, "x", "x"]
+        assert ui._chat_lines[-1] == ("bantz", "xyz")
+
+
 # ── Tests: LiveUI defaults ───────────────────────────────────────────────────
 
 class TestDefaults:
@@ -589,6 +914,9 @@ class TestDefaults:
     def test_log_max(self, ui):
         assert ui.LOG_MAX == 200
 
+    def test_stream_fps_above_refresh_fps(self, ui):
+        assert ui.STREAM_FPS > ui.REFRESH_FPS
+
     def test_initial_services(self, ui):
         for name, status in ui._services.items():
             assert status == ServiceDot.UNCONFIGURED
@@ -672,6 +1000,29 @@ class TestServiceStatusBar:
         assert panel.height == 5
 
 
+class TestStartup:
+    @pytest.mark.asyncio
+    async def test_one_failure_does_not_stop_the_rest(self):
+        ui = LiveUI()
+        names = ("_probe_services", "_warm_ollama", "_enrich_greeting",
+                 "_start_ws", "_start_ambient_sampler")
+        mocks = {n: AsyncMock() for n in names}
+        mocks["_warm_ollama"].side_effect = RuntimeError("ollama down")
+        with patch.multiple(ui, **mocks):
+            await ui._startup()
+        for m in mocks.values():
+            m.assert_awaited_once()
+
+    def test_ollama_probe_uses_shared_client(self):
+        src = inspect.getsource(LiveUI._probe_services)
+        assert "ollama.client.get(" in src
+        assert "def check_ollama()" in src
+
+    def test_run_tracks_startup_task(self):
+        src = inspect.getsource(LiveUI.run)
+        assert "asyncio.create_task(self._startup())," in src
+
+
 class TestServicePollerAndUpdater:
     """#437 — background tasks for re-probing services + status info."""
 
@@ -716,3 +1067,21 @@ class TestServicePollerAndUpdater:
                 pass
         # As long as it doesn't raise, the test passes
         assert True
+
+    @pytest.mark.asyncio
+    async def test_memory_stats_read_off_the_loop(self):
+        import threading
+        ui = LiveUI()
+        seen: list[bool] = []
+
+        def stats():
+            seen.append(threading.current_thread() is threading.main_thread())
+            ui._running = False
+            return {"total_conversations": 7}
+
+        with patch("bantz.core.memory.memory") as mock_mem, \
+             patch("bantz.interface.live_ui.asyncio.sleep", AsyncMock()):
+            mock_mem.stats.side_effect = stats
+            await asyncio.wait_for(ui._status_updater(), timeout=2.0)
+        assert seen == [False]
+        assert ui._memory_count == 7